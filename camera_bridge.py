@@ -0,0 +1,260 @@
+"""
+ESP32-CAM Stream Reader / Bridge
+================================
+
+This module reads the ESP32-CAM's MJPEG stream over HTTP and delivers
+decoded frames through the global `dispatch` dispatcher, the camera
+counterpart of `serial_bridge.SerialTelemetryReader`.
+
+Wire format:
+ - The stock ESP32-CAM web server streams `multipart/x-mixed-replace`
+   JPEG parts (by default at http://<camera-ip>:81/stream).
+ - Frames are cut from the byte stream at the JPEG start/end markers
+   (FF D8 ... FF D9), so part headers and boundaries need no parsing.
+
+Threading:
+ - Network reads and JPEG decoding run in a worker object living in a
+   dedicated `QThread`; the GUI thread never waits on the socket or on
+   the decoder.
+ - Decoded `QImage`s are handed over with `dispatch.emit_frame()`, which
+   keeps at most one undelivered frame queued, so a slow paint drops
+   stale frames instead of falling behind. Only `QPixmap.fromImage` and
+   the repaint run on the GUI thread.
+ - Optional bandwidth saver: with `grayscale=True` frames are converted to
+   `Format_Grayscale8` in the worker (1 byte/px instead of 4), shrinking
+   everything downstream: the queued frame, the pixmap and the snapshot.
+
+Usage (simple):
+    from camera_bridge import CameraStreamReader
+
+    reader = CameraStreamReader('http://192.168.4.1:81/stream')
+    reader.start()      # frames arrive on dispatch.frameReady
+    reader.stop()
+
+    # Or let the ESP32-CAM window start/stop it:
+    #   DASHBOARD_CAMERA_URL=http://192.168.4.1:81/stream python dashboard.py
+    #   (add DASHBOARD_CAMERA_GRAYSCALE=1 for the bandwidth saver)
+
+"""
+
+from __future__ import annotations
+import http.client
+import socket
+from typing import Optional
+from urllib.parse import urlsplit
+
+from PyQt6.QtCore import QObject, QThread, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
+
+try:
+    from dispatcher import dispatch
+except ImportError:
+    from dashboardGUI.dispatcher import dispatch
+
+
+_SOI = b"\xff\xd8"
+_EOI = b"\xff\xd9"
+
+
+# ============================================================================
+# === WORKER (runs in QThread) ===
+# ============================================================================
+
+class CameraStreamWorker(QObject):
+    """
+    MJPEG stream reader that lives in its own QThread.
+
+    Reads the HTTP response in chunks, cuts complete JPEG frames out of
+    the buffer and decodes them to `QImage` in this thread. Only the
+    newest complete frame of a chunk is decoded; older ones would be
+    superseded before they could be painted anyway.
+
+    Signals:
+        error(str): Stream could not be opened or was lost
+    """
+
+    error = pyqtSignal(str)
+
+    # Bytes per socket read; a QVGA JPEG is typically 5-15 KB
+    READ_CHUNK = 16384
+    # Drop the buffer if no frame end shows up within this many bytes
+    MAX_BUFFER = 1 << 20
+
+    def __init__(self, url: str, timeout: float = 5.0, grayscale: bool = False):
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.grayscale = grayscale
+        self._stop = False
+        self._sock: Optional[socket.socket] = None
+
+    def stop(self) -> None:
+        """Request the read loop to exit; callable from any thread.
+
+        Shutting the socket down wakes a read blocked on a stalled stream
+        immediately (closing it would not), so the thread ends without
+        anyone waiting on it.
+        """
+        self._stop = True
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # already closed by run()
+
+    def _open(self):
+        """Connect and send the GET; returns (connection, response)."""
+        parts = urlsplit(self.url)
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        conn.request("GET", path)
+        # Kept for stop(): the response reads from this socket
+        self._sock = conn.sock
+        if self._stop:
+            self.stop()  # stop() ran before the socket was known
+        response = conn.getresponse()
+        if response.status != 200:
+            conn.close()
+            raise OSError(f"HTTP {response.status} {response.reason}")
+        return conn, response
+
+    def run(self) -> None:
+        """Open the stream and decode frames until stopped."""
+        if self._stop:
+            self._finish()  # stopped before the thread got here
+            return
+        try:
+            conn, stream = self._open()
+        except Exception as e:
+            if not self._stop:
+                self.error.emit(f"Cannot open camera stream {self.url}: {e}")
+            self._finish()
+            return
+
+        buffer = b""
+        try:
+            while not self._stop:
+                try:
+                    chunk = stream.read1(self.READ_CHUNK)
+                except Exception as e:
+                    if not self._stop:
+                        self.error.emit(f"Camera stream read failed: {e}")
+                    break
+                if not chunk:
+                    if not self._stop:
+                        self.error.emit("Camera stream closed by the device")
+                    break
+                buffer += chunk
+                jpeg, buffer = self._last_frame(buffer)
+                if jpeg is not None:
+                    image = QImage.fromData(jpeg, "JPEG")
+                    if not image.isNull():
+                        if self.grayscale:
+                            image.convertTo(QImage.Format.Format_Grayscale8)
+                        dispatch.emit_frame(image)
+                elif len(buffer) > self.MAX_BUFFER:
+                    buffer = b""  # lost sync; wait for the next SOI
+        finally:
+            for closable in (stream, conn):
+                try:
+                    closable.close()
+                except Exception:
+                    pass
+            self._finish()
+
+    def _finish(self) -> None:
+        """End the worker thread's event loop."""
+        thread = self.thread()
+        if thread is not None:
+            thread.quit()
+
+    @staticmethod
+    def _last_frame(buffer: bytes):
+        """
+        Return ``(newest_complete_jpeg_or_None, remaining_buffer)``.
+
+        Everything up to the last end marker is consumed; bytes after it
+        (the start of the next frame) are kept for the next read.
+        """
+        end = buffer.rfind(_EOI)
+        if end < 0:
+            return None, buffer
+        start = buffer.rfind(_SOI, 0, end)
+        rest = buffer[end + 2:]
+        if start < 0:
+            return None, rest
+        return buffer[start:end + 2], rest
+
+
+# ============================================================================
+# === DATA SOURCE (lives in GUI thread) ===
+# ============================================================================
+
+class CameraStreamReader(QObject):
+    """
+    Camera frame source owning the worker thread.
+
+    `start()`/`stop()` mirror `SerialTelemetryReader`, so it can be driven
+    the same way (the ESP32-CAM window starts it on open and stops it on
+    close).
+    """
+
+    def __init__(self, url: str, grayscale: bool = False, parent=None):
+        super().__init__(parent)
+        self.url = url
+        self.grayscale = grayscale
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[CameraStreamWorker] = None
+
+    def start(self) -> None:
+        """Open the stream in a worker thread and begin decoding."""
+        if self._thread is not None:
+            # Running, or a stop() whose read has not returned yet; a second
+            # worker would read the same stream alongside it
+            if self._worker is not None and self._worker._stop:
+                print("⚠️  Camera stream reader is still stopping; not restarted")
+            return
+
+        self._thread = QThread(self)
+        self._worker = CameraStreamWorker(self.url, grayscale=self.grayscale)
+        self._worker.moveToThread(self._thread)
+
+        # Explicit queued delivery: errors are raised in the worker thread
+        self._worker.error.connect(self._on_error, Qt.ConnectionType.QueuedConnection)
+        self._thread.started.connect(self._worker.run)
+        # Release both objects only once the thread has really ended
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._on_thread_finished, Qt.ConnectionType.QueuedConnection)
+        self._thread.start()
+        print(f"✓ Camera stream reader started on {self.url}")
+
+    def stop(self) -> None:
+        """Ask the worker to stop; returns without waiting.
+
+        The handles are kept until the thread's `finished` arrives
+        (_on_thread_finished), so `start()` cannot run a second worker next
+        to one that is still winding down.
+        """
+        if self._worker is not None:
+            self._worker.stop()
+
+    def _on_thread_finished(self) -> None:
+        """Drop the handles of a finished worker thread and delete it."""
+        thread = self.sender()
+        if thread is self._thread:
+            self._thread = None
+            self._worker = None
+        if thread is not None:
+            thread.deleteLater()
+
+    def _on_error(self, message: str) -> None:
+        print(f"⚠️  {message}")
+
+
+__all__ = ["CameraStreamReader", "CameraStreamWorker"]
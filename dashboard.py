@@ -65,6 +65,11 @@ Package: dashboardGUI
 from __future__ import annotations
 import sys
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
+from collections import deque
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -74,7 +79,8 @@ from PyQt6.QtWidgets import (
     QAbstractItemView,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QEvent, Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QFont
 
 # ============================================================================
 # === IMPORTS: Utility Modules ===
@@ -84,18 +90,18 @@ from PyQt6.QtCore import Qt, QTimer
 # Supports both script execution and package installation
 try:
     # Try local imports first (when running as script: python dashboard.py)
-    from utils.ui_loader import load_ui_file, load_stylesheet
+    from utils.ui_loader import setup_ui, load_stylesheet
     from utils.widget_finder import WidgetFinder
 except ImportError:
     # Fall back to package imports (when installed: pip install dashboardGUI)
-    from dashboardGUI.utils.ui_loader import load_ui_file, load_stylesheet
+    from dashboardGUI.utils.ui_loader import setup_ui, load_stylesheet
     from dashboardGUI.utils.widget_finder import WidgetFinder
 
 # ============================================================================
 # === IMPORTS: Custom Widgets (Must import BEFORE loading .ui file) ===
 # ============================================================================
 
-# Custom widget classes MUST be imported before uic.loadUi() is called
+# Custom widget classes MUST be imported before the UI is built (loadUi or setupUi)
 # This ensures Qt Designer's promotion system can find the classes
 try:
     from widgets.charts import TrajectoryCharts
@@ -112,13 +118,46 @@ except ImportError:
 
 # Import data model and event system
 try:
-    from models import TelemetryTableModel
+    from models import TelemetryTableModel, TelemetryFilterProxy, TelemetryDelegate
     from dispatcher import dispatch
-    from metadata import TELEMETRY_FIELDS
+    from metadata import GPS_RTC_KEYS, SENSOR_INDICATOR_MAP
 except ImportError:
-    from dashboardGUI.models import TelemetryTableModel
+    from dashboardGUI.models import TelemetryTableModel, TelemetryFilterProxy, TelemetryDelegate
     from dashboardGUI.dispatcher import dispatch
-    from dashboardGUI.metadata import TELEMETRY_FIELDS
+    from dashboardGUI.metadata import GPS_RTC_KEYS, SENSOR_INDICATOR_MAP
+
+# Startup diagnostics go through logging instead of print so nothing is
+# written to stdout before the first paint. Debug messages are silent by
+# default; launch with DASHBOARD_DEBUG=1 to see them.
+log = logging.getLogger(__name__)
+
+# StatusLED states used by the sensor LED loops (shared by the tooltip
+# table, the diff cache and the setState calls)
+_LED_ON = 'on'
+_LED_FAULT = 'fault'
+_LED_OFF = 'off'
+
+# ESP32CamWindow class, imported on first use (see _import_esp32cam)
+_ESP32CamWindow = None
+
+
+def _import_esp32cam():
+    """
+    Return the ESP32CamWindow class, importing esp32cam_window on first call.
+
+    The camera window (and the live feed widget it pulls in) is not needed
+    to show the dashboard, so it stays out of the startup import chain. The
+    dashboard preloads it shortly after the first paint; later calls only
+    read the cached class.
+    """
+    global _ESP32CamWindow
+    if _ESP32CamWindow is None:
+        try:
+            from esp32cam_window import ESP32CamWindow
+        except ImportError:
+            from dashboardGUI.esp32cam_window import ESP32CamWindow
+        _ESP32CamWindow = ESP32CamWindow
+    return _ESP32CamWindow
 
 
 class BalloonSatDashboard(QMainWindow):
@@ -200,6 +239,9 @@ class BalloonSatDashboard(QMainWindow):
         widgets/*: For custom widget implementations
         esp32cam_window.py: For ESP32-CAM window implementation
     """
+
+    # Accepted objectNames for the optional ESP32-CAM button, in priority order
+    CAMERA_BUTTON_NAMES = ('cameraButton', 'btn_camera', 'btn_esp32cam', 'openCameraButton')
     
     def __init__(self):
         """
@@ -238,51 +280,80 @@ class BalloonSatDashboard(QMainWindow):
         # Placeholder for an attached data source object. Tests and external
         # code may set `window.data_source = ...` to provide telemetry.
         self.data_source = None
+        # Light mode is read before the UI is built: TrajectoryCharts reads
+        # the same variable in its constructor (see _initialize_ui_state)
+        self._light_mode = os.getenv("DASHBOARD_LIGHT_MODE", "").lower() in ("1", "true", "yes", "on")
         
-        # === Step 2: Load UI from Qt Designer file ===
-        # This creates all widgets, layouts, and basic connections defined in Designer
-        load_ui_file(self, "dashboard.ui")
+        # === Step 2: Build UI from Qt Designer form ===
+        # Prefers the pyuic6-compiled ui_dashboard.py (no XML parse at
+        # startup); falls back to loading dashboard.ui at runtime.
+        # `self.ui` is the generated Ui_MainWindow, or None on fallback.
+        self.ui = setup_ui(self, "dashboard.ui", "ui_dashboard")
         
         # === Step 3: Set window properties ===
         self.setWindowTitle("🎈 BalloonSat Telemetry Dashboard")
+
+        # Debounced column sizing: an interactive drag fires many resize
+        # events; only the last one (after 50 ms of quiet) resizes tables.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(
+            self._resize_tables, Qt.ConnectionType.DirectConnection)
+        self._table_widths = {}  # table -> viewport width last applied
         
         # === Step 4: Find and store widget references ===
         # Uses WidgetFinder utility for organized widget access
+        # (also creates self.indicators, the IndicatorsManager that
+        # discovers all '*Indicator' widgets - constructed exactly once)
         self._find_all_widgets()
-
-        # === Create IndicatorsManager to control UI indicators ===
-        # This discovers all widgets named '*Indicator' and lets the
-        # dashboard set their state centrally using legacy or new labels.
-        try:
-            self.indicators = IndicatorsManager(self)
-        except Exception:
-            # Keep dashboard robust if manager fails for any reason
-            self.indicators = None
         
         # === Step 5: Setup data models ===
         # Connect TelemetryTableModel to both table views
         self._setup_models()
+
+        # === Step 5b: Update coalescing ===
+        # Incoming telemetry samples are queued here and drained by a single
+        # ~30 Hz timer, so a 200 Hz stream costs 30 model updates/paints per
+        # second instead of 200. maxlen bounds memory if the GUI stalls.
+        # Sensor status is a snapshot: only the latest one per tick is kept
+        # and applied by the same timer. The timer is a 33 ms single shot
+        # armed by the first arrival after a flush, so an idle dashboard
+        # (no data source running) takes no timer wakeups at all.
+        self._pending_telemetry = deque(maxlen=4096)
+        self._pending_sensors = None   # latest sensorStatusUpdated dict
+        self._pending_health = None    # latest (cpu, mem) tuple
+        self._last_health = None       # (cpu, mem) last written to gauges
+        self._pending_trajectory = deque(maxlen=4096)  # points since last tick
+        # Clear request since last tick; kept out of the bounded queue so
+        # a burst of points after it cannot evict it
+        self._pending_trajectory_clear = False
+        self._last_sample_keys = ()    # keys of the newest sample last flush
+        self._telemetry_flush_timer = QTimer(self)
+        self._telemetry_flush_timer.setSingleShot(True)
+        self._telemetry_flush_timer.setInterval(33)
+        self._telemetry_flush_timer.timeout.connect(
+            self._flush_pending, Qt.ConnectionType.DirectConnection)
+        # Computer health is last-one-wins at a human-visible rate: the
+        # first reading after an idle period arms a 100 ms single shot and
+        # readings arriving before it fires just replace the pending one,
+        # so the gauges repaint at most 10 times per second.
+        self._health_timer = QTimer(self)
+        self._health_timer.setSingleShot(True)
+        self._health_timer.setInterval(100)
+        self._health_timer.timeout.connect(
+            self._flush_health, Qt.ConnectionType.DirectConnection)
         
         # === Step 6: Connect signals ===
-        # Wire dispatcher signals to our update methods
+        # Buttons now; dispatcher wiring is deferred until after first paint
         self._connect_signals()
         
         # === Step 7: Initialize UI state ===
         # Set initial widget states, colors, labels, etc.
+        # (Start/Stop enabled states are set here on the widgets the finder
+        # resolved, which overrides any Designer defaults; the finder's
+        # index already covers every widget findChild() could return)
         self._initialize_ui_state()
-        # Safety: also set the actual QPushButton widgets directly to ensure
-        # the visible UI matches expected enabled states. This covers cases
-        # where WidgetFinder failed or Designer set different defaults.
-        try:
-            start_w = self.findChild(QPushButton, 'startButton')
-            stop_w = self.findChild(QPushButton, 'stopButton')
-            if start_w:
-                start_w.setEnabled(True)
-            if stop_w:
-                stop_w.setEnabled(False)
-        except Exception:
-            # Non-fatal: continue even if widgets not found
-            pass
     
     # ========================================================================
     # === INITIALIZATION METHODS ===
@@ -389,18 +460,18 @@ class BalloonSatDashboard(QMainWindow):
         # === Find tables as QTableView (NOT QTableWidget) ===
         # QTableView supports setModel() for Model-View architecture
         # QTableWidget does not (it's item-based, not model-based)
-        print("  Searching for QTableView widgets...")
+        log.debug("Searching for QTableView widgets...")
         # keep legacy object name but store under new attribute name
         self.previous_telemetry_table = finder.find_widget(QTableView, 'previousTelemetryTable')
         self.latest_readings_table = finder.find_widget(QTableView, 'latestReadingsTable')
         self.telemetry_track_table = finder.find_widget(QTableView, 'telemetryTrackTable')
         # Confirmation messages
         if self.previous_telemetry_table:
-            print("  ✓ Found telemetryTable (QTableView)")
+            log.debug("Found telemetryTable (QTableView)")
         if self.latest_readings_table:
-            print("  ✓ Found latestReadingsTable (QTableView)")
+            log.debug("Found latestReadingsTable (QTableView)")
         if self.telemetry_track_table:
-            print("  ✓ Found telemetryTrackTable (QTableView)")
+            log.debug("Found telemetryTrackTable (QTableView)")
         
         # === Find custom widgets (promoted in Qt Designer) ===
         # These MUST be imported before uic.loadUi() was called in __init__
@@ -411,41 +482,29 @@ class BalloonSatDashboard(QMainWindow):
         })
         
         # === Find sensor status LEDs (BalloonSat-specific) ===
-        # Maps sensor IDs from metadata.py to their UI indicator widgets
-        sensor_map = {
-            'bmp': 'bmp180Indicator',          # BMP280 pressure/altitude sensor (UI object uses bmp180Indicator)
-            'esp32': 'esp32Indicator',      # ESP32 microcontroller status
-            'mq131': 'mq131Indicator',      # MQ131 ozone sensor
-            'mpu': 'mpu6050Indicator',      # MPU6050 accelerometer/gyro
-            'gps': 'gpsIndicator',          # GPS module
-            'mq2': 'mq2Indicator',          # MQ2 flammable gas sensor
-            'dht22': 'dht22Indicator',      # DHT22 temperature/humidity sensor
-            'mq7': 'mq7Indicator',          # MQ7 carbon monoxide sensor
-            'rtc': 'rtcIndicator',          # DS1302 real-time clock
-            'max6675': 'max6675Indicator',
-            'lora' : 'loRaIndicator',
-            'bms' : 'bmsIndicator',
-        }
+        # Sensor IDs -> indicator objectNames come from metadata.SENSOR_INDICATOR_MAP
         # Instantiate IndicatorsManager once and use it as single source-of-truth
         try:
             self.indicators = IndicatorsManager(self)
-            # Build sensor_id -> widget mapping using the indicator object names
+            # Bind sensor_id -> widget in one pass over the static map; the
+            # finder is only consulted for names the manager did not find
+            by_name = self.indicators.indicators
             self.sensor_leds = {}
-            for sensor_id, obj_name in sensor_map.items():
-                w = self.indicators[obj_name]
+            for sensor_id, obj_name in SENSOR_INDICATOR_MAP:
+                w = by_name.get(obj_name)
+                if w is None:
+                    # fallback: O(1) lookup in the finder's objectName index
+                    # (one findChildren sweep shared by all lookups) instead
+                    # of a findChild tree walk per sensor
+                    w = finder.find_widget(StatusLED, obj_name, silent=True)
                 if w is not None:
                     self.sensor_leds[sensor_id] = w
                 else:
-                    # fallback: try to find the widget directly
-                    found = self.findChild(StatusLED, obj_name)
-                    if found is not None:
-                        self.sensor_leds[sensor_id] = found
-                    else:
-                        print(f"  ⚠️ Indicator widget not found for {sensor_id} -> {obj_name}")
+                    log.warning("Indicator widget not found for %s -> %s", sensor_id, obj_name)
         except Exception:
             # If manager fails, fall back to the finder (robust startup)
             self.indicators = None
-            self.sensor_leds = finder.find_sensor_indicators(StatusLED, sensor_map)
+            self.sensor_leds = finder.find_sensor_indicators(StatusLED, dict(SENSOR_INDICATOR_MAP))
         
         # === Store widget references for convenient access ===
         # Extract from finder dictionaries for easier access in methods
@@ -455,23 +514,51 @@ class BalloonSatDashboard(QMainWindow):
         # Fallbacks for common alternative object names (robustness)
         if not self.btn_start:
             for alt in ('btn_start', 'btnStart', 'start', 'start_button'):
-                w = self.findChild(QPushButton, alt)
+                w = finder.find_widget(QPushButton, alt, silent=True)
                 if w:
                     self.btn_start = w
                     break
         if not self.btn_stop:
             for alt in ('btn_stop', 'btnStop', 'stop', 'stop_button'):
-                w = self.findChild(QPushButton, alt)
+                w = finder.find_widget(QPushButton, alt, silent=True)
                 if w:
                     self.btn_stop = w
                     break
+        # Optional ESP32-CAM button: first of the accepted names present,
+        # resolved through the finder's objectName index (same tree walk
+        # as above) instead of one findChild() walk per candidate name
+        self.camera_btn = None
+        for btn_name in self.CAMERA_BUTTON_NAMES:
+            self.camera_btn = finder.find_widget(QPushButton, btn_name, silent=True)
+            if self.camera_btn:
+                break
         # Debugging output: report whether Start/Stop widgets were found
-        try:
-            print(f"WidgetFinder: btn_start found={bool(self.btn_start)}, btn_stop found={bool(self.btn_stop)}")
-        except Exception:
-            # Keep robust if print formatting fails
-            print("WidgetFinder: start/stop found?", bool(self.btn_start), bool(self.btn_stop))
-        
+        log.debug("WidgetFinder: btn_start found=%s, btn_stop found=%s",
+                  bool(self.btn_start), bool(self.btn_stop))
+        
+        # Per-sensor tooltip strings, built once instead of formatted on
+        # every status update: sensor_id -> {state: tooltip}. The LED loops
+        # only index this table with the _LED_* state constants.
+        self._sensor_tooltips = {
+            sensor_id: {
+                _LED_ON: f"{sensor_id}: OK",
+                _LED_FAULT: f"{sensor_id}: not working",
+                _LED_OFF: f"{sensor_id}: No data",
+            }
+            for sensor_id in self.sensor_leds
+        }
+        # Last state pushed to each LED by this window, and the last status
+        # payload applied as a frozenset of its items (see _update_sensors)
+        # (pre-seeded for every LED so the hot loop can index it directly)
+        self._last_sensor_state = dict.fromkeys(self.sensor_leds, '')
+        self._last_status_key = None
+        # Flat per-LED records for the _update_sensors hot loop, with the
+        # bound setState/setToolTip methods resolved once here
+        self._sensor_iter = tuple(
+            (sensor_id, led.setState, led.setToolTip, self._sensor_tooltips[sensor_id])
+            for sensor_id, led in self.sensor_leds.items()
+        )
+
         self.trajectory_charts = finder.custom_widgets.get('trajectoryChartsWidget')
         self.cpu_gauge = finder.custom_widgets.get('cpuGaugeWidget')
         self.mem_gauge = finder.custom_widgets.get('memGaugeWidget')
@@ -480,10 +567,11 @@ class BalloonSatDashboard(QMainWindow):
         """
         Setup table models and connect to table views.
         
-        Creates a single TelemetryTableModel instance and connects it to both
-        telemetry tables. Using one shared model ensures data synchronization
-        between the main table and the "latest readings" table - when the model
-        updates, both views automatically reflect the changes.
+        Creates one live TelemetryTableModel and shows subsets of it in the
+        "latest readings" and "track" tables through TelemetryFilterProxy
+        views. A second model holds the previous snapshot. Each telemetry
+        flush therefore updates two Python models, and Qt fans the changes
+        out to the filtered views.
         
         Model-View Architecture:
             • TelemetryTableModel: Stores and formats telemetry data (Model)
@@ -533,37 +621,40 @@ class BalloonSatDashboard(QMainWindow):
         # `previous_telemetry_table` so users can compare current vs last.
         self.previous_snapshot_model = TelemetryTableModel(fields=self.telemetry_model._fields)
 
-        # Latest readings model: all latest telemetry except GPS and RTC
-        latest_fields = [f for f in TELEMETRY_FIELDS if f.source_key not in ("gps_latlon", "alt_gps", "rtc_time")]
-        self.latest_model = TelemetryTableModel(fields=latest_fields)
+        # Latest readings and track tables are filtered views of the live
+        # model (no extra models to update per frame)
+
+        # Latest readings view: all latest telemetry except GPS and RTC
+        self.latest_model = TelemetryFilterProxy(GPS_RTC_KEYS, exclude=True, parent=self)
+        self.latest_model.setSourceModel(self.telemetry_model)
 
-        # Track model: small table showing GPS and RTC current values
-        track_fields = [f for f in TELEMETRY_FIELDS if f.source_key in ("gps_latlon", "alt_gps", "rtc_time")]
-        self.track_model = TelemetryTableModel(fields=track_fields)
+        # Track view: small table showing GPS and RTC current values
+        self.track_model = TelemetryFilterProxy(GPS_RTC_KEYS, parent=self)
+        self.track_model.setSourceModel(self.telemetry_model)
         
         # === Configure main telemetry table ===
         if self.previous_telemetry_table:
             # Show the snapshot of the immediately previous telemetry values
             self._configure_table(self.previous_telemetry_table, self.previous_snapshot_model)
-            print("  ✓ Configured telemetryTable model")
+            log.debug("Configured telemetryTable model")
         else:
-            print("  ⚠️  telemetryTable not found - skipping model setup")
+            log.warning("telemetryTable not found - skipping model setup")
         
         # === Configure latest readings table (same model = synchronized) ===
         if self.latest_readings_table:
             self._configure_table(self.latest_readings_table, self.latest_model)
-            print("  ✓ Configured latestReadingsTable model")
+            log.debug("Configured latestReadingsTable model")
         else:
-            print("  ⚠️  latestReadingsTable not found - skipping model setup")
+            log.warning("latestReadingsTable not found - skipping model setup")
 
         # Configure telemetryTrackTable (RTC + GPS)
         if self.telemetry_track_table:
             self._configure_table(self.telemetry_track_table, self.track_model)
-            print("  ✓ Configured telemetryTrackTable model")
+            log.debug("Configured telemetryTrackTable model")
         else:
-            print("  ⚠️  telemetryTrackTable not found - skipping track table setup")
+            log.warning("telemetryTrackTable not found - skipping track table setup")
         
-        print("✓ Table models configured")
+        log.debug("Table models configured")
     
     def _configure_table(self, table: QTableView, model):
         """
@@ -585,17 +676,25 @@ class BalloonSatDashboard(QMainWindow):
                 • Sets the data model (THIS IS THE KEY STEP)
                 • Model provides data via data() method
                 • Model updates trigger automatic view repaints
+                • TelemetryDelegate installed (single text fetch per cell)
             
             Header Configuration:
-                • Horizontal header: Last column stretches to fill space
-                • Vertical header: Hidden (no row numbers displayed)
+                • Horizontal header: Fixed columns, widths set by _resize_tables (3:2)
+                • Vertical header: Hidden, fixed row height (no re-measuring)
                 • This provides clean, compact appearance
             
             Visual Settings:
                 • Alternating row colors: Enabled for easier reading
+                • No word wrap, elide right: single-line cell layout
                 • Colors defined in dark.qss stylesheet
             
+            Signals:
+                • Table and header signals blocked and table updates
+                  disabled while configuring, then one updateGeometry()
+                  (single layout pass, no intermediate repaints)
+
             Interaction Settings:
+                • Sorting: Disabled (no re-sort on every update)
                 • Selection mode: None (display-only, no row selection)
                 • Edit triggers: None (read-only, no inline editing)
                 • These settings prevent user modification
@@ -604,7 +703,7 @@ class BalloonSatDashboard(QMainWindow):
             • Read-only: Telemetry data shouldn't be user-editable
             • No selection: Prevents accidental highlighting
             • Alternating colors: Improves readability of dense data
-            • Stretch last column: Ensures no empty space on right side
+            • Fixed 3:2 columns: No content measuring, no stretch recompute
         
         Example:
             >>> table = QTableView()
@@ -631,31 +730,67 @@ class BalloonSatDashboard(QMainWindow):
             models.TelemetryTableModel: The model class used
             _setup_models(): Where this method is called
         """
+        # === Batch the configuration ===
+        # Each setter below emits internal view/header signals (section
+        # resizes, geometry changes) that would each cascade into a layout
+        # pass. Block them for the whole block and ask for one geometry
+        # update at the end. Updates are disabled as well, so a table that
+        # is already visible (re-configured after startup) repaints once
+        # instead of after every setter. The table is normally not shown
+        # yet, so no visible state is skipped.
+        updates_enabled = table.updatesEnabled()
+        table.setUpdatesEnabled(False)
+        table_blocked = table.blockSignals(True)
+        header: QHeaderView = table.horizontalHeader()
+        vheader: QHeaderView = table.verticalHeader()
+        header_blocked = header.blockSignals(True)
+        vheader_blocked = vheader.blockSignals(True)
+        try:
+            self._apply_table_settings(table, model, header, vheader)
+        finally:
+            vheader.blockSignals(vheader_blocked)
+            header.blockSignals(header_blocked)
+            table.blockSignals(table_blocked)
+            table.setUpdatesEnabled(updates_enabled)
+        table.updateGeometry()
+
+    def _apply_table_settings(self, table: QTableView, model,
+                              header: QHeaderView, vheader: QHeaderView):
+        """Apply the settings documented in _configure_table (signals blocked)."""
         # === Set the model (establishes Model-View connection) ===
         table.setModel(model)
+        # One cellText() call per cell instead of one data() call per role
+        table.setItemDelegate(TelemetryDelegate(table))
+        # Rows are in metadata order; sorting would re-sort the view on
+        # every dataChanged. Keep it off explicitly, and never call
+        # resizeColumnsToContents/resizeRowsToContents on these tables -
+        # column widths come from the fixed 3:2 ratio in _resize_tables.
+        table.setSortingEnabled(False)
         
         # === Configure horizontal header ===
         # defining how the columns dimentions (Parameter/Value) should behave and appear.
         # Try to apply a 3:2 column ratio for the two-column (Parameter/Value) layout.
-        header: QHeaderView = table.horizontalHeader()
-        # Use interactive resize so we can set initial widths programmatically
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # Allows the user to manually drag and resize
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)  # Allows the user to manually drag and resize
+        # Fixed resize mode: widths are owned by _resize_tables (3:2 ratio),
+        # so Qt never measures cell contents to size columns. Set once here
+        # for all sections (no per-section index); programmatic
+        # setColumnWidth() still works in Fixed mode.
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         header.setStretchLastSection(False)  # Prevents the last column from automatically growing to fill any remaining space in the table.
-        # Set initial widths to approx 3:2 ratio using available table width
-        avail = table.viewport().width() or table.width() or 600
-        col0 = int(avail * 3 / 5)
-        col1 = max(80, avail - col0)
-        try:
-            table.setColumnWidth(0, col0)
-            table.setColumnWidth(1, col1)
-        except Exception:
-            # Some views may not allow sizing at this early stage; ignore
-            pass
+        # No column widths here: before the window is shown the viewport has
+        # no real width yet. showEvent() schedules _resize_tables once the
+        # first layout pass has run.
         
         # === Configure vertical header ===
         # Hide row numbers (cleaner appearance)
-        table.verticalHeader().setVisible(False)
+        vheader.setVisible(False)
+        # Fixed row heights: Qt never re-measures rows from content during
+        # paint (QTableView equivalent of setUniformRowHeights)
+        vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        # Explicit row height from the (stylesheet-applied) font: one text
+        # line plus padding. With Fixed mode this is the QTableView
+        # equivalent of setUniformRowHeights - no per-row sizeHint() calls.
+        table.ensurePolished()
+        vheader.setDefaultSectionSize(table.fontMetrics().height() + 8)
         
         # === Enable alternating row colors ===
         # Improves readability for dense data
@@ -673,6 +808,12 @@ class BalloonSatDashboard(QMainWindow):
         # the user scrolls vertically.
         table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
+        # Single-line, elided cells: with fixed column widths there is never
+        # a reason to lay text out over several lines, and eliding keeps the
+        # per-cell text-metrics work to one line width check.
+        table.setWordWrap(False)
+        table.setTextElideMode(Qt.TextElideMode.ElideRight)
         
         # === Make table read-only (display-only, no selection) ===
         # No selection: Users cannot select rows
@@ -684,8 +825,9 @@ class BalloonSatDashboard(QMainWindow):
     def _resize_tables(self):
         """
         Resize table columns to fill available width using a 3:2 ratio
-        (Parameter column : Value column). This is called on window resize
-        and once during initialization to avoid manual user resizing.
+        (Parameter column : Value column). This is called (debounced) on
+        window resize and once during initialization to avoid manual user
+        resizing. Tables whose viewport width is unchanged are skipped.
         """
         tables = [
             getattr(self, 'previous_telemetry_table', None),
@@ -697,16 +839,13 @@ class BalloonSatDashboard(QMainWindow):
             if not table:
                 continue
 
-            header = table.horizontalHeader()
-            # Allow programmatic column sizing
-            try:
-                header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
-                header.setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
-            except Exception:
-                pass
-
+            # Resize mode (Fixed) and scroll bar policy are set once in
+            # _configure_table; only the widths change here.
             # Compute available viewport width and apply 3:2 ratio
             avail = table.viewport().width() or table.width() or 600
+            if self._table_widths.get(table) == avail:
+                continue
+            self._table_widths[table] = avail
             col0 = int(avail * 3 / 5)
             col1 = max(80, avail - col0)
             try:
@@ -715,20 +854,57 @@ class BalloonSatDashboard(QMainWindow):
             except Exception:
                 pass
 
-            # Ensure no horizontal scroll bar appears
-            table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    def showEvent(self, event):
+        """
+        Size table columns once the window is shown.
+
+        Layouts are finalized after the event loop runs once, so the resize
+        is deferred with a zero-delay single shot; by then the table
+        viewports have their real widths. Later shows are cheap because
+        _resize_tables skips tables whose width is unchanged.
+
+        The first show also queues _connect_dispatcher() behind the resize,
+        so dispatcher wiring never delays the first paint. Data sources are
+        only started later by the Start button, so no emission is missed.
+        The ESP32-CAM window module is preloaded 500 ms later.
+        """
+        super().showEvent(event)
+        QTimer.singleShot(0, self._resize_tables)
+        if not getattr(self, "_dispatcher_connected", False):
+            QTimer.singleShot(0, self._connect_dispatcher)
+            # Warm the camera window import in an idle moment after the
+            # first paint, so the first button click does not stall on it
+            # (skipped when the button is absent or hidden in light mode)
+            if self.camera_btn and not self.camera_btn.isHidden():
+                QTimer.singleShot(500, _import_esp32cam)
 
     def resizeEvent(self, event):
         """
-        Recompute table column widths when the main window is resized.
+        Schedule a (debounced) column width update when the window resizes.
         """
-        try:
-            self._resize_tables()
-        except Exception:
-            pass
+        # Restarting a running single-shot timer resets its countdown, so
+        # only the last event of a drag triggers _resize_tables()
+        timer = getattr(self, "_resize_timer", None)
+        if timer is not None:
+            timer.start()
         # Call parent implementation
         return super().resizeEvent(event)
 
+    def changeEvent(self, event):
+        """
+        Catch up the trajectory chart when the window is restored.
+
+        The chart skips repaints while the window is minimized (see
+        TrajectoryCharts.refresh); un-minimizing does not send its children
+        a show event, so the buffered points are applied from here.
+        """
+        super().changeEvent(event)
+        if (event.type() == QEvent.Type.WindowStateChange
+                and not self.isMinimized()):
+            charts = getattr(self, "trajectory_charts", None)
+            if charts is not None:
+                charts.refreshIfStale()
+
     def closeEvent(self, event):
         """
         Ensure any attached data source is stopped when the window closes.
@@ -746,8 +922,13 @@ class BalloonSatDashboard(QMainWindow):
         Connect dispatcher signals and button click handlers.
         
         This method wires up the event system, connecting:
-        1. Dispatcher signals (data updates) to UI update methods
-        2. Button clicked signals to action handlers
+        1. Button clicked signals to action handlers (immediately)
+        2. Dispatcher signals (data updates) to UI update methods, deferred
+           until the window is first shown: showEvent() queues
+           _connect_dispatcher() with QTimer.singleShot(0), so the first
+           frame is painted before the dispatcher wiring and flush timer
+           start. Call _connect_dispatcher() directly to use a window
+           that is never shown.
         
         Signal Flow Overview:
             Data Source → Dispatcher → Dashboard Method → Widget Update
@@ -756,21 +937,21 @@ class BalloonSatDashboard(QMainWindow):
             telemetryUpdated(dict):
                 • Source: Data source (serial, file, network)
                 • Payload: Dict mapping field names to values
-                • Handler: telemetry_model.updateTelemetry()
-                • Effect: Both tables update with new values
+                • Handler: _on_telemetry_update() (queued, coalesced flush)
+                • Effect: Tables update with new values on the next tick
                 • Example: {'alt_bmp': 123.4, 'temp': 22.5}
             
             sensorStatusUpdated(dict):
                 • Source: Sensor health monitor
                 • Payload: Dict mapping sensor IDs to bool status
-                • Handler: _update_sensors()
+                • Handler: _on_sensor_status() → _update_sensors() on flush
                 • Effect: LED indicators change color (green/red/gray)
                 • Example: {'bmp': True, 'gps': False}
             
             computerHealthUpdated(float, float):
                 • Source: System monitor (psutil)
                 • Payload: (cpu_percent, memory_percent)
-                • Handler: _update_computer_health()
+                • Handler: _on_computer_health() → _update_computer_health() (max 10 Hz)
                 • Effect: Gauge bars update to show usage
                 • Example: (45.2, 67.8)
             
@@ -803,10 +984,24 @@ class BalloonSatDashboard(QMainWindow):
                 • Current: Enabled if button exists in UI
         
         Connection Types:
-            All connections use Qt.ConnectionType.AutoConnection (default):
-            • Same thread: Direct call (fast, synchronous)
-            • Different thread: Queued call (safe, asynchronous)
-            • Qt automatically chooses based on thread context
+            Dispatcher signals use Qt.ConnectionType.QueuedConnection:
+            • The slots only append to the pending buffers, which are read
+              by the flush timers without locking, so they must always run
+              on the GUI thread - even if a data source emits from a worker
+              thread (e.g. the threading fallback TelemetryFilePlayer)
+            • The emitting thread never runs dashboard code, and Qt skips
+              the per-emit AutoConnection thread comparison
+            • Coalescing happens on the flush tick anyway, so the extra
+              event-loop hop adds no visible latency
+            Button clicks and the dashboard's own timers (flush, health,
+            resize) use Qt.ConnectionType.DirectConnection: they are always
+            emitted on the GUI thread, so no connection relies on
+            AutoConnection's per-emit thread check.
+            Both steps are guarded by sentinels, so calling them again never
+            attaches duplicate slots (no UniqueConnection needed).
+            • All slots are new-style bound methods decorated with
+              @pyqtSlot(<types>) matching the signal signature, so PyQt
+              connects them as real C++ slots (no lambda/proxy wrappers)
         
         Notes:
             • Dispatcher is a singleton from dispatcher.py
@@ -832,7 +1027,7 @@ class BalloonSatDashboard(QMainWindow):
             2. Check signal emission in data source
             3. Verify method signatures match signal signatures
             4. Check for typos in method names
-            5. Ensure data source is on correct thread (or use QueuedConnection)
+            5. Ensure the Qt event loop is running (dispatcher slots are queued)
         
         See Also:
             dispatcher.py: For signal definitions and global dispatcher instance
@@ -841,96 +1036,223 @@ class BalloonSatDashboard(QMainWindow):
             _append_trajectory(): For chart update implementation
             _on_open_esp32cam(): For ESP32-CAM window opening
         """
+        # Connect at most once: a second call would attach every slot again
+        # and double the work per emit. PyQt6 cannot combine
+        # UniqueConnection with the QueuedConnection used for the
+        # dispatcher, so sentinels guard both steps instead.
+        if getattr(self, "_signals_connected", False):
+            return
+        self._signals_connected = True
+        # Dispatcher wiring is queued by the first showEvent()
+        self._connect_buttons()
+
+    @pyqtSlot()
+    def _connect_dispatcher(self):
+        """Connect dispatcher signals (the flush timer is armed by arrivals).
+
+        Idempotent: the sentinel stands in for Qt.UniqueConnection, which
+        PyQt6 cannot OR with QueuedConnection (ConnectionType is a plain
+        enum), so repeated calls never attach duplicate slots.
+        """
+        if getattr(self, "_dispatcher_connected", False):
+            return
+        self._dispatcher_connected = True
+
         # === DISPATCHER SIGNALS (Data Updates from External Sources) ===
+        # Always queued: slots run on the GUI thread whichever thread emits
+        queued = Qt.ConnectionType.QueuedConnection
         
         # Telemetry data updated → use a single handler so we can capture
         # the previous snapshot before applying the new values to live models.
-        dispatch.telemetryUpdated.connect(self._on_telemetry_update)
+        dispatch.telemetryUpdated.connect(self._on_telemetry_update, queued)
+        # Batched samples (one serial read) → same queue, one dispatch
+        dispatch.telemetryBatchUpdated.connect(self._on_telemetry_batch, queued)
         
-        # Sensor status updated → Update LED indicators
-        dispatch.sensorStatusUpdated.connect(self._update_sensors)
+        # Sensor status updated → Queued, LEDs updated on the next flush
+        dispatch.sensorStatusUpdated.connect(self._on_sensor_status, queued)
         
-        # Computer health updated → Update CPU/Memory gauges
-        dispatch.computerHealthUpdated.connect(self._update_computer_health)
+        # Computer health updated → Latest kept, gauges updated at most 10 Hz
+        dispatch.computerHealthUpdated.connect(self._on_computer_health, queued)
         
         # New trajectory point → Add to altitude chart
-        dispatch.trajectoryAppended.connect(self._append_trajectory)
+        dispatch.trajectoryAppended.connect(self._append_trajectory, queued)
         
+        # Trajectory reset → Empty the chart (and the pending batch). Queued
+        # like the points, so it lands in order between them
+        dispatch.trajectoryCleared.connect(self._clear_trajectory, queued)
+
+        log.debug("Dispatcher signals connected")
+
+    def _connect_buttons(self):
+        """Connect button click handlers (cheap, needed before first input)."""
         # === BUTTON CLICK HANDLERS ===
+        # Buttons only ever emit on the GUI thread: connect directly
+        direct = Qt.ConnectionType.DirectConnection
         
         # Start button (currently disabled in GUI-only mode)
         if self.btn_start:
-            self.btn_start.clicked.connect(self._on_start)
+            self.btn_start.clicked.connect(self._on_start, direct)
         
         # Stop button (currently disabled in GUI-only mode)
         if self.btn_stop:
-            self.btn_stop.clicked.connect(self._on_stop)
+            self.btn_stop.clicked.connect(self._on_stop, direct)
         
         # Clear button (always enabled and functional)
         if self.btn_clear:
-            self.btn_clear.clicked.connect(self._on_clear)
+            self.btn_clear.clicked.connect(self._on_clear, direct)
         
         # === ESP32-CAM BUTTON (if exists in UI) ===
-        # Try multiple common button names to maximize compatibility
-        camera_btn = None
-        for btn_name in ['cameraButton', 'btn_camera', 'btn_esp32cam', 'openCameraButton']:
-            camera_btn = self.findChild(QPushButton, btn_name)
-            if camera_btn:
-                camera_btn.clicked.connect(self._on_open_esp32cam)
-                print(f"  ✓ Connected ESP32-CAM button: {btn_name}")
-                break
-        
-        if not camera_btn:
-            print("  ℹ️  No ESP32-CAM button found in UI (optional)")
+        # Resolved once in _find_all_widgets (see CAMERA_BUTTON_NAMES)
+        if self.camera_btn:
+            self.camera_btn.clicked.connect(self._on_open_esp32cam, direct)
+            log.debug("Connected ESP32-CAM button: %s", self.camera_btn.objectName())
+        else:
+            log.debug("No ESP32-CAM button found in UI (optional)")
         
-        print("✓ Signals connected")
+        log.debug("Signals connected")
 
+    @pyqtSlot(dict)
     def _on_telemetry_update(self, data: dict):
         """
-        Central handler for telemetry updates.
+        Queue an incoming telemetry sample for the next coalesced flush.
+
+        Connected to dispatch.telemetryUpdated. This slot does no model work
+        at all; samples are applied in batches by _flush_telemetry() so the
+        view cost is bounded by the flush rate, not the telemetry rate.
+        """
+        self._pending_telemetry.append(data)
+        self._schedule_flush()
+
+    @pyqtSlot(list)
+    def _on_telemetry_batch(self, samples: list):
+        """Queue a batch of samples (dispatch.telemetryBatchUpdated), oldest first."""
+        self._pending_telemetry.extend(samples)
+        self._schedule_flush()
+
+    @pyqtSlot(dict)
+    def _on_sensor_status(self, status: dict):
+        """Keep only the latest sensor status; applied by _flush_pending()."""
+        self._pending_sensors = status
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Arm the coalescing flush if it is idle (never postpone it)."""
+        timer = self._telemetry_flush_timer
+        if not timer.isActive():
+            timer.start()
+
+    @pyqtSlot(float, float)
+    def _on_computer_health(self, cpu: float, mem: float):
+        """Keep only the latest CPU/memory reading; applied by _flush_health()."""
+        self._pending_health = (cpu, mem)
+        # Arm only when idle; restarting would postpone the update forever
+        # under a steady stream
+        if not self._health_timer.isActive():
+            self._health_timer.start()
+
+    @pyqtSlot()
+    def _flush_pending(self):
+        """
+        Coalescing timer shot: apply everything queued since the last one.
+
+        Telemetry samples are merged by _flush_telemetry() and trajectory
+        points batched by _flush_trajectory(); sensor status is a snapshot,
+        so only the newest one is applied. Computer health has its own,
+        slower timer (_flush_health).
+        """
+        self._flush_telemetry()
+        self._flush_trajectory()
+
+        status = self._pending_sensors
+        if status is not None:
+            self._pending_sensors = None
+            try:
+                self._update_sensors(status)
+            except Exception:
+                log.exception("Sensor status update failed")
+
+    @pyqtSlot()
+    def _flush_health(self):
+        """
+        Apply the newest CPU/memory reading (health timer tick, max 10 Hz).
+
+        Readings that arrived since the timer was armed have already been
+        collapsed into `_pending_health`; a reading arriving after this
+        point re-arms the timer from _on_computer_health(). A reading equal
+        to the last one written is dropped; smaller visual changes are
+        filtered by LinearGauge.setValue() (0.1 % label resolution).
+        """
+        health = self._pending_health
+        if health is None:
+            return
+        self._pending_health = None
+        # Steady readings (idle machine, slow poller) touch no gauge at all
+        if health == self._last_health:
+            return
+        self._last_health = health
+        try:
+            self._update_computer_health(*health)
+        except Exception:
+            log.exception("Computer health update failed")
+
+    def _flush_telemetry(self):
+        """
+        Apply all telemetry samples queued since the last tick.
 
         Workflow:
-        1. Build a snapshot of the current values (before applying new data)
-           and update `previous_snapshot_model` with that snapshot.
-        2. Apply the incoming `data` to the live models (`previous_telemetry_model`,
-           `latest_model`, `track_model`).
+        1. Drain the pending queue and merge the samples (later keys win).
+        2. Build the "previous" snapshot delta: the model state just before
+           the newest sample differs from what `previous_snapshot_model`
+           already shows only in the keys of the last flush's newest sample
+           (now current) and the keys of every sample but the newest one.
+        3. Update `previous_snapshot_model` with that delta.
+        4. Apply the merged batch to `telemetry_model`; the latest/track
+           proxy views follow it automatically.
+
+        Each model is updated once per tick and only with the keys that
+        arrived, so no per-field walk over the whole field list is needed.
 
-        This guarantees `previous_telemetry_table` always shows the values
-        from the immediate previous update (or empty on first update).
+        This guarantees `previous_telemetry_table` still shows the values
+        from the sample immediately before the latest one (or empty on the
+        first update), regardless of how many samples were coalesced.
         """
+        pending = self._pending_telemetry
+        if not pending:
+            return
+
         try:
-            # Capture previous values for fields known by the full model
-            prev = {}
-            for field in self.telemetry_model._fields:
-                key = field.source_key
-                if key in self.telemetry_model._values:
-                    prev[key] = self.telemetry_model._values[key]
+            batch = list(pending)
+            pending.clear()
+
+            # One walk over the batch serves both models: every sample but
+            # the newest is merged once into `merged`, which feeds the
+            # previous-snapshot delta before the newest sample is added
+            newest = batch[-1]
+            merged = {}
+            for sample in batch[:-1]:
+                merged.update(sample)
+
+            # Previous snapshot delta: last tick's newest values become
+            # "previous" now, rolled forward by every sample but the newest
+            values = self.telemetry_model._values
+            prev = {key: values[key] for key in self._last_sample_keys if key in values}
+            prev.update(merged)
+            self._last_sample_keys = tuple(newest)
+
+            merged.update(newest)
 
             # Update the previous-snapshot model (view shows "one step before")
             if prev:
                 self.previous_snapshot_model.updateTelemetry(prev)
 
-            # Now update live models with incoming data
+            # Now update the live model (proxy views follow) with the batch
             try:
-                self.telemetry_model.updateTelemetry(data)
-            except Exception as e:
-                print("TelemetryModel update error:", e)
-
-            try:
-                self.latest_model.updateTelemetry(data)
-            except Exception as e:
-                print("LatestModel update error:", e)
-
-            try:
-                self.track_model.updateTelemetry(data)
-            except Exception as e:
-                print("TrackModel update error:", e)
+                self.telemetry_model.updateTelemetry(merged)
+            except Exception:
+                log.exception("TelemetryModel update failed")
         except Exception:
-            # Defensive: do not let telemetry handler raise
-            # Log the exception for easier debugging
-            import traceback
-            print("Error in _on_telemetry_update:")
-            traceback.print_exc()
+            # Defensive: do not let the flush timer raise
+            log.exception("Error in _flush_telemetry")
             return
     
     def _initialize_ui_state(self):
@@ -1002,6 +1324,19 @@ class BalloonSatDashboard(QMainWindow):
             _find_all_widgets(): Where widget references are obtained
             _update_sensors(): Method that changes LED states based on data
         """
+        # === Batch the initial state ===
+        # Every setter below (setEnabled, setToolTip, setState, setLabel)
+        # schedules its own update/style pass. Suspend updates on the whole
+        # window for the block; re-enabling issues a single update().
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_initial_ui_state()
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+
+    def _apply_initial_ui_state(self):
+        """Apply the states documented in _initialize_ui_state (updates off)."""
         # === Start/Stop button initial states ===
         # Enable Start by default so user can attempt to start a data source.
         # If no `data_source` is attached the handler will print a helpful error.
@@ -1022,9 +1357,11 @@ class BalloonSatDashboard(QMainWindow):
         
         # === Initialize sensor LEDs to 'off' state ===
         # Gray color indicates awaiting first sensor status update
-        for sensor_id, led in self.sensor_leds.items():
-            led.setState('off')  # Gray circle
-            led.setToolTip(f"{sensor_id}: No data")
+        for sensor_id, set_state, set_tip, tips in self._sensor_iter:
+            set_state(_LED_OFF)  # Gray circle
+            set_tip(tips[_LED_OFF])
+            self._last_sensor_state[sensor_id] = _LED_OFF
+        self._last_status_key = None
         
         # === Set gauge labels ===
         # Ensure gauges show correct labels (may override Qt Designer defaults)
@@ -1034,58 +1371,16 @@ class BalloonSatDashboard(QMainWindow):
         if self.mem_gauge:
             self.mem_gauge.setLabel("Mem %")
         
-        print("✓ UI initialized")
-        # Schedule a single-shot deferred resize. Layouts are finalized
-        # after the event loop runs once, so deferring ensures table
-        # viewport sizes are available and column widths will be computed
-        # correctly. We avoid immediate resize calls here to keep startup
-        # deterministic and not depend on layout timing.
-        # If the dashboard should run in a light/embedded mode, apply
-        # conservative chart settings and hide heavy UI elements like
-        # the ESP32-CAM button to reduce CPU / GPU load on small devices.
-        try:
-            light_mode = os.getenv("DASHBOARD_LIGHT_MODE", "").lower() in ("1", "true", "yes", "on")
-        except Exception:
-            light_mode = False
-
-        if light_mode:
-            print("⚡ DASHBOARD_LIGHT_MODE active: applying light-mode optimizations")
-            try:
-                if self.trajectory_charts:
-                    # Coarser update interval (batch more points between repaints)
-                    try:
-                        self.trajectory_charts.setUpdateInterval(10)
-                    except Exception:
-                        pass
-                    # Reduce rolling buffer size
-                    try:
-                        self.trajectory_charts.setMaxPoints(2000)
-                    except Exception:
-                        pass
-                    # Disable per-point markers to reduce draw cost
-                    try:
-                        self.trajectory_charts.setShowMarkers(False)
-                    except Exception:
-                        pass
-                    # Lower marker threshold if still using markers
-                    try:
-                        self.trajectory_charts.setMarkersThreshold(200)
-                    except Exception:
-                        pass
-            except Exception as e:
-                print("Error applying light-mode chart settings:", e)
-
-            # Hide camera/open-camera button (if present) to avoid starting live feed
-            try:
-                for btn_name in ['cameraButton', 'btn_camera', 'btn_esp32cam', 'openCameraButton']:
-                    b = self.findChild(QPushButton, btn_name)
-                    if b:
-                        b.setVisible(False)
-                        print(f"  ✂️ Hidden camera button: {btn_name}")
-            except Exception:
-                pass
-
-        QTimer.singleShot(0, self._resize_tables)
+        log.debug("UI initialized")
+        # Light/embedded mode: the chart already picked its conservative
+        # settings when it was constructed (see TrajectoryCharts.__init__);
+        # here only the ESP32-CAM button is hidden, so the live feed is
+        # never started on small devices.
+        if self._light_mode:
+            log.info("DASHBOARD_LIGHT_MODE active: applying light-mode optimizations")
+            if self.camera_btn:
+                self.camera_btn.setVisible(False)
+                log.debug("Hidden camera button: %s", self.camera_btn.objectName())
     
     # ========================================================================
     # === DATA UPDATE HANDLERS (Called by Dispatcher Signals) ===
@@ -1156,7 +1451,12 @@ class BalloonSatDashboard(QMainWindow):
             • O(n) where n = 9 sensors (constant, very fast)
             • Each LED update is O(1)
             • Total time: <1ms for all 9 LEDs
-            • Updates only trigger repaints for changed LEDs
+            • Only LEDs whose state changed get setState/setToolTip calls
+              (last state cached per sensor, tooltips prebuilt)
+            • Loops over _sensor_iter, a tuple built once with the LEDs'
+              bound methods, instead of the sensor_leds dict
+            • Returns immediately when the payload equals the last one
+              applied (compared as a frozenset of items)
         
         Error Handling:
             • Handles missing sensor IDs (treated as fault)
@@ -1200,21 +1500,33 @@ class BalloonSatDashboard(QMainWindow):
             metadata.SENSORS: For sensor definitions
             _initialize_ui_state(): Where LEDs are initially set to 'off'
         """
+        # Producers often re-send an unchanged status dict every poll: an
+        # identical payload cannot change any LED, so skip the loop
+        try:
+            status_key = frozenset(status.items())
+        except TypeError:
+            status_key = None  # unhashable values: always run the loop
+        if status_key is not None and status_key == self._last_status_key:
+            return
+        self._last_status_key = status_key
+
+        last_state = self._last_sensor_state
+        get = status.get
         # Iterate through all sensor LEDs found during initialization
-        for sensor_id, led in self.sensor_leds.items():
-            # Get status for this sensor (default to None if missing)
-            val = status.get(sensor_id, None)
+        # (prebuilt tuple, bound methods already resolved)
+        for sensor_id, set_state, set_tip, tips in self._sensor_iter:
+            # Healthy → green; faulty, missing or False → red. This
+            # defensive approach makes problems immediately obvious.
+            state = _LED_ON if get(sensor_id) is True else _LED_FAULT
             
-            # Update LED state based on status value
-            if val is True:
-                # Sensor is healthy - show green LED
-                led.setState('on')
-                led.setToolTip(f"{sensor_id}: OK")
-            else:
-                # Sensor is faulty, missing, or False - show red LED
-                # This defensive approach makes problems immediately obvious
-                led.setState('fault')
-                led.setToolTip(f"{sensor_id}: not working")
+            # Status rarely changes: skip LEDs already in the right state
+            # (a dict lookup instead of a getState() call; setToolTip is
+            # not free and setState would no-op anyway)
+            if last_state[sensor_id] == state:
+                continue
+            set_state(state)
+            set_tip(tips[state])
+            last_state[sensor_id] = state
     
     def _update_computer_health(self, cpu: float, mem: float):
         """
@@ -1310,13 +1622,16 @@ class BalloonSatDashboard(QMainWindow):
             _initialize_ui_state(): Where gauge labels are initially set
         """
         # Update CPU gauge if found
-        if self.cpu_gauge:
-            self.cpu_gauge.setValue(cpu)
+        cpu_gauge = self.cpu_gauge
+        if cpu_gauge:
+            cpu_gauge.setValue(cpu)
         
         # Update memory gauge if found
-        if self.mem_gauge:
-            self.mem_gauge.setValue(mem)
+        mem_gauge = self.mem_gauge
+        if mem_gauge:
+            mem_gauge.setValue(mem)
     
+    @pyqtSlot(object)
     def _append_trajectory(self, p):
         """
         Add a trajectory point to the altitude chart.
@@ -1370,8 +1685,8 @@ class BalloonSatDashboard(QMainWindow):
             ...     dispatch.trajectoryAppended.emit(point)
         
         Performance:
-            • Append operation: O(1) (list.append)
-            • Chart update: O(n) where n = total points
+            • Append operation: O(1) (list.append into the pending batch)
+            • Chart update: once per flush tick for the whole batch
             • PyQtGraph optimizes rendering (handles 10,000+ points)
             • Update rate: 100+ Hz supported
             • CPU usage: <0.3% per append
@@ -1407,7 +1722,7 @@ class BalloonSatDashboard(QMainWindow):
             • Point object is duck-typed (any object with required attributes)
             • lat/lon attributes ignored (backward compatible with old format)
             • Chart automatically rescales to fit data
-            • Clear flag checked first (before adding point)
+            • Clear flag applied in order within the flushed batch
             • Called from Qt main thread (thread-safe via signal/slot)
         
         Troubleshooting:
@@ -1423,36 +1738,58 @@ class BalloonSatDashboard(QMainWindow):
             _clear_trajectory(): Method to clear all chart data
             _on_clear(): Button handler that calls _clear_trajectory()
         """
+        # Queue only; _flush_trajectory() hands the batch to the chart on
+        # the next flush tick (one setData per tick instead of per point).
+        # A clear point wipes everything queued before it, so drop those
+        # now instead of parsing them on the flush. The reset itself is a
+        # flag applied before the next batch: the point could be evicted
+        # from the bounded queue by a burst of later points.
+        if TrajectoryCharts._wants_clear(p):
+            self._pending_trajectory.clear()
+            self._pending_trajectory_clear = True
+        self._pending_trajectory.append(p)
+        self._schedule_flush()
+
+    def _flush_trajectory(self):
+        """
+        Append all trajectory points queued since the last tick in one batch.
+
+        The queue is drained first so points arriving during the flush go
+        to the next batch. It is bounded (maxlen), so a stalled GUI drops
+        the oldest points rather than growing without limit. A clear
+        requested since the last tick is applied before the batch even if
+        its point was dropped; `clear` flags inside the batch are also
+        honoured by TrajectoryCharts.appendPoints().
+        If the chart is hidden, the points only go into its buffers; the
+        chart redraws once when it is shown again.
+        """
+        pending = self._pending_trajectory
+        reset = self._pending_trajectory_clear
+        if not pending and not reset:
+            return
+        batch = list(pending)
+        pending.clear()
+        self._pending_trajectory_clear = False
+
         # Check if trajectory chart widget exists
-        if not self.trajectory_charts:
+        charts = self.trajectory_charts
+        if not charts:
             return
         
-        # Support a `.clear` flag on the incoming point so emitters can
-        # request that the current trajectory be cleared before plotting
-        # a newly-loaded trajectory file
-        try:
-            if getattr(p, "clear", False):
-                self.trajectory_charts.clear()
-        except Exception as e:
-            print("Error checking 'clear' on trajectory point:", e)
-        
-        # Add point to chart (updates both expected and actual lines)
+        # Add points to chart (single setData for the whole batch). The
+        # curve schedules its own repaint; no forced synchronous repaint()
+        # or per-flush console output here.
         try:
-            self.trajectory_charts.appendPoint(p)
-            # Diagnostic: print current buffer size to confirm UI update
-            try:
-                cnt = self.trajectory_charts.getDataPointCount()
-                print(f"✓ Trajectory appended; total points={cnt}")
-            except Exception:
-                pass
-            # Force a repaint of the plot widget to ensure visual refresh
-            try:
-                self.trajectory_charts.update()
-                self.trajectory_charts.alt_plot.repaint()
-            except Exception:
-                pass
-        except Exception as e:
-            print("Error appending trajectory point:", e)
+            if reset:
+                charts.clear()
+            if batch:
+                charts.appendPoints(batch)
+            # The point count is only computed when debug logging is on
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Trajectory appended; total points=%d",
+                          charts.getDataPointCount())
+        except Exception:
+            log.exception("Error appending trajectory points")
     
     def _clear_trajectory(self):
         """
@@ -1497,7 +1834,10 @@ class BalloonSatDashboard(QMainWindow):
                 >>> from types import SimpleNamespace
                 >>> from dispatcher import dispatch
                 >>> 
-                >>> # Clear via point with clear flag
+                >>> # Preferred: dedicated reset signal
+                >>> dispatch.trajectoryCleared.emit()
+                >>> 
+                >>> # Legacy: clear via point with clear flag
                 >>> point = SimpleNamespace(
                 ...     t=0,
                 ...     alt_expected=0,
@@ -1508,14 +1848,15 @@ class BalloonSatDashboard(QMainWindow):
         
         UI Feedback:
             • Chart visibly empties
-            • Console message: "✓ Trajectory cleared"
+            • Debug log message: "Trajectory cleared"
             • No error if chart already empty (idempotent)
         
         Notes:
             • Safe to call even if chart is already empty (idempotent)
             • Does not disable the chart (can still add new points)
             • Called by _on_clear() button handler
-            • Also called automatically when point has clear=True flag
+            • Connected to dispatch.trajectoryCleared
+            • A point with clear=True has the same effect, in batch order
         
         Troubleshooting:
             If clear not working:
@@ -1529,14 +1870,18 @@ class BalloonSatDashboard(QMainWindow):
             _on_clear(): Button handler that calls this method
             widgets.charts.TrajectoryCharts.clear(): Underlying implementation
         """
+        # Drop queued points too, so they don't reappear on the next flush
+        self._pending_trajectory.clear()
+        self._pending_trajectory_clear = False
         if self.trajectory_charts:
             self.trajectory_charts.clear()
-            print("✓ Trajectory cleared")
+            log.debug("Trajectory cleared")
     
     # ========================================================================
     # === BUTTON HANDLERS (User Interaction) ===
     # ========================================================================
     
+    @pyqtSlot()
     def _on_start(self):
         """
         Handle Start Stream button click.
@@ -1596,6 +1941,7 @@ class BalloonSatDashboard(QMainWindow):
         # self.btn_start.setEnabled(False)
         # self.btn_stop.setEnabled(True)
     
+    @pyqtSlot()
     def _on_stop(self):
         """
         Handle Stop Stream button click.
@@ -1653,6 +1999,7 @@ class BalloonSatDashboard(QMainWindow):
         # self.btn_start.setEnabled(True)
         # self.btn_stop.setEnabled(False)
     
+    @pyqtSlot()
     def _on_clear(self):
         """
         Handle Clear Trajectory button click.
@@ -1709,6 +2056,7 @@ class BalloonSatDashboard(QMainWindow):
         """
         self._clear_trajectory()
     
+    @pyqtSlot()
     def _on_open_esp32cam(self):
         """
         Open ESP32-CAM window for live feed and snapshot capture.
@@ -1745,20 +2093,16 @@ class BalloonSatDashboard(QMainWindow):
             esp32cam_window.ESP32CamWindow: The camera window implementation
             widgets.live_feed.LiveFeedWidget: The live feed display widget
         """
-        # Import ESP32-CAM window
-        try:
-            from esp32cam_window import ESP32CamWindow
-        except ImportError:
-            from dashboardGUI.esp32cam_window import ESP32CamWindow
+        # ESP32-CAM window class (usually already preloaded after show)
+        ESP32CamWindow = _import_esp32cam()
         
-        # Check if already open (singleton pattern)
-        if ESP32CamWindow.is_open():
+        # Already open (singleton pattern): bring it to front instead
+        existing = ESP32CamWindow.get_or_none()
+        if existing is not None:
             print("⚠️  ESP32-CAM window already open")
-            # Bring existing window to front
-            existing = ESP32CamWindow.get_instance()
-            if existing:
-                existing.activateWindow()
-                existing.raise_()
+            existing.show()  # no-op unless it was hidden
+            existing.activateWindow()
+            existing.raise_()
             return
         
         # Create and show ESP32-CAM window (non-blocking)
@@ -1771,6 +2115,26 @@ class BalloonSatDashboard(QMainWindow):
 # === APPLICATION ENTRY POINT ===
 # ============================================================================
 
+def _enable_debug_logging():
+    """
+    Enable DEBUG logging with console writes off the GUI thread.
+
+    Log calls only enqueue the record (QueueHandler); a QueueListener
+    thread does the formatting and the (possibly slow, e.g. Windows
+    console) stream write. The listener is flushed and stopped at exit.
+    """
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(logging.DEBUG)
+
+
 def main(argv=None):
     """
     Application entry point.
@@ -1847,12 +2211,8 @@ def main(argv=None):
         • Runs until window closed or app.quit() called
     
     Example Output:
-        ✓ Loaded stylesheet from: D:\\...\\styles\\dark.qss
-        ✓ Loading UI from: D:\\...\\dashboard.ui
-        ✓ Found 9/9 sensor indicators
-        ✓ Table models configured
-        ✓ Signals connected
-        ✓ UI initialized
+        (stylesheet/UI loading and model/signal setup details are logged
+        with DASHBOARD_DEBUG=1, written by a background listener thread)
         
         ============================================================
         🚀 BalloonSat Telemetry Dashboard Started
@@ -1874,15 +2234,29 @@ def main(argv=None):
     """
     # Get command line arguments (default to sys.argv if not provided)
     argv = argv or sys.argv
+
+    # Opt-in startup diagnostics (widget discovery, model/signal setup)
+    if os.getenv("DASHBOARD_DEBUG", "").lower() in ("1", "true", "yes", "on"):
+        _enable_debug_logging()
     
     # === Create Qt Application ===
-    # QApplication is the main Qt object (one per process)
-    app = QApplication(argv)
+    # QApplication is the main Qt object (one per process); reuse an
+    # existing instance (e.g. when launched from another Qt tool/test)
+    app = QApplication.instance() or QApplication(argv)
+    
+    # === Application font ===
+    # Set natively rather than as a QWidget font rule in the stylesheet:
+    # a stylesheet font is resolved and pushed onto every widget at polish
+    # time (including windows created later, like the ESP32-CAM viewer),
+    # while the application font is simply inherited.
+    app.setFont(QFont(["Segoe UI", "Arial"], 11))
     
     # === Load and Apply Dark Theme Stylesheet ===
     # Searches multiple paths for dark.qss file
+    # (cached by load_stylesheet; a reused QApplication that already has
+    # this sheet is not made to re-parse it and re-polish every widget)
     qss_content = load_stylesheet("light.qss", "styles")
-    if qss_content:
+    if qss_content and app.styleSheet() != qss_content:
         app.setStyleSheet(qss_content)
     # Note: If stylesheet not found, prints warning but continues with default theme
     
@@ -1896,29 +2270,42 @@ def main(argv=None):
         
         # Show window (makes it visible)
         window.show()
-        # Attempt to attach a demo TelemetryFilePlayer if a replay file exists
-        try:
-            from telemetry_bridge import TelemetryFilePlayer
-            import os
-            base = os.path.dirname(__file__)
-            candidates = [
-                os.path.join(base, 'data', 'replays', 'demo.ndjson'),
-                os.path.join(base, 'data', 'replays', 'demo.json'),
-                os.path.join(base, 'data', 'demo.ndjson'),
-                os.path.join(base, 'data', 'demo.json')
-            ]
-            demo_fp = None
-            for c in candidates:
-                if os.path.exists(c):
-                    demo_fp = c
-                    break
-            if demo_fp:
-                player = TelemetryFilePlayer(demo_fp, realtime=False, speed=1.0, loop=True, parent=window)
-                window.data_source = player
-                print(f"Attached demo TelemetryFilePlayer -> {demo_fp}")
-        except Exception:
-            # Non-fatal: if telemetry_bridge can't be imported or no demo file, continue silently
-            pass
+        # Attach a live serial reader when a port is configured
+        serial_port = os.getenv("DASHBOARD_SERIAL_PORT", "").strip()
+        if serial_port:
+            try:
+                try:
+                    from serial_bridge import SerialTelemetryReader
+                except ImportError:
+                    from dashboardGUI.serial_bridge import SerialTelemetryReader
+                baud = int(os.getenv("DASHBOARD_SERIAL_BAUD", "115200"))
+                window.data_source = SerialTelemetryReader(serial_port, baudrate=baud, parent=window)
+                print(f"Attached SerialTelemetryReader -> {serial_port} @ {baud}")
+            except Exception as e:
+                print(f"⚠️  Could not attach serial reader: {e}")
+        # Otherwise attach a demo TelemetryFilePlayer if a replay file exists
+        if window.data_source is None:
+            try:
+                from telemetry_bridge import TelemetryFilePlayer
+                base = os.path.dirname(__file__)
+                candidates = [
+                    os.path.join(base, 'data', 'replays', 'demo.ndjson'),
+                    os.path.join(base, 'data', 'replays', 'demo.json'),
+                    os.path.join(base, 'data', 'demo.ndjson'),
+                    os.path.join(base, 'data', 'demo.json')
+                ]
+                demo_fp = None
+                for c in candidates:
+                    if os.path.exists(c):
+                        demo_fp = c
+                        break
+                if demo_fp:
+                    player = TelemetryFilePlayer(demo_fp, realtime=False, speed=1.0, loop=True, parent=window)
+                    window.data_source = player
+                    print(f"Attached demo TelemetryFilePlayer -> {demo_fp}")
+            except Exception:
+                # Non-fatal: if telemetry_bridge can't be imported or no demo file, continue silently
+                pass
         # Print startup message
         print("\n" + "="*60)
         print("🚀 BalloonSat Telemetry Dashboard Started")
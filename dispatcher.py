@@ -39,9 +39,9 @@ Usage Examples:
         dispatch.computerHealthUpdated.emit(45.2, 67.8)  # CPU, Memory
         
         # Append trajectory point
-        from types import SimpleNamespace
-        point = SimpleNamespace(t=0, lat=12.97, lon=77.59,
-                               alt_expected=100, alt_actual=99.5)
+        from dispatcher import TrajectoryPoint
+        point = TrajectoryPoint(t=0, lat=12.97, lon=77.59,
+                                alt_expected=100, alt_actual=99.5)
         dispatch.trajectoryAppended.emit(point)
     
     Connecting to signals (from widgets):
@@ -75,8 +75,29 @@ Version: 2.0
 """
 
 from __future__ import annotations
-from PyQt6.QtCore import QObject, pyqtSignal
-from typing import Dict
+import threading
+from dataclasses import dataclass
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+from typing import Any, Dict
+
+
+@dataclass(slots=True, frozen=True)
+class TrajectoryPoint:
+    """
+    Payload of `trajectoryAppended` as produced by the in-tree sources.
+    
+    Slotted and frozen: no per-instance __dict__ (a long flight emits
+    thousands of points) and subscribers cannot mutate a shared payload.
+    Subscribers still read it duck-typed, so any object with these
+    attributes (or a dict with these keys) is accepted as well.
+    """
+    
+    t: float
+    lat: float
+    lon: float
+    alt_expected: float
+    alt_actual: float
+    clear: bool = False
 
 
 class Dispatcher(QObject):
@@ -94,6 +115,12 @@ class Dispatcher(QObject):
             Example: {'alt_bmp': 123.4, 'temp': 22.5, 'pressure': 101325}
             Frequency: Typically 1-10 Hz (once per second to 10 times per second)
         
+        telemetryBatchUpdated (list):
+            Emitted by sources that decode several samples at once (one
+            serial read). Equivalent to one telemetryUpdated per item, in
+            order, for a single signal dispatch.
+            Payload: List of telemetry dicts, oldest first
+        
         sensorStatusUpdated (dict):
             Emitted when sensor health status changes.
             Payload: Dictionary mapping sensor IDs to boolean status
@@ -108,23 +135,33 @@ class Dispatcher(QObject):
         
         trajectoryAppended (object):
             Emitted when a new trajectory point should be plotted.
-            Payload: Duck-typed object with attributes:
+            Payload: TrajectoryPoint, or any duck-typed object with attributes:
                     • t (float): Time in seconds
                     • lat (float): Latitude in degrees
                     • lon (float): Longitude in degrees
                     • alt_expected (float): Expected altitude in meters
                     • alt_actual (float): Actual altitude in meters
                     • clear (optional bool): If True, clear before appending
-            Example: SimpleNamespace(t=0, lat=12.97, lon=77.59,
-                                    alt_expected=100, alt_actual=99.5)
+            Example: TrajectoryPoint(t=0, lat=12.97, lon=77.59,
+                                     alt_expected=100, alt_actual=99.5)
             Frequency: Typically 0.1-1 Hz (trajectory sampling rate)
         
+        trajectoryCleared ():
+            Emitted when the trajectory chart should be emptied (new flight,
+            new replay file). Preferred over a point with clear=True, which
+            is still honoured for compatibility.
+            Payload: None
+        
         frameReady (object):
             Emitted when a new camera frame is available.
             Payload: QImage object ready for display
-            Example: QImage from camera capture
+            Example: QImage decoded from the ESP32-CAM MJPEG stream
             Frequency: Typically 1-30 Hz (camera frame rate)
-            Note: Not used in current dashboard version (camera removed)
+            Producers should use emit_frame(), which coalesces frames the
+            GUI has not painted yet (newest frame wins).
+            Producer: camera_bridge.CameraStreamReader (started by the
+            ESP32-CAM window when DASHBOARD_CAMERA_URL is set)
+            Subscriber: ESP32CamWindow (esp32cam_window.py)
     
     Usage Pattern:
         # Singleton pattern: One global dispatcher instance
@@ -171,6 +208,10 @@ class Dispatcher(QObject):
     # Type: dict[str, Any] - mapping field names to values
     telemetryUpdated = pyqtSignal(dict)
     
+    # Several telemetry samples decoded together, oldest first
+    # Type: list[dict[str, Any]] - same dicts as telemetryUpdated
+    telemetryBatchUpdated = pyqtSignal(list)
+    
     # Sensor health status update signal
     # Type: dict[str, bool] - mapping sensor IDs to True (ok) or False (fault)
     sensorStatusUpdated = pyqtSignal(dict)
@@ -183,11 +224,30 @@ class Dispatcher(QObject):
     # Type: object - duck-typed point with t, lat, lon, alt_expected, alt_actual
     trajectoryAppended = pyqtSignal(object)
     
+    # Trajectory reset signal (no payload)
+    trajectoryCleared = pyqtSignal()
+    
     # Camera frame ready signal
     # Type: object - QImage ready for display
-    # Note: Not used in current version (camera feature removed)
+    # Emitted via emit_frame() by camera_bridge.CameraStreamReader
     frameReady = pyqtSignal(object)
     
+    # Every signal above, in declaration order (used by the utility
+    # methods below so a new signal only has to be listed once)
+    SIGNAL_NAMES = (
+        'telemetryUpdated',
+        'telemetryBatchUpdated',
+        'sensorStatusUpdated',
+        'computerHealthUpdated',
+        'trajectoryAppended',
+        'trajectoryCleared',
+        'frameReady',
+    )
+    
+    # Internal: wakes the dispatcher's own thread to deliver the newest
+    # coalesced frame (see emit_frame); not part of SIGNAL_NAMES
+    _frameQueued = pyqtSignal()
+    
     def __init__(self) -> None:
         """
         Initialize the Dispatcher.
@@ -200,6 +260,50 @@ class Dispatcher(QObject):
             rather than creating new Dispatcher instances.
         """
         super().__init__()
+        # emit_frame() state: newest undelivered frame, and whether a
+        # delivery is already queued (shared with producer threads)
+        self._frame_lock = threading.Lock()
+        self._pending_frame: Any = None
+        self._frame_queued = False
+        self._frameQueued.connect(self._deliver_frame, Qt.ConnectionType.QueuedConnection)
+    
+    # ========================================================================
+    # === FRAME COALESCING ===
+    # ========================================================================
+    
+    def emit_frame(self, frame: Any) -> None:
+        """
+        Emit frameReady with at most one frame waiting in the event queue.
+        
+        Camera readers can produce frames faster than the GUI paints them.
+        With a plain frameReady.emit() from a reader thread, every frame is
+        queued and the feed falls further behind. emit_frame() keeps only
+        the newest frame: while a delivery is pending, a new frame replaces
+        the waiting one instead of posting another event. frameReady is
+        then emitted on the dispatcher's (GUI) thread.
+        
+        Safe to call from any thread. The frame must own its pixels (e.g.
+        QImage.copy() of a decoder buffer that will be reused).
+        
+        Args:
+            frame: QImage to deliver to frameReady subscribers
+        """
+        with self._frame_lock:
+            self._pending_frame = frame
+            if self._frame_queued:
+                return  # delivery already queued; it will pick this frame
+            self._frame_queued = True
+        self._frameQueued.emit()
+    
+    @pyqtSlot()
+    def _deliver_frame(self) -> None:
+        """Emit the newest coalesced frame (runs in the dispatcher's thread)."""
+        with self._frame_lock:
+            frame = self._pending_frame
+            self._pending_frame = None
+            self._frame_queued = False
+        if frame is not None:
+            self.frameReady.emit(frame)
     
     # ========================================================================
     # === UTILITY METHODS (Optional) ===
@@ -222,13 +326,7 @@ class Dispatcher(QObject):
         Note:
             This is a debugging utility and not typically used in production.
         """
-        return {
-            'telemetryUpdated': self.receivers(self.telemetryUpdated),
-            'sensorStatusUpdated': self.receivers(self.sensorStatusUpdated),
-            'computerHealthUpdated': self.receivers(self.computerHealthUpdated),
-            'trajectoryAppended': self.receivers(self.trajectoryAppended),
-            'frameReady': self.receivers(self.frameReady),
-        }
+        return {name: self.receivers(getattr(self, name)) for name in self.SIGNAL_NAMES}
     
     def disconnect_all(self):
         """
@@ -245,30 +343,12 @@ class Dispatcher(QObject):
             # Reset all connections
             dispatch.disconnect_all()
         """
-        try:
-            self.telemetryUpdated.disconnect()
-        except TypeError:
-            pass  # No connections to disconnect
-        
-        try:
-            self.sensorStatusUpdated.disconnect()
-        except TypeError:
-            pass
-        
-        try:
-            self.computerHealthUpdated.disconnect()
-        except TypeError:
-            pass
-        
-        try:
-            self.trajectoryAppended.disconnect()
-        except TypeError:
-            pass
-        
-        try:
-            self.frameReady.disconnect()
-        except TypeError:
-            pass
+        for name in self.SIGNAL_NAMES:
+            signal = getattr(self, name)
+            # disconnect() raises TypeError when nothing is connected;
+            # check first instead of raising and catching per signal
+            if self.receivers(signal):
+                signal.disconnect()
 
 
 # ============================================================================
@@ -341,8 +421,6 @@ if __name__ == "__main__":
     dispatch.computerHealthUpdated.emit(45.2, 67.8)
     
     # Test trajectoryAppended signal
-    from types import SimpleNamespace
-    
     def on_trajectory(point):
         print("\n📍 Trajectory Point:")
         print(f"   Time: {point.t}s")
@@ -350,7 +428,7 @@ if __name__ == "__main__":
         print(f"   Altitude: {point.alt_actual}m (expected: {point.alt_expected}m)")
     
     dispatch.trajectoryAppended.connect(on_trajectory)
-    point = SimpleNamespace(
+    point = TrajectoryPoint(
         t=10.5,
         lat=12.9716,
         lon=77.5946,
@@ -17,9 +17,19 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage, QImageWriter
 from pathlib import Path
 from datetime import datetime
+import os
+import threading
+
+try:
+    # Optional: libjpeg-turbo (SIMD) encoder for snapshots
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_BGRX
+except ImportError:
+    TurboJPEG = None
 
 try:
     from widgets.live_feed import LiveFeedWidget
@@ -31,6 +41,98 @@ try:
 except ImportError:
     from dashboardGUI.dispatcher import dispatch
 
+try:
+    from camera_bridge import CameraStreamReader
+except ImportError:
+    from dashboardGUI.camera_bridge import CameraStreamReader
+
+
+class _SnapshotSignals(QObject):
+    """Completion signal for SnapshotJob (QRunnable is not a QObject)."""
+
+    # filepath, size in bytes (-1 on failure), error message ("" on success)
+    finished = pyqtSignal(str, int, str)
+
+
+_turbo = None
+_turbo_lock = threading.Lock()
+
+
+def _turbojpeg():
+    """Return a shared TurboJPEG encoder, or None when unavailable.
+
+    The package may be installed without the libturbojpeg shared library,
+    in which case the constructor fails; that is remembered as False so
+    the library is only probed once.
+    """
+    global _turbo
+    if TurboJPEG is None:
+        return None
+    with _turbo_lock:
+        if _turbo is None:
+            try:
+                _turbo = TurboJPEG()
+            except Exception:
+                _turbo = False
+    return _turbo or None
+
+
+class SnapshotJob(QRunnable):
+    """
+    Encode and write one snapshot JPEG on a QThreadPool worker.
+
+    JPEG encoding at quality 95 takes tens of milliseconds for a camera
+    frame; running it here keeps the GUI thread (and incoming frames)
+    moving while the file is written. With PyTurboJPEG installed the
+    frame is encoded by libjpeg-turbo (SIMD), otherwise by Qt's JPEG
+    plugin through QImageWriter.
+    """
+
+    QUALITY = 95
+
+    def __init__(self, image, filepath: Path):
+        super().__init__()
+        self.image = image
+        self.filepath = filepath
+        # Created in the GUI thread; delivery to the window is queued
+        self.signals = _SnapshotSignals()
+
+    def run(self):
+        turbo = _turbojpeg()
+        if turbo is not None:
+            try:
+                data = self._encode_turbo(turbo)
+                self.filepath.write_bytes(data)
+            except Exception as e:
+                self.signals.finished.emit(str(self.filepath), -1, str(e))
+            else:
+                self.signals.finished.emit(str(self.filepath), len(data), "")
+            return
+
+        writer = QImageWriter(str(self.filepath), b"JPEG")
+        writer.setQuality(self.QUALITY)
+        if writer.write(self.image):
+            try:
+                size = self.filepath.stat().st_size
+            except OSError:
+                size = 0
+            self.signals.finished.emit(str(self.filepath), size, "")
+        else:
+            self.signals.finished.emit(str(self.filepath), -1, writer.errorString())
+
+    def _encode_turbo(self, turbo) -> bytes:
+        """Encode the frame with libjpeg-turbo (zero-copy NumPy view)."""
+        # RGB32 is B, G, R, X in memory on little-endian hosts (BGRX)
+        image = self.image
+        if image.format() != QImage.Format.Format_RGB32:
+            image = image.convertToFormat(QImage.Format.Format_RGB32)
+        w, h = image.width(), image.height()
+        ptr = image.constBits()
+        ptr.setsize(image.sizeInBytes())
+        rows = np.frombuffer(ptr, np.uint8).reshape(h, image.bytesPerLine())
+        pixels = np.ascontiguousarray(rows[:, :w * 4].reshape(h, w, 4))
+        return turbo.encode(pixels, quality=self.QUALITY, pixel_format=TJPF_BGRX)
+
 
 class ESP32CamWindow(QDialog):
     """
@@ -104,65 +206,95 @@ class ESP32CamWindow(QDialog):
         self.snapshot_dir = Path("snapshots")
         self.snapshot_dir.mkdir(exist_ok=True)
         
-        # Snapshot counter
+        # Snapshot counter (persisted in snapshots/.counter)
+        self._counter_path = self.snapshot_dir / ".counter"
         self.snapshot_counter = self._get_next_snapshot_number()
         
+        # Newest frame as received (QImage): snapshots are encoded from it
+        # off the GUI thread; the feed widget only keeps a QPixmap
+        self._last_image = None
+        # Resolution the status label currently describes (see _on_frame_ready)
+        self._frame_size = None
+        # Signal objects of snapshot jobs still running, kept alive (and
+        # later released) on the GUI thread
+        self._snapshot_jobs = set()
+        
         # Setup UI
         self._setup_ui()
         
         # Connect signals
         self._connect_signals()
         
+        # Optional MJPEG stream source; reads and decodes in its own QThread
+        camera_url = os.getenv("DASHBOARD_CAMERA_URL")
+        grayscale = os.getenv("DASHBOARD_CAMERA_GRAYSCALE", "").lower() in ("1", "true", "yes", "on")
+        self._camera_reader = (
+            CameraStreamReader(camera_url, grayscale=grayscale, parent=self)
+            if camera_url else None
+        )
+        if self._camera_reader is not None:
+            self._camera_reader.start()
+        
         print("✓ ESP32-CAM window created (non-modal)")
     
     def _setup_ui(self):
         """Setup user interface."""
-        layout = QVBoxLayout(self)
-        
-        # ────────────────────────────────────────────────────────────
-        # Live Feed Widget
-        # ────────────────────────────────────────────────────────────
-        
-        self.live_feed = LiveFeedWidget()
-        self.live_feed.setMinimumSize(640, 480)
-        layout.addWidget(self.live_feed)
-        
-        # ────────────────────────────────────────────────────────────
-        # Status Label
-        # ────────────────────────────────────────────────────────────
-        
-        self.status_label = QLabel("📡 Waiting for connection...")
-        self.status_label.setStyleSheet("padding: 5px; background: #2a2a2a;")
-        layout.addWidget(self.status_label)
-        
-        # ────────────────────────────────────────────────────────────
-        # Buttons
-        # ────────────────────────────────────────────────────────────
-        
-        button_layout = QHBoxLayout()
-        
-        # Snapshot button
-        self.btn_snapshot = QPushButton("📸 Capture Snapshot")
-        self.btn_snapshot.clicked.connect(self._on_snapshot)
-        self.btn_snapshot.setEnabled(False)  # Disabled until first frame
-        button_layout.addWidget(self.btn_snapshot)
-        
-        # Settings button (NEW - toggle stay on top)
-        self.btn_stay_on_top = QPushButton("📌 Stay On Top: OFF")
-        self.btn_stay_on_top.setCheckable(True)
-        self.btn_stay_on_top.clicked.connect(self._toggle_stay_on_top)
-        button_layout.addWidget(self.btn_stay_on_top)
-        
-        # Close button
-        self.btn_close = QPushButton("❌ Close")
-        self.btn_close.clicked.connect(self.close)
-        button_layout.addWidget(self.btn_close)
-        
-        layout.addLayout(button_layout)
+        # Suspend repaints while the layout is populated: one layout pass
+        # and paint when updates are re-enabled instead of one per widget
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout(self)
+        
+            # ────────────────────────────────────────────────────────────
+            # Live Feed Widget
+            # ────────────────────────────────────────────────────────────
+        
+            self.live_feed = LiveFeedWidget(self)
+            self.live_feed.setMinimumSize(640, 480)
+            layout.addWidget(self.live_feed)
+        
+            # ────────────────────────────────────────────────────────────
+            # Status Label
+            # ────────────────────────────────────────────────────────────
+        
+            self.status_label = QLabel("📡 Waiting for connection...", self)
+            self.status_label.setStyleSheet("padding: 5px; background: #2a2a2a;")
+            layout.addWidget(self.status_label)
+        
+            # ────────────────────────────────────────────────────────────
+            # Buttons
+            # ────────────────────────────────────────────────────────────
+        
+            button_layout = QHBoxLayout()
+            button_layout.setContentsMargins(0, 0, 0, 0)
+            # Buttons only ever emit on the GUI thread: connect directly
+            direct = Qt.ConnectionType.DirectConnection
+        
+            # Snapshot button
+            self.btn_snapshot = QPushButton("📸 Capture Snapshot", self)
+            self.btn_snapshot.clicked.connect(self._on_snapshot, direct)
+            self.btn_snapshot.setEnabled(False)  # Disabled until first frame
+            button_layout.addWidget(self.btn_snapshot)
+        
+            # Settings button (NEW - toggle stay on top)
+            self.btn_stay_on_top = QPushButton("📌 Stay On Top: OFF", self)
+            self.btn_stay_on_top.setCheckable(True)
+            self.btn_stay_on_top.clicked.connect(self._toggle_stay_on_top, direct)
+            button_layout.addWidget(self.btn_stay_on_top)
+        
+            # Close button
+            self.btn_close = QPushButton("❌ Close", self)
+            self.btn_close.clicked.connect(self.close, direct)
+            button_layout.addWidget(self.btn_close)
+        
+            layout.addLayout(button_layout)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _connect_signals(self):
         """Connect dispatcher signals."""
-        # Connect to frame signal
+        # Connect to frame signal. Not DirectConnection: a camera reader may
+        # emit from its own thread, and this slot touches widgets
         dispatch.frameReady.connect(self._on_frame_ready)
         print("  ✓ Connected to frameReady signal")
     
@@ -182,24 +314,31 @@ class ESP32CamWindow(QDialog):
             frame: QImage from ESP32-CAM
         """
         if frame and not frame.isNull():
+            self._last_image = frame
             # Update live feed
             self.live_feed.updateFrame(frame)
             
-            # Update status
-            self.status_label.setText(
-                f"📡 Connected | Resolution: {frame.width()}x{frame.height()} | "
-                f"Snapshots: {self.snapshot_counter - 1}"
-            )
-            
-            # Enable snapshot button
-            self.btn_snapshot.setEnabled(True)
+            # Status and snapshot button only change with the stream's
+            # resolution: no per-frame string formatting, and a snapshot
+            # message is not overwritten by the next frame
+            size = frame.size()
+            if size != self._frame_size:
+                self._frame_size = size
+                # Update status
+                self.status_label.setText(
+                    f"📡 Connected | Resolution: {frame.width()}x{frame.height()} | "
+                    f"Snapshots: {self.snapshot_counter - 1}"
+                )
+                
+                # Enable snapshot button
+                self.btn_snapshot.setEnabled(True)
     
     def _on_snapshot(self):
-        """Capture snapshot to file."""
+        """Capture snapshot to file (encoded on a QThreadPool worker)."""
         # Get current frame
-        frame = self.live_feed.getCurrentFrame()
+        frame = self._last_image
         
-        if not frame:
+        if frame is None or self.live_feed.getCurrentFrame() is None:
             QMessageBox.warning(
                 self,
                 "No Frame",
@@ -212,39 +351,37 @@ class ESP32CamWindow(QDialog):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"balloonsat_{timestamp}_{self.snapshot_counter:03d}.jpg"
         filepath = self.snapshot_dir / filename
+        # Claimed now so quick repeated clicks get distinct numbers
+        self.snapshot_counter += 1
+        self._save_snapshot_counter()
+        
+        # Deep copy: the producer's QImage may wrap a buffer it reuses for
+        # the next frame while the worker is still encoding this one
+        job = SnapshotJob(frame.copy(), filepath)
+        job.signals.finished.connect(self._on_snapshot_saved)
+        self._snapshot_jobs.add(job.signals)
+        QThreadPool.globalInstance().start(job)
+        self.status_label.setText(f"📸 Saving snapshot: {filename}...")
+    
+    @pyqtSlot(str, int, str)
+    def _on_snapshot_saved(self, filepath, size, error):
+        """Report a finished SnapshotJob (queued back to the GUI thread)."""
+        self._snapshot_jobs.discard(self.sender())
+        filename = Path(filepath).name
         
-        # Save snapshot
-        try:
-            success = frame.save(str(filepath), "JPEG", quality=95)
-            
-            if success:
-                file_size = filepath.stat().st_size / 1024  # KB
-                
-                QMessageBox.information(
-                    self,
-                    "✓ Snapshot Saved",
-                    f"Snapshot saved successfully!\n\n"
-                    f"File: {filename}\n"
-                    f"Location: {filepath.parent.absolute()}\n"
-                    f"Size: {file_size:.1f} KB"
-                )
-                
-                self.snapshot_counter += 1
-                
-                # Update status
-                self.status_label.setText(
-                    f"📸 Snapshot saved: {filename} | "
-                    f"Total: {self.snapshot_counter - 1}"
-                )
-            else:
-                raise Exception("Save failed")
-        
-        except Exception as e:
+        if size < 0:
             QMessageBox.critical(
                 self,
                 "❌ Save Failed",
-                f"Failed to save snapshot:\n{e}"
+                f"Failed to save snapshot:\n{error or filename}"
             )
+            return
+        
+        # Update status (no modal box: capturing stays a one-click action)
+        self.status_label.setText(
+            f"📸 Snapshot saved: {filename} ({size / 1024:.1f} KB) | "
+            f"Location: {Path(filepath).parent.absolute()}"
+        )
     
     def _toggle_stay_on_top(self, checked):
         """
@@ -274,9 +411,17 @@ class ESP32CamWindow(QDialog):
         """
         Get next snapshot counter number.
         
+        Read from snapshots/.counter; the directory is only scanned when
+        that file is missing or unreadable (first run, older folders).
+        
         Returns:
             Next counter number (001, 002, etc.)
         """
+        try:
+            return max(1, int(self._counter_path.read_text()))
+        except (OSError, ValueError):
+            pass
+        
         # Find existing snapshots
         existing = list(self.snapshot_dir.glob("balloonsat_*.jpg"))
         
@@ -296,10 +441,21 @@ class ESP32CamWindow(QDialog):
         
         return max(numbers, default=0) + 1
     
+    def _save_snapshot_counter(self):
+        """Persist the next snapshot number (best effort)."""
+        try:
+            self._counter_path.write_text(str(self.snapshot_counter))
+        except OSError as e:
+            print(f"⚠️  Could not save snapshot counter: {e}")
+    
     def closeEvent(self, event):
         """Handle window close event."""
         print("Closing ESP32-CAM window...")
         
+        # Stop the stream before disconnecting from its frames
+        if self._camera_reader is not None:
+            self._camera_reader.stop()
+        
         # Disconnect signals
         self._disconnect_signals()
         
@@ -327,6 +483,18 @@ class ESP32CamWindow(QDialog):
         """Get current window instance (if open)."""
         return cls._instance
 
+    @classmethod
+    def get_or_none(cls):
+        """
+        Return the open window, or None - one read for check-and-fetch.
+
+        Use instead of is_open() followed by get_instance(): the answer
+        cannot change between two calls. A window hidden with hide() (not
+        closed) is still returned, since constructing a second one while
+        `_instance` is set would be refused.
+        """
+        return cls._instance
+
 
 # ════════════════════════════════════════════════════════════════════
 # STANDALONE TEST
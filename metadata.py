@@ -440,6 +440,31 @@ ARCHIVED_TELEMETRY_FIELDS: list[TelemetryField] = [
 
 ]
 
+# ============================================================================
+# === TABLE GROUPINGS ===
+# ============================================================================
+
+# Fields shown in the dashboard's small GPS/RTC "track" table; every other
+# field goes to the "latest readings" table. Precomputed once at import.
+GPS_RTC_KEYS: frozenset[str] = frozenset({"gps_latlon", "alt_gps", "rtc_time"})
+
+# Sensor ID -> objectName of its StatusLED in dashboard.ui. A module-level
+# tuple so the dashboard binds its LEDs in a single pass at startup.
+SENSOR_INDICATOR_MAP: tuple[tuple[str, str], ...] = (
+    ("bmp", "bmp180Indicator"),     # BMP280 (UI object keeps the bmp180 name)
+    ("esp32", "esp32Indicator"),
+    ("mq131", "mq131Indicator"),
+    ("mpu", "mpu6050Indicator"),
+    ("gps", "gpsIndicator"),
+    ("mq2", "mq2Indicator"),
+    ("dht22", "dht22Indicator"),
+    ("mq7", "mq7Indicator"),
+    ("rtc", "rtcIndicator"),
+    ("max6675", "max6675Indicator"),
+    ("lora", "loRaIndicator"),
+    ("bms", "bmsIndicator"),
+)
+
 # ============================================================================
 # === SENSOR CONFIGURATION ===
 # ============================================================================
@@ -8,6 +8,10 @@ It implements the Model-View architecture pattern used throughout PyQt6 applicat
 Key Classes:
     TelemetryTableModel: QAbstractTableModel for telemetry data display
                         Handles data storage, formatting, and table updates
+    TelemetryFilterProxy: QSortFilterProxyModel showing a subset of rows
+                          (by source_key) of one shared TelemetryTableModel
+    TelemetryDelegate: QStyledItemDelegate that fetches cell text with one
+                       Python call instead of one data() call per role
 
 Architecture:
     The Model-View pattern separates data (model) from presentation (view):
@@ -50,8 +54,9 @@ Version: 2.0
 """
 
 from __future__ import annotations
-from typing import Any, Dict
-from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex
+from typing import Any, Dict, Iterable, List
+from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
 
 # ============================================================================
 # === IMPORTS: Metadata ===
@@ -137,6 +142,17 @@ class TelemetryTableModel(QAbstractTableModel):
         # Internal data storage: source_key → raw value
         # Using dict for O(1) lookup performance
         self._values: Dict[str, Any] = {}
+
+        # Pre-formatted display strings, one per row (parallel to _fields).
+        # Formatting happens once per update instead of once per paint, so
+        # data() is a plain list index during scrolling/repaints.
+        self._display: List[str] = [""] * len(self._fields)
+
+        # source_key → row, built once so updates touch only the keys they
+        # carry instead of scanning every field per update
+        self._key_to_row: Dict[str, int] = {}
+        for row, field in enumerate(self._fields):
+            self._key_to_row.setdefault(field.source_key, row)
     
     def rowCount(self, parent=QModelIndex()) -> int:
         """
@@ -192,22 +208,24 @@ class TelemetryTableModel(QAbstractTableModel):
             • Other roles: Returns None (could add tooltips, colors, etc.)
         
         Performance:
+            • Non-display roles rejected first (Qt queries ~10 roles per cell)
             • O(1) for column 0 (parameter name from metadata)
-            • O(1) for column 1 (value lookup from dict)
-            • String formatting overhead minimal (cached by Qt)
+            • O(1) for column 1 (pre-formatted string from _display cache)
+            • No formatting during paint (done once in updateTelemetry)
         
         Example Data Flow:
             Qt rendering engine calls:
             data(index(0, 0), DisplayRole) → "Altitude (BMP)"
             data(index(0, 1), DisplayRole) → "123.4 m"
         """
-        # === Validate index and role ===
-        if not index.isValid():
-            return None
-        
+        # === Validate role and index ===
+        # Role check first: most calls are for roles we never answer
         if role != Qt.ItemDataRole.DisplayRole:
             return None  # Only handle display role (text)
         
+        if not index.isValid():
+            return None
+        
         # === Get field definition for this row ===
         field = self._fields[index.row()]
         
@@ -217,11 +235,25 @@ class TelemetryTableModel(QAbstractTableModel):
         
         # === Column 1: Formatted value ===
         elif index.column() == 1:
-            raw_value = self._resolve_field_value(field)
-            return raw_value
+            return self._display[index.row()]
         
         # Invalid column
         return None
+
+    def cellText(self, row: int, column: int) -> str:
+        """
+        Return the display text for a cell without going through data().
+
+        Used by TelemetryDelegate on the paint path; avoids building a
+        QModelIndex/QVariant round trip per role.
+
+        Args:
+            row: Row number (must be valid)
+            column: 0 for parameter label, 1 for formatted value
+        """
+        if column == 0:
+            return self._fields[row].label
+        return self._display[row]
     
     def headerData(
         self,
@@ -273,14 +305,14 @@ class TelemetryTableModel(QAbstractTableModel):
                  Example: {'alt_bmp': 123.4, 'temp': 22.5, 'pressure': 101325}
         
         Performance Optimizations:
-            • Only stores values for fields we recognize (fast rejection)
-            • Collects changed row numbers (no redundant signals)
-            • Single dataChanged signal per contiguous range of rows
+            • Only stores values for fields we recognize (O(1) key→row lookup)
+            • Dirty check on formatted text (unchanged rows are skipped)
+            • One dataChanged signal per contiguous run of dirty rows
             • No unnecessary data copies
         
         Signal Emission:
-            Emits dataChanged for each changed row, causing Qt to repaint
-            only the affected cells in all connected views.
+            Emits dataChanged for each run of changed rows, causing Qt to
+            repaint only the affected cells in all connected views.
         
         Example:
             >>> model = TelemetryTableModel()
@@ -291,10 +323,10 @@ class TelemetryTableModel(QAbstractTableModel):
             ...     'temp': 20.0
             ... })
             >>> 
-            >>> # Second update (only changed rows updated)
+            >>> # Second update (only changed rows signalled)
             >>> model.updateTelemetry({
             ...     'alt_bmp': 101.0,  # Changed
-            ...     'temp': 20.0        # Unchanged (but still stored)
+            ...     'temp': 20.0        # Unchanged (stored, no repaint)
             ... })
         
         Thread Safety:
@@ -303,20 +335,36 @@ class TelemetryTableModel(QAbstractTableModel):
         """
         changed_rows = []
 
-        # Update values and track changed rows
-        for i, field in enumerate(self._fields):
-            if field.source_key in data:
-                self._values[field.source_key] = data[field.source_key]
-                changed_rows.append(i)
-
-        # Emit a single contiguous dataChanged range covering all changed rows
-        if changed_rows:
-            first = min(changed_rows)
-            last = max(changed_rows)
-            index_first = self.index(first, 1)
-            index_last = self.index(last, 1)
-            # Emit one signal for the whole range (simpler and still efficient)
-            self.dataChanged.emit(index_first, index_last)
+        # Update values and refresh the display cache. A row is dirty only
+        # if its formatted text actually changed: unchanged channels (status
+        # values, slowly varying sensors, sub-precision jitter) are neither
+        # re-announced nor repainted.
+        key_to_row = self._key_to_row
+        for key, value in data.items():
+            row = key_to_row.get(key)
+            if row is None:
+                continue  # Not a field of this model
+            self._values[key] = value
+            text = self._resolve_field_value(self._fields[row])
+            if text != self._display[row]:
+                self._display[row] = text
+                changed_rows.append(row)
+
+        if not changed_rows:
+            return
+        changed_rows.sort()  # dict order is arbitrary; runs need row order
+
+        # Emit one dataChanged per contiguous run of dirty rows so the
+        # invalidated region covers only cells that changed.
+        # Only DisplayRole changed: lets views skip re-querying other roles
+        roles = [Qt.ItemDataRole.DisplayRole]
+        start = prev = changed_rows[0]
+        for row in changed_rows[1:]:
+            if row != prev + 1:
+                self.dataChanged.emit(self.index(start, 1), self.index(prev, 1), roles)
+                start = row
+            prev = row
+        self.dataChanged.emit(self.index(start, 1), self.index(prev, 1), roles)
     
     def _resolve_field_value(self, field: TelemetryField) -> str:
         """
@@ -394,6 +442,80 @@ class TelemetryTableModel(QAbstractTableModel):
             return str(value)
 
 
+# ============================================================================
+# === FILTER PROXY ===
+# ============================================================================
+
+class TelemetryFilterProxy(QSortFilterProxyModel):
+    """
+    Row filter over a shared TelemetryTableModel, selected by source_key.
+
+    Lets several tables show different subsets of the same telemetry while
+    only one Python model is updated per frame; Qt maps the source model's
+    dataChanged to the visible rows in C++.
+
+    Args:
+        keys: source_key values to include (or exclude, see `exclude`)
+        exclude: If True, show every row *except* those in `keys`
+        parent: Optional QObject parent
+
+    Example:
+        >>> track = TelemetryFilterProxy({"gps_latlon", "rtc_time"})
+        >>> track.setSourceModel(model)
+        >>> table.setModel(track)
+    """
+
+    def __init__(self, keys: Iterable[str], exclude: bool = False, parent=None):
+        super().__init__(parent)
+        self._keys = frozenset(keys)
+        self._exclude = exclude
+        # Row membership depends only on the (static) field list, never on
+        # values, so don't re-run filterAcceptsRow on every dataChanged
+        self.setDynamicSortFilter(False)
+
+    def filterAcceptsRow(self, source_row: int, _source_parent: QModelIndex) -> bool:
+        source = self.sourceModel()
+        key = source._fields[source_row].source_key
+        return (key in self._keys) != self._exclude
+
+
+# ============================================================================
+# === DELEGATE ===
+# ============================================================================
+
+class TelemetryDelegate(QStyledItemDelegate):
+    """
+    Item delegate for TelemetryTableModel views.
+
+    The default QStyledItemDelegate.initStyleOption() asks the model for
+    Font, TextAlignment, Foreground, CheckState, Decoration, Display and
+    Background roles on every paint and sizeHint. Each of those is a call
+    into Python data() for our model. This delegate fills the style option
+    from TelemetryTableModel.cellText() in a single call and leaves all
+    other option fields at the view's defaults, so painting still goes
+    through the current style (and dark.qss).
+
+    TelemetryFilterProxy views are mapped to the source model; views over
+    other models fall back to the default behaviour.
+
+    Usage:
+        table.setItemDelegate(TelemetryDelegate(table))
+    """
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        model = index.model()
+        source_index = index
+        if isinstance(model, TelemetryFilterProxy):
+            source_index = model.mapToSource(index)
+            model = model.sourceModel()
+        if not isinstance(model, TelemetryTableModel):
+            super().initStyleOption(option, index)
+            return
+        option.index = index
+        option.text = model.cellText(source_index.row(), source_index.column())
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+
+
 # ============================================================================
 # === MODULE TESTING ===
 # ============================================================================
@@ -0,0 +1,316 @@
+"""
+Serial Telemetry Reader / Bridge
+================================
+
+This module reads live telemetry from a serial port (LoRa ground receiver,
+ESP32 USB link, ...) and emits it through the global `dispatch` dispatcher,
+exactly like `telemetry_bridge.TelemetryFilePlayer` does for replay files.
+
+Wire format:
+ - Newline-delimited JSON (NDJSON), one record per line, using the same
+   record layout as replay files (see `telemetry_bridge` docstring):
+
+   {"ts": "...", "telemetry": {...}, "sensors": {...}}
+
+ - Lines that are not brace-delimited JSON objects (line noise, partial
+   frames) are dropped before decoding. The link carries no CRC; framing
+   integrity is the newline plus the JSON object delimiters.
+
+Threading:
+ - The port is serviced by a worker object living in a dedicated `QThread`
+   so the kernel serial buffer is drained without contending with paint
+   events.
+ - On POSIX the worker watches the port's file descriptor with a
+   `QSocketNotifier` and only wakes when bytes arrive (no polling). Where
+   the descriptor is not selectable (Windows) it falls back to a blocking
+   `serial.read()` loop with a short timeout.
+ - Decoded records are handed to the GUI thread in batches through a
+   queued signal; only the cheap dispatcher emits run on the GUI thread,
+   and each batch's telemetry is a single `telemetryBatchUpdated` emit.
+
+Usage (simple):
+    from serial_bridge import SerialTelemetryReader
+
+    reader = SerialTelemetryReader('/dev/ttyUSB0', baudrate=115200)
+    window.data_source = reader     # Start/Stop buttons call start()/stop()
+
+    # Or select the port at launch:
+    #   DASHBOARD_SERIAL_PORT=/dev/ttyUSB0 python dashboard.py
+
+Dependencies:
+ - pyserial (listed in requirements.txt). Import is optional so the rest of
+   the dashboard works without it; `start()` reports a clear error instead.
+
+"""
+
+from __future__ import annotations
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QSocketNotifier, QThread, Qt, pyqtSignal, pyqtSlot
+
+try:
+    import serial  # pyserial
+except ImportError:
+    serial = None
+
+try:
+    from telemetry_bridge import emit_records
+except ImportError:
+    from dashboardGUI.telemetry_bridge import emit_records
+
+
+# ============================================================================
+# === WORKER (runs in QThread) ===
+# ============================================================================
+
+class SerialReaderWorker(QObject):
+    """
+    Serial reader that lives in its own QThread.
+
+    Reads whatever bytes are available, splits complete lines and decodes
+    them as JSON records. Each read produces at most one `records`
+    emission, so bursty links are delivered to the GUI thread in batches
+    rather than line by line.
+
+    Read strategy:
+        - POSIX: `QSocketNotifier` on `ser.fileno()`; the thread's event
+          loop sleeps until the kernel reports the port readable.
+        - Otherwise: blocking read loop bounded by the port timeout.
+
+    Signals:
+        records(list): Decoded record dicts from one read
+        error(str): Port could not be opened or was lost
+    """
+
+    records = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    # Upper bound for a single read; keeps one batch reasonably small
+    READ_CHUNK = 4096
+    # Drop the line buffer if no newline shows up within this many bytes
+    # (wrong baud rate, line noise); records are far smaller than this
+    MAX_BUFFER = 1 << 16
+
+    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 0.05):
+        super().__init__()
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self._stop = False
+        self._buffer = b""
+        self._ser = None
+        self._notifier: Optional[QSocketNotifier] = None
+
+    def stop(self) -> None:
+        """Request the read loop to exit (checked after every read)."""
+        self._stop = True
+
+    def run(self) -> None:
+        """Open the port and start reading (event-driven when possible)."""
+        try:
+            ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+        except Exception as e:
+            self.error.emit(f"Cannot open {self.port}: {e}")
+            self._finish()
+            return
+
+        fd = self._selectable_fd(ser)
+        if fd is not None:
+            # Non-blocking reads; the notifier tells us when data is there
+            ser.timeout = 0
+            self._ser = ser
+            self._notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+            self._notifier.activated.connect(self._on_readable)
+            return  # the thread's event loop drives reads from here on
+
+        try:
+            while not self._stop:
+                try:
+                    chunk = ser.read(min(ser.in_waiting or 1, self.READ_CHUNK))
+                except Exception as e:
+                    self.error.emit(f"Serial read failed on {self.port}: {e}")
+                    break
+                if chunk:
+                    batch = self._decode(chunk)
+                    if batch:
+                        self.records.emit(batch)
+        finally:
+            try:
+                ser.close()
+            except Exception:
+                pass
+            self._finish()
+
+    def _finish(self) -> None:
+        """End the worker thread's event loop (the reader can then restart)."""
+        thread = self.thread()
+        if thread is not None:
+            thread.quit()
+
+    @staticmethod
+    def _selectable_fd(ser) -> Optional[int]:
+        """Return the port's file descriptor if it can be watched, else None."""
+        if os.name != 'posix':
+            return None
+        try:
+            return ser.fileno()
+        except Exception:
+            return None
+
+    def _on_readable(self, *_args) -> None:
+        """Drain everything the kernel has buffered (notifier mode)."""
+        ser = self._ser
+        if ser is None:
+            return
+        try:
+            chunk = ser.read(ser.in_waiting or 1)
+        except Exception as e:
+            self.error.emit(f"Serial read failed on {self.port}: {e}")
+            self.shutdown()
+            return
+        if chunk:
+            batch = self._decode(chunk)
+            if batch:
+                self.records.emit(batch)
+
+    @pyqtSlot()
+    def shutdown(self) -> None:
+        """Release the notifier and port, then end the worker thread.
+
+        Must run in the worker thread (invoked through a queued signal).
+        """
+        self._stop = True
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+        if self._ser is not None:
+            try:
+                self._ser.close()
+            except Exception:
+                pass
+            self._ser = None
+        self._finish()
+
+    def _decode(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Append `chunk` to the line buffer and decode all complete lines."""
+        self._buffer += chunk
+        if b"\n" not in self._buffer:
+            if len(self._buffer) > self.MAX_BUFFER:
+                # Lost sync; the partial line before the next newline is
+                # rejected by the frame check below
+                self._buffer = b""
+            return []
+        *lines, self._buffer = self._buffer.split(b"\n")
+
+        # Frame check: a record is a JSON object, so anything not delimited
+        # by braces (noise, truncated frames after a link drop) is rejected
+        # with two byte compares instead of a failed json.loads.
+        frames = []
+        for line in lines:
+            line = line.strip()
+            if line[:1] == b"{" and line[-1:] == b"}":
+                frames.append(line)
+        if not frames:
+            return []
+
+        # Fast path: decode the whole chunk with one json.loads call so the
+        # parse loop runs in C once per read instead of once per line. Only
+        # trusted if it yields exactly one object per frame.
+        if len(frames) > 1:
+            try:
+                decoded = json.loads(b"[" + b",".join(frames) + b"]")
+            except ValueError:
+                decoded = None
+            if decoded is not None and len(decoded) == len(frames):
+                return [rec for rec in decoded if isinstance(rec, dict)]
+
+        # Slow path: a bad frame in the chunk; decode line by line
+        batch = []
+        for line in frames:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict):
+                batch.append(rec)
+        return batch
+
+
+# ============================================================================
+# === DATA SOURCE (lives in GUI thread) ===
+# ============================================================================
+
+class SerialTelemetryReader(QObject):
+    """
+    Serial data source that can be attached as `window.data_source`.
+
+    Owns the worker thread; `start()`/`stop()` match the file player API
+    so the dashboard's Start/Stop buttons work unchanged.
+
+    Usage in GUI:
+        reader = SerialTelemetryReader('/dev/ttyUSB0', parent=window)
+        window.data_source = reader
+    """
+
+    # Delivered (queued) to the worker so teardown runs in its own thread
+    _shutdown_requested = pyqtSignal()
+
+    def __init__(self, port: str, baudrate: int = 115200, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.baudrate = baudrate
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[SerialReaderWorker] = None
+
+    def start(self) -> None:
+        """Open the port in a worker thread and begin streaming."""
+        if serial is None:
+            print("⚠️  pyserial not installed - cannot read serial telemetry (pip install pyserial)")
+            return
+        if self._thread is not None and self._thread.isRunning():
+            return
+
+        self._thread = QThread(self)
+        self._worker = SerialReaderWorker(self.port, self.baudrate)
+        self._worker.moveToThread(self._thread)
+
+        # Explicit queued delivery: records are produced in the worker thread
+        self._worker.records.connect(self._on_records, Qt.ConnectionType.QueuedConnection)
+        self._worker.error.connect(self._on_error, Qt.ConnectionType.QueuedConnection)
+        self._shutdown_requested.connect(self._worker.shutdown, Qt.ConnectionType.QueuedConnection)
+        self._thread.started.connect(self._worker.run)
+        self._thread.start()
+        print(f"✓ Serial reader started on {self.port} @ {self.baudrate} baud")
+
+    def stop(self) -> None:
+        """Stop the worker and wait for the thread to finish."""
+        if self._worker is not None:
+            # Flag ends a blocking loop; the queued shutdown then releases
+            # the notifier/port inside the worker thread and quits it.
+            self._worker.stop()
+            self._shutdown_requested.emit()
+        if self._thread is not None:
+            if not self._thread.wait(1000):
+                self._thread.quit()
+                self._thread.wait(1000)
+        self._thread = None
+        self._worker = None
+
+    def _on_records(self, batch: list) -> None:
+        """Emit a batch of decoded records through the dispatcher (GUI thread).
+
+        The whole read goes out as one telemetryBatchUpdated emission.
+        """
+        try:
+            emit_records(batch)
+        except Exception as e:
+            self._on_error(f"Dropped {len(batch)} serial record(s): {e}")
+
+    def _on_error(self, message: str) -> None:
+        print(f"⚠️  {message}")
+
+
+__all__ = ["SerialTelemetryReader", "SerialReaderWorker"]
@@ -9,6 +9,7 @@ consume the data exactly as if it were coming from live sensors.
 Features:
  - Reads NDJSON (newline-delimited JSON) or a JSON array file
  - Emits `dispatch.telemetryUpdated` with a dict of telemetry keys
+   (`emit_records` sends a decoded batch as one `telemetryBatchUpdated`)
  - Emits `dispatch.sensorStatusUpdated` when `sensors` field present
  - Emits `dispatch.trajectoryAppended` for GPS points (lat/lon/alt)
  - Supports realtime replay using timestamps in telemetry records
@@ -55,16 +56,16 @@ Usage (simple):
 
 from __future__ import annotations
 import json
+import mmap
 import time
 from datetime import datetime
-from types import SimpleNamespace
 from typing import Optional, Dict, Any, List
 
-from dispatcher import dispatch
+from dispatcher import TrajectoryPoint, dispatch
 
 try:
     # Prefer Qt timer-based replay when running inside the GUI app
-    from PyQt6.QtCore import QTimer
+    from PyQt6.QtCore import QObject, QThread, QTimer, Qt, pyqtSignal
     _QT_AVAILABLE = True
 except Exception:
     _QT_AVAILABLE = False
@@ -95,6 +96,91 @@ def _parse_ts_static(ts_val) -> Optional[float]:
         return None
 
 
+def _split_record(record: Dict[str, Any], ts: Optional[float] = None):
+    """Normalize one record into its (telemetry, sensors, point) payloads.
+
+    `sensors` is None when the record has no sensor map and `point` is None
+    when it carries no usable GPS fix.
+    """
+    telemetry = record.get('telemetry') or record.get('data') or {}
+
+    # Normalize GPS
+    if 'gps_lat' in telemetry and 'gps_lon' in telemetry:
+        try:
+            telemetry['gps_latlon'] = (float(telemetry['gps_lat']), float(telemetry['gps_lon']))
+        except Exception:
+            pass
+
+    if 'gps_latlon' in telemetry and isinstance(telemetry['gps_latlon'], (list, tuple)):
+        lat, lon = telemetry['gps_latlon']
+        telemetry['gps_latlon'] = f"{lat:.6f}, {lon:.6f}"
+
+    sensors = record.get('sensors')
+    if not isinstance(sensors, dict):
+        sensors = None
+
+    lat = telemetry.get('gps_lat')
+    lon = telemetry.get('gps_lon')
+    if lat is None or lon is None:
+        return dict(telemetry), sensors, None
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        return dict(telemetry), sensors, None
+    alt = telemetry.get('alt_gps') or telemetry.get('alt_bmp')
+    if alt is None:
+        alt = 0.0
+    t = ts
+    if t is None:
+        t = _parse_ts_static(record.get('ts') or record.get('timestamp')) or time.time()
+    point = TrajectoryPoint(t=t, lat=lat, lon=lon, alt_expected=alt, alt_actual=alt)
+    return dict(telemetry), sensors, point
+
+
+def emit_record(record: Dict[str, Any], ts: Optional[float] = None) -> None:
+    """Emit one telemetry record through the global dispatcher.
+
+    Shared by the file players and the serial reader so every data source
+    produces identical signals. `ts` is the record's pre-parsed timestamp
+    (seconds); when omitted it is parsed from the record.
+    """
+    telemetry, sensors, point = _split_record(record, ts)
+
+    # Payload types are checked up front, so the emits need no try/except
+    # (a slot's own exception would not be caught here anyway)
+    dispatch.telemetryUpdated.emit(telemetry)
+    if sensors is not None:
+        dispatch.sensorStatusUpdated.emit(sensors)
+    if point is not None:
+        dispatch.trajectoryAppended.emit(point)
+
+
+def emit_records(records: List[Dict[str, Any]]) -> None:
+    """Emit several records decoded together (e.g. one serial read).
+
+    Telemetry goes out as a single `telemetryBatchUpdated` list instead of
+    one `telemetryUpdated` per record, and only the newest sensor map is
+    emitted (status is a snapshot). Trajectory points are emitted in order.
+    """
+    samples = []
+    sensors = None
+    points = []
+    for record in records:
+        telemetry, rec_sensors, point = _split_record(record)
+        samples.append(telemetry)
+        if rec_sensors is not None:
+            sensors = rec_sensors
+        if point is not None:
+            points.append(point)
+
+    if samples:
+        dispatch.telemetryBatchUpdated.emit(samples)
+    if sensors is not None:
+        dispatch.sensorStatusUpdated.emit(sensors)
+    for point in points:
+        dispatch.trajectoryAppended.emit(point)
+
+
 class TelemetryFilePlayerBase:
     """Base helpers for file loading and record emission."""
 
@@ -107,72 +193,88 @@ class TelemetryFilePlayerBase:
         self.loop = loop
 
         self.records: List[Dict[str, Any]] = []
+        # Parsed timestamps (seconds), parallel to `records`; filled once
+        # at load so playback never re-parses ISO strings per record
+        self.timestamps: List[Optional[float]] = []
+
+    def _read_records(self):
+        """Read records and pre-parse their timestamps (no state change).
+
+        Safe to call from a worker thread; returns ``(records, timestamps)``.
+        """
+        records = self._open_records()
+        timestamps = [
+            _parse_ts_static(rec.get('ts') or rec.get('timestamp'))
+            for rec in records
+        ]
+        return records, timestamps
+
+    def _load_records(self) -> None:
+        """Load records and pre-parse their timestamps in one pass."""
+        self.records, self.timestamps = self._read_records()
 
     def _open_records(self):
+        """Read all records from the replay file.
+
+        The file is memory-mapped read-only and decoded straight from the
+        mapped bytes (json accepts UTF-8 bytes), so there is no buffered
+        text-mode read, newline translation or str decode per line; the OS
+        page cache does the I/O.
+        """
         records = []
-        with open(self.file_path, 'r', encoding='utf-8') as fh:
-            first = fh.read(1)
-            fh.seek(0)
-            if not first:
+        with open(self.file_path, 'rb') as fh:
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
                 return []
-            if first == '[':
-                try:
-                    records = json.load(fh)
-                except Exception:
-                    records = []
-                return records
-            # NDJSON
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+            with mm:
+                # Skip leading whitespace/BOM to detect the container format
+                start = 0
+                size = len(mm)
+                while start < size and mm[start:start + 1] in (b' ', b'\t', b'\r', b'\n', b'\xef', b'\xbb', b'\xbf'):
+                    start += 1
+                if start >= size:
+                    return []
+                if mm[start:start + 1] == b'[':
+                    try:
+                        records = json.loads(mm[start:])
+                    except Exception:
+                        records = []
+                    return records
+                # NDJSON
+                for line in iter(mm.readline, b''):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
         return records
 
-    def _emit_record(self, record: Dict[str, Any]) -> None:
-        telemetry = record.get('telemetry') or record.get('data') or {}
+    def _emit_record(self, record: Dict[str, Any], ts: Optional[float] = None) -> None:
+        emit_record(record, ts)
 
-        # Normalize GPS
-        if 'gps_lat' in telemetry and 'gps_lon' in telemetry:
-            try:
-                telemetry['gps_latlon'] = (float(telemetry['gps_lat']), float(telemetry['gps_lon']))
-            except Exception:
-                pass
 
-        if 'gps_latlon' in telemetry and isinstance(telemetry['gps_latlon'], (list, tuple)):
-            lat, lon = telemetry['gps_latlon']
-            telemetry['gps_latlon'] = f"{lat:.6f}, {lon:.6f}"
+if _QT_AVAILABLE:
+    class _RecordLoader(QObject):
+        """Worker that reads/parses the replay file inside a QThread."""
 
-        try:
-            dispatch.telemetryUpdated.emit(dict(telemetry))
-        except Exception:
-            pass
+        loaded = pyqtSignal(list, list)
 
-        sensors = record.get('sensors')
-        if isinstance(sensors, dict):
-            try:
-                dispatch.sensorStatusUpdated.emit(sensors)
-            except Exception:
-                pass
+        def __init__(self, player: TelemetryFilePlayerBase):
+            super().__init__()
+            self._player = player
 
-        lat = telemetry.get('gps_lat')
-        lon = telemetry.get('gps_lon')
-        alt = telemetry.get('alt_gps') or telemetry.get('alt_bmp')
-        if lat is not None and lon is not None:
+        def run(self) -> None:
             try:
-                t = _parse_ts_static(record.get('ts') or record.get('timestamp')) or time.time()
-                point = SimpleNamespace(t=t, lat=float(lat), lon=float(lon),
-                                        alt_expected=alt if alt is not None else 0.0,
-                                        alt_actual=alt if alt is not None else 0.0)
-                dispatch.trajectoryAppended.emit(point)
-            except Exception:
-                pass
-
+                records, timestamps = self._player._read_records()
+            except Exception as e:
+                print(f"⚠️  Could not load {self._player.file_path}: {e}")
+                records, timestamps = [], []
+            self.loaded.emit(records, timestamps)
 
-if _QT_AVAILABLE:
     # Use a plain Python class that owns a QTimer (avoid subclassing QObject)
     class TelemetryFilePlayer(TelemetryFilePlayerBase):
         """Qt QTimer-based telemetry player that can be attached as `window.data_source`.
@@ -181,6 +283,10 @@ if _QT_AVAILABLE:
             player = TelemetryFilePlayer(path, realtime=True)
             window.data_source = player
             # Buttons call player.start()/player.stop()
+
+        The file is read and parsed in a background QThread, so pressing
+        Start on a long flight log does not freeze the GUI; playback begins
+        when the records arrive (queued back to the GUI thread).
         """
 
         def __init__(self, file_path: str, realtime: bool = True, speed: float = 1.0,
@@ -203,6 +309,13 @@ if _QT_AVAILABLE:
             self._idx = 0
             # `_prev_ts` is not used in the QTimer player; removed to reduce unused state
 
+            # Background loading state. `_loader` is never read: it holds the
+            # parentless _RecordLoader so Python does not collect it (and
+            # the queued `loaded` delivery with it) while it runs.
+            self._load_thread: Optional[QThread] = None
+            self._loader: Optional[_RecordLoader] = None
+            self._play_when_loaded = False
+
         def start(self, restart: bool = False) -> None:
             """Start or resume playback.
 
@@ -210,9 +323,41 @@ if _QT_AVAILABLE:
             Otherwise, playback resumes from the current index where it was
             stopped (pause/resume behavior).
             """
-            # Load records into memory only if not loaded yet or if restart requested
+            # Load records only if not loaded yet or if restart requested;
+            # loading runs off the GUI thread and calls back into _begin()
             if not self.records or restart:
-                self.records = self._open_records()
+                self._play_when_loaded = True
+                if self._load_thread is None:
+                    self._start_loading()
+                return
+            self._begin(restart)
+
+        def _start_loading(self) -> None:
+            thread = QThread()
+            loader = _RecordLoader(self)
+            loader.moveToThread(thread)
+            thread.started.connect(loader.run)
+            # Queued: records are produced in the loader thread
+            loader.loaded.connect(self._on_loaded, Qt.ConnectionType.QueuedConnection)
+            # Direct: end the loader thread's event loop from the loader itself
+            loader.loaded.connect(thread.quit, Qt.ConnectionType.DirectConnection)
+            self._load_thread, self._loader = thread, loader
+            thread.start()
+
+        def _on_loaded(self, records: list, timestamps: list) -> None:
+            """Receive parsed records in the GUI thread and start playback."""
+            if self._load_thread is not None:
+                self._load_thread.wait()
+            self._load_thread = None
+            self._loader = None
+            self.records, self.timestamps = records, timestamps
+            if self._play_when_loaded:
+                self._play_when_loaded = False
+                # Freshly loaded records always play from the beginning
+                self._begin(True)
+
+        def _begin(self, restart: bool) -> None:
+            """Position the index and emit the first record (records loaded)."""
             if not self.records:
                 return
 
@@ -232,7 +377,9 @@ if _QT_AVAILABLE:
             self._on_timeout()
 
         def stop(self) -> None:
-            # Stop the timer but keep `self._idx` so playback can resume
+            # Stop the timer but keep `self._idx` so playback can resume.
+            # A load in progress still completes, but won't start playback.
+            self._play_when_loaded = False
             if self._timer.isActive():
                 self._timer.stop()
 
@@ -246,17 +393,17 @@ if _QT_AVAILABLE:
                     return
 
             rec = self.records[self._idx]
+            curr_ts = self.timestamps[self._idx]
             try:
-                self._emit_record(rec)
+                self._emit_record(rec, curr_ts)
             except Exception:
                 pass
 
-            # compute delay to next record
-            curr_ts = _parse_ts_static(rec.get('ts') or rec.get('timestamp'))
+            # compute delay to next record (timestamps pre-parsed at load)
             next_idx = self._idx + 1
             delay_ms = int(self.default_interval * 1000 / max(0.0001, self.speed))
             if self.realtime and curr_ts is not None and next_idx < len(self.records):
-                next_ts = _parse_ts_static(self.records[next_idx].get('ts') or self.records[next_idx].get('timestamp'))
+                next_ts = self.timestamps[next_idx]
                 if next_ts is not None and curr_ts is not None:
                     wait = max(0.0, (next_ts - curr_ts) / max(0.0001, self.speed))
                     delay_ms = int(wait * 1000)
@@ -292,7 +439,7 @@ else:
                 try:
                     # Load records if not yet loaded
                     if not self.records:
-                        self.records = self._open_records()
+                        self._load_records()
                     if not self.records:
                         return
 
@@ -301,14 +448,14 @@ else:
                     idx = self._idx
                     while idx < len(self.records) and not self._stop_event.is_set():
                         rec = self.records[idx]
-                        ts = _parse_ts_static(rec.get('ts') or rec.get('timestamp'))
+                        ts = self.timestamps[idx]
                         if self.realtime and ts is not None and prev_ts is not None:
                             wait = max(0.0, (ts - prev_ts) / max(0.0001, self.speed))
                             time.sleep(wait)
                         elif self.realtime and ts is None:
                             time.sleep(self.default_interval / max(0.0001, self.speed))
 
-                        self._emit_record(rec)
+                        self._emit_record(rec, ts)
                         prev_ts = ts or time.time()
                         idx += 1
                         # store idx as next-to-play so stop/resume works
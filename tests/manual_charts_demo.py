@@ -7,7 +7,6 @@ Usage:
 
 This script demonstrates the TrajectoryCharts widget with simulated data.
 """
-from types import SimpleNamespace
 import math
 import sys
 from PyQt6.QtCore import QTimer
@@ -16,10 +15,12 @@ from PyQt6.QtWidgets import QApplication
 # Import the widget from package
 try:
     from widgets.charts import TrajectoryCharts
+    from dispatcher import TrajectoryPoint
 except Exception:
     # Support running from project root where package path may differ
     sys.path.insert(0, "..")
     from widgets.charts import TrajectoryCharts
+    from dispatcher import TrajectoryPoint
 
 
 def main():
@@ -36,8 +37,10 @@ def main():
     def add_point():
         t[0] += 0.1
 
-        point = SimpleNamespace(
+        point = TrajectoryPoint(
             t=t[0],
+            lat=12.9716,
+            lon=77.5946,
             alt_expected=100 + t[0] * 2,  # Rising at 2 m/s
             alt_actual=100 + t[0] * 2 + math.sin(t[0]) * 5,  # With oscillation
         )
@@ -0,0 +1,818 @@
+# Form implementation generated from reading ui file 'dashboard.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(929, 761)
+        MainWindow.setMinimumSize(QtCore.QSize(0, 600))
+        MainWindow.setStyleSheet("/* ============================================================\n"
+"   GLOBAL UI THEME \n"
+"   ------------------------------------------------------------\n"
+"   This theme keeps everything simple, modern, and consistent.\n"
+"   Only well-chosen colors and spacing; no clutter.\n"
+"   ============================================================ */\n"
+"\n"
+"\n"
+"/* ===== ROOT WIDGET ===== */\n"
+"QWidget {\n"
+"    background-color: #f5f5f5;   /* soft grey background */\n"
+"    color: #222;                 /* dark readable text */\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== GROUP BOXES ===== */\n"
+"QGroupBox {\n"
+"    border: 1px solid #ccc;      /* subtle boundary */\n"
+"    border-radius: 4px;\n"
+"    margin-top: 8px;\n"
+"    padding-top: 10px;\n"
+"}\n"
+"\n"
+"QGroupBox::title {\n"
+"    color: #555;\n"
+"    padding: 0 4px;\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== TABLES ===== */\n"
+"QTableWidget, QTableView {\n"
+"    background: #fff;\n"
+"    border: 1px solid #ccc;\n"
+"    alternate-background-color: #f0f0f0;\n"
+"    selection-background-color: #b7d5f0; \n"
+"    gridline-color: #ddd;\n"
+"}\n"
+"\n"
+"QHeaderView::section {\n"
+"    background: #e6e6e6;\n"
+"    border: 1px solid #ccc;\n"
+"    padding: 4px;\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== BUTTONS ===== */\n"
+"QPushButton {\n"
+"    background: #f2f2f2;\n"
+"    border: 1px solid #bbb;\n"
+"    border-radius: 4px;\n"
+"    padding: 6px 12px;\n"
+"}\n"
+"\n"
+"QPushButton:hover { background: #e8e8e8; }\n"
+"QPushButton:pressed { background: #dcdcdc; }\n"
+"QPushButton:disabled {\n"
+"    background: #eaeaea;\n"
+"    color: #999;\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== LABELS ===== */\n"
+"QLabel {\n"
+"    background: transparent;\n"
+"    color: #222;\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== TEXT INPUTS ===== */\n"
+"QLineEdit {\n"
+"    background: #fff;\n"
+"    border: 1px solid #ccc;\n"
+"    border-radius: 3px;\n"
+"    padding: 4px;\n"
+"}\n"
+"\n"
+"QLineEdit:focus {\n"
+"    border-color: #4aa3ff;\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== COMBO BOXES ===== */\n"
+"QComboBox {\n"
+"    background: #f2f2f2;\n"
+"    border: 1px solid #bbb;\n"
+"    border-radius: 3px;\n"
+"    padding: 4px;\n"
+"}\n"
+"\n"
+"QComboBox:hover { background: #ebebeb; }\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #fff;\n"
+"    border: 1px solid #ccc;\n"
+"    selection-background-color: #b7d5f0;\n"
+"}\n"
+"\n"
+"\n"
+"/* ===== SCROLLBARS ===== */\n"
+"QScrollBar:vertical, QScrollBar:horizontal {\n"
+"    background: #f0f0f0;\n"
+"    border: none;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical, QScrollBar::handle:horizontal {\n"
+"    background: #bbb;\n"
+"    border-radius: 5px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:hover { background: #999; }\n"
+"\n"
+"\n"
+"/* ===== MENU & STATUS BAR ===== */\n"
+"QMenuBar {\n"
+"    background: #e8e8e8;\n"
+"    border-bottom: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"QMenuBar::item:selected {\n"
+"    background: #b7d5f0;\n"
+"}\n"
+"\n"
+"QMenu {\n"
+"    background: #fff;\n"
+"    border: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"QMenu::item:selected {\n"
+"    background: #b7d5f0;\n"
+"}\n"
+"\n"
+"QStatusBar {\n"
+"    background: #efefef;\n"
+"    border-top: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"\n"
+"/* ============================================================\n"
+"   STATUS LED INDICATORS — Clean Circle Style\n"
+"   ------------------------------------------------------------\n"
+"   These widgets override QLabel rules and stay perfectly round.\n"
+"   Controlled using the dynamic \"status\" property:\n"
+"       inactive / ok / warning / error\n"
+"   ============================================================ */\n"
+"\n"
+"StatusLED {\n"
+"    all: unset;                      /* reset inherited QLabel styling */\n"
+"    min-width: 18px;\n"
+"    min-height: 18px;\n"
+"    max-width: 18px;\n"
+"    max-height: 18px;\n"
+"    border-radius: 9px;              /* perfect circle */\n"
+"    background-color: transparent;\n"
+"    border: 1px solid #aaa;          /* inactive */\n"
+"}\n"
+"\n"
+"/* color states */\n"
+"StatusLED[status=\"ok\"]       { background-color: #4CAF50; border: none; }\n"
+"StatusLED[status=\"warning\"]  { background-color: #FFC107; border: none; }\n"
+"StatusLED[status=\"error\"]    { background-color: #F44336; border: none; }\n"
+"StatusLED[status=\"inactive\"] { background-color: transparent; border: 1px solid #aaa; }\n"
+"")
+        MainWindow.setUnifiedTitleAndToolBarOnMac(False)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setStyleSheet("/* ===== BASE WIDGET ===== */\n"
+"QWidget {\n"
+"    background-color: #f4f4f4;\n"
+"    color: #222;\n"
+"}\n"
+"\n"
+"/* ===== GROUP BOXES ===== */\n"
+"QGroupBox {\n"
+"    border: 1px solid #ccc;\n"
+"    margin-top: 6px;\n"
+"    border-radius: 3px;\n"
+"    padding-top: 10px;\n"
+"}\n"
+"\n"
+"QGroupBox::title {\n"
+"    subcontrol-origin: margin;\n"
+"    left: 8px;\n"
+"    padding: 0 4px;\n"
+"    color: #444;\n"
+"}\n"
+"\n"
+"/* ===== TABLES ===== */\n"
+"QTableView, QTableWidget {\n"
+"    gridline-color: #ddd;\n"
+"    background: #ffffff;\n"
+"    alternate-background-color: #f0f0f0;\n"
+"    selection-background-color: #b7d5f0; \n"
+"    border: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"QTableWidget::item, QTableView::item {\n"
+"    padding: 4px;\n"
+"}\n"
+"\n"
+"QHeaderView::section {\n"
+"    background: #e6e6e6;\n"
+"    color: #333;\n"
+"    padding: 3px;\n"
+"    border: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"/* ===== BUTTONS ===== */\n"
+"QPushButton {\n"
+"    background: #f2f2f2;\n"
+"    border: 1px solid #bbb;\n"
+"    border-radius: 4px;\n"
+"    padding: 6px 12px;\n"
+"    color: #222;\n"
+"}\n"
+"\n"
+"QPushButton:hover {\n"
+"    background: #e8e8e8;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background: #dcdcdc;\n"
+"}\n"
+"\n"
+"QPushButton:disabled {\n"
+"    background: #eeeeee;\n"
+"    color: #999;\n"
+"    border: 1px solid #ddd;\n"
+"}\n"
+"\n"
+"/* ===== SENSOR HEALTH INDICATORS ===== */\n"
+"QLabel.health-dot {\n"
+"    min-width: 20px;\n"
+"    max-width: 20px;\n"
+"    min-height: 20px;\n"
+"    max-height: 20px;\n"
+"    border-radius: 7px;\n"
+"    margin: 0px 3px;\n"
+"}\n"
+"\n"
+"/* Sensor name labels */\n"
+"QLabel.sensor-name {\n"
+"    color: #555;\n"
+"    font-size: 10pt;\n"
+"    padding: 0px 3px;\n"
+"}\n"
+"\n"
+"/* ===== PROGRESS BARS (CPU/Memory) ===== */\n"
+"QProgressBar {\n"
+"    border: 1px solid #ccc;\n"
+"    border-radius: 3px;\n"
+"    background: #ffffff;\n"
+"    text-align: center;\n"
+"    color: #333;\n"
+"    height: 22px;\n"
+"}\n"
+"\n"
+"QProgressBar::chunk {\n"
+"    background-color: #4aa3ff;\n"
+"    border-radius: 2px;\n"
+"}\n"
+"\n"
+"/* ===== LABELS ===== */\n"
+"QLabel {\n"
+"    color: #222;\n"
+"    background: transparent;\n"
+"}\n"
+"\n"
+"/* ===== SCROLLBAR ===== */\n"
+"QScrollBar:vertical {\n"
+"    border: none;\n"
+"    background: #f0f0f0;\n"
+"    width: 10px;\n"
+"    margin: 0px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical {\n"
+"    background: #bbb;\n"
+"    min-height: 20px;\n"
+"    border-radius: 5px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical:hover {\n"
+"    background: #999;\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical,\n"
+"QScrollBar::sub-line:vertical {\n"
+"    height: 0px;\n"
+"}\n"
+"\n"
+"QScrollBar:horizontal {\n"
+"    border: none;\n"
+"    background: #f0f0f0;\n"
+"    height: 10px;\n"
+"    margin: 0px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:horizontal {\n"
+"    background: #bbb;\n"
+"    min-width: 20px;\n"
+"    border-radius: 5px;\n"
+"}\n"
+"\n"
+"QScrollBar::handle:horizontal:hover {\n"
+"    background: #999;\n"
+"}\n"
+"\n"
+"/* ===== LINE EDIT ===== */\n"
+"QLineEdit {\n"
+"    background: #ffffff;\n"
+"    border: 1px solid #ccc;\n"
+"    border-radius: 3px;\n"
+"    padding: 4px;\n"
+"    color: #222;\n"
+"    selection-background-color: #b7d5f0;\n"
+"}\n"
+"\n"
+"QLineEdit:focus {\n"
+"    border: 1px solid #4aa3ff;\n"
+"}\n"
+"\n"
+"/* ===== COMBO BOX ===== */\n"
+"QComboBox {\n"
+"    background: #f2f2f2;\n"
+"    border: 1px solid #bbb;\n"
+"    border-radius: 3px;\n"
+"    padding: 4px;\n"
+"    color: #222;\n"
+"}\n"
+"\n"
+"QComboBox:hover {\n"
+"    background: #ebebeb;\n"
+"}\n"
+"\n"
+"QComboBox::drop-down {\n"
+"    border: none;\n"
+"    width: 20px;\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    background: #ffffff;\n"
+"    border: 1px solid #ccc;\n"
+"    selection-background-color: #b7d5f0;\n"
+"    color: #222;\n"
+"}\n"
+"\n"
+"/* ===== SPLITTER ===== */\n"
+"QSplitter::handle {\n"
+"    background: #ccc;\n"
+"}\n"
+"\n"
+"QSplitter::handle:horizontal {\n"
+"    width: 2px;\n"
+"}\n"
+"\n"
+"QSplitter::handle:vertical {\n"
+"    height: 2px;\n"
+"}\n"
+"\n"
+"QSplitter::handle:hover {\n"
+"    background: #bbb;\n"
+"}\n"
+"\n"
+"/* ===== TOOLTIP ===== */\n"
+"QToolTip {\n"
+"    background: #f2f2f2;\n"
+"    border: 1px solid #999;\n"
+"    color: #222;\n"
+"    padding: 4px;\n"
+"    border-radius: 3px;\n"
+"}\n"
+"\n"
+"/* ===== MENU BAR ===== */\n"
+"QMenuBar {\n"
+"    background: #e8e8e8;\n"
+"    color: #222;\n"
+"    border-bottom: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"QMenuBar::item:selected {\n"
+"    background: #b7d5f0;\n"
+"}\n"
+"\n"
+"QMenu {\n"
+"    background: #ffffff;\n"
+"    border: 1px solid #ccc;\n"
+"    color: #222;\n"
+"}\n"
+"\n"
+"QMenu::item:selected {\n"
+"    background: #b7d5f0;\n"
+"}\n"
+"\n"
+"/* ===== STATUS BAR ===== */\n"
+"QStatusBar {\n"
+"    background: #f0f0f0;\n"
+"    color: #666;\n"
+"    border-top: 1px solid #ccc;\n"
+"}\n"
+"\n"
+"/* ===== PROTECT CUSTOM StatusLED FROM GENERIC QLabel RULES ===== */\n"
+"\n"
+"StatusLED {\n"
+"    all: unset;\n"
+"    min-width: 18px;\n"
+"    min-height: 18px;\n"
+"    max-width: 18px;\n"
+"    max-height: 18px;\n"
+"    border-radius: 9px;\n"
+"    background-color: transparent;\n"
+"    border: 1px solid #aaa;\n"
+"}\n"
+"")
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_main = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_main.setContentsMargins(10, 10, 10, 10)
+        self.horizontalLayout_main.setSpacing(2)
+        self.horizontalLayout_main.setObjectName("horizontalLayout_main")
+        self.telemetryGroup = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.telemetryGroup.setMouseTracking(False)
+        self.telemetryGroup.setTabletTracking(False)
+        self.telemetryGroup.setStyleSheet("")
+        self.telemetryGroup.setObjectName("telemetryGroup")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.telemetryGroup)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.previousTelemetryTable = QtWidgets.QTableView(parent=self.telemetryGroup)
+        self.previousTelemetryTable.setStyleSheet("")
+        self.previousTelemetryTable.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustToContentsOnFirstShow)
+        self.previousTelemetryTable.setAlternatingRowColors(True)
+        self.previousTelemetryTable.setSortingEnabled(True)
+        self.previousTelemetryTable.setObjectName("previousTelemetryTable")
+        self.verticalLayout_2.addWidget(self.previousTelemetryTable)
+        self.telemetryTrackGroup = QtWidgets.QGroupBox(parent=self.telemetryGroup)
+        self.telemetryTrackGroup.setObjectName("telemetryTrackGroup")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.telemetryTrackGroup)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.telemetryTrackTable = QtWidgets.QTableView(parent=self.telemetryTrackGroup)
+        self.telemetryTrackTable.setSortingEnabled(True)
+        self.telemetryTrackTable.setObjectName("telemetryTrackTable")
+        self.telemetryTrackTable.horizontalHeader().setSortIndicatorShown(True)
+        self.verticalLayout_6.addWidget(self.telemetryTrackTable)
+        self.verticalLayout_2.addWidget(self.telemetryTrackGroup)
+        self.verticalLayout_2.setStretch(0, 3)
+        self.verticalLayout_2.setStretch(1, 2)
+        self.horizontalLayout_main.addWidget(self.telemetryGroup)
+        self.controlWidgetGroup = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.controlWidgetGroup.setFlat(False)
+        self.controlWidgetGroup.setObjectName("controlWidgetGroup")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.controlWidgetGroup)
+        self.verticalLayout_3.setContentsMargins(5, 5, 5, 2)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.controlsGroup = QtWidgets.QGroupBox(parent=self.controlWidgetGroup)
+        self.controlsGroup.setMaximumSize(QtCore.QSize(16777215, 100))
+        self.controlsGroup.setObjectName("controlsGroup")
+        self.gridLayout = QtWidgets.QGridLayout(self.controlsGroup)
+        self.gridLayout.setContentsMargins(2, 0, 2, 0)
+        self.gridLayout.setSpacing(0)
+        self.gridLayout.setObjectName("gridLayout")
+        self.startButton = QtWidgets.QPushButton(parent=self.controlsGroup)
+        self.startButton.setObjectName("startButton")
+        self.gridLayout.addWidget(self.startButton, 0, 0, 1, 1)
+        self.stopButton = QtWidgets.QPushButton(parent=self.controlsGroup)
+        self.stopButton.setObjectName("stopButton")
+        self.gridLayout.addWidget(self.stopButton, 0, 1, 1, 1)
+        self.clearButton = QtWidgets.QPushButton(parent=self.controlsGroup)
+        self.clearButton.setObjectName("clearButton")
+        self.gridLayout.addWidget(self.clearButton, 1, 0, 1, 1)
+        self.cameraButton = QtWidgets.QPushButton(parent=self.controlsGroup)
+        self.cameraButton.setObjectName("cameraButton")
+        self.gridLayout.addWidget(self.cameraButton, 1, 1, 1, 1)
+        self.verticalLayout_3.addWidget(self.controlsGroup)
+        self.sensorsHealthGroup = QtWidgets.QGroupBox(parent=self.controlWidgetGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sensorsHealthGroup.sizePolicy().hasHeightForWidth())
+        self.sensorsHealthGroup.setSizePolicy(sizePolicy)
+        self.sensorsHealthGroup.setMaximumSize(QtCore.QSize(16777215, 120))
+        self.sensorsHealthGroup.setStyleSheet("/* ==== UNIVERSAL STATUS LED STYLE ==== */\n"
+"\n"
+"/* Base circle — applied to all indicators */\n"
+"StatusLED, *[objectName$=\"Indicator\"] {\n"
+"    min-width: 18px;\n"
+"    min-height: 18px;\n"
+"    max-width: 18px;\n"
+"    max-height: 18px;\n"
+"\n"
+"     border-radius: 9px;     /* circular shape */\n"
+"     background-color: transparent; \n"
+"     border: 1px solid #aaa;  /* default inactive */\n"
+"     margin: 0; \n"
+"     padding: 0;\n"
+"}\n"
+"\n"
+"/* 🟢 OK */\n"
+"StatusLED[status=\"ok\"], *[objectName$=\"Indicator\"][status=\"ok\"] {\n"
+"    background-color: #4CAF50;\n"
+"    border: none;\n"
+"}\n"
+"\n"
+"/* 🟠 WARNING */\n"
+"StatusLED[status=\"warning\"], *[objectName$=\"Indicator\"][status=\"warning\"] {\n"
+"    background-color: #FFC107;\n"
+"    border: none;\n"
+"}\n"
+"\n"
+"/* 🔴 ERROR */\n"
+"StatusLED[status=\"error\"], *[objectName$=\"Indicator\"][status=\"error\"] {\n"
+"    background-color: #F44336;\n"
+"    border: none;\n"
+"}\n"
+"\n"
+"/* ⚪ INACTIVE */\n"
+"StatusLED[status=\"inactive\"], *[objectName$=\"Indicator\"][status=\"inactive\"] {\n"
+"    background-color: transparent;\n"
+"    border: 1px solid #aaa;\n"
+"}\n"
+"\n"
+"\n"
+"")
+        self.sensorsHealthGroup.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.sensorsHealthGroup.setObjectName("sensorsHealthGroup")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.sensorsHealthGroup)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.mpu6050Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.mpu6050Label.setObjectName("mpu6050Label")
+        self.gridLayout_2.addWidget(self.mpu6050Label, 1, 0, 1, 1)
+        self.mq131Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.mq131Indicator.sizePolicy().hasHeightForWidth())
+        self.mq131Indicator.setSizePolicy(sizePolicy)
+        self.mq131Indicator.setStyleSheet("")
+        self.mq131Indicator.setText("")
+        self.mq131Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.mq131Indicator.setObjectName("mq131Indicator")
+        self.gridLayout_2.addWidget(self.mq131Indicator, 0, 5, 1, 1)
+        self.mq7Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.mq7Label.setObjectName("mq7Label")
+        self.gridLayout_2.addWidget(self.mq7Label, 2, 2, 1, 1)
+        self.loRaIndicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.loRaIndicator.sizePolicy().hasHeightForWidth())
+        self.loRaIndicator.setSizePolicy(sizePolicy)
+        self.loRaIndicator.setText("")
+        self.loRaIndicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.loRaIndicator.setObjectName("loRaIndicator")
+        self.gridLayout_2.addWidget(self.loRaIndicator, 3, 3, 1, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.mpu6050Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.mpu6050Indicator.sizePolicy().hasHeightForWidth())
+        self.mpu6050Indicator.setSizePolicy(sizePolicy)
+        self.mpu6050Indicator.setStyleSheet("")
+        self.mpu6050Indicator.setText("")
+        self.mpu6050Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.mpu6050Indicator.setObjectName("mpu6050Indicator")
+        self.gridLayout_2.addWidget(self.mpu6050Indicator, 1, 1, 1, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.gpsLabel = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.gpsLabel.setObjectName("gpsLabel")
+        self.gridLayout_2.addWidget(self.gpsLabel, 1, 2, 1, 1)
+        self.bmp180Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.bmp180Indicator.sizePolicy().hasHeightForWidth())
+        self.bmp180Indicator.setSizePolicy(sizePolicy)
+        self.bmp180Indicator.setStyleSheet("")
+        self.bmp180Indicator.setText("")
+        self.bmp180Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.bmp180Indicator.setObjectName("bmp180Indicator")
+        self.gridLayout_2.addWidget(self.bmp180Indicator, 0, 1, 1, 1)
+        self.bmsLabel = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.bmsLabel.setObjectName("bmsLabel")
+        self.gridLayout_2.addWidget(self.bmsLabel, 3, 4, 1, 1)
+        self.max6675Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.max6675Indicator.sizePolicy().hasHeightForWidth())
+        self.max6675Indicator.setSizePolicy(sizePolicy)
+        self.max6675Indicator.setText("")
+        self.max6675Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.max6675Indicator.setObjectName("max6675Indicator")
+        self.gridLayout_2.addWidget(self.max6675Indicator, 3, 1, 1, 1)
+        self.bmsIndicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.bmsIndicator.sizePolicy().hasHeightForWidth())
+        self.bmsIndicator.setSizePolicy(sizePolicy)
+        self.bmsIndicator.setText("")
+        self.bmsIndicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.bmsIndicator.setObjectName("bmsIndicator")
+        self.gridLayout_2.addWidget(self.bmsIndicator, 3, 5, 1, 1)
+        self.max6675Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.max6675Label.setObjectName("max6675Label")
+        self.gridLayout_2.addWidget(self.max6675Label, 3, 0, 1, 1)
+        self.rtcIndicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.rtcIndicator.sizePolicy().hasHeightForWidth())
+        self.rtcIndicator.setSizePolicy(sizePolicy)
+        self.rtcIndicator.setStyleSheet("")
+        self.rtcIndicator.setText("")
+        self.rtcIndicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.rtcIndicator.setObjectName("rtcIndicator")
+        self.gridLayout_2.addWidget(self.rtcIndicator, 2, 5, 1, 1, QtCore.Qt.AlignmentFlag.AlignHCenter|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.dht22Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.dht22Indicator.sizePolicy().hasHeightForWidth())
+        self.dht22Indicator.setSizePolicy(sizePolicy)
+        self.dht22Indicator.setStyleSheet("")
+        self.dht22Indicator.setText("")
+        self.dht22Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.dht22Indicator.setObjectName("dht22Indicator")
+        self.gridLayout_2.addWidget(self.dht22Indicator, 2, 1, 1, 1)
+        self.mq2Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.mq2Label.setObjectName("mq2Label")
+        self.gridLayout_2.addWidget(self.mq2Label, 1, 4, 1, 1)
+        self.esp32Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.esp32Label.setObjectName("esp32Label")
+        self.gridLayout_2.addWidget(self.esp32Label, 0, 2, 1, 1)
+        self.esp32Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.esp32Indicator.sizePolicy().hasHeightForWidth())
+        self.esp32Indicator.setSizePolicy(sizePolicy)
+        self.esp32Indicator.setStyleSheet("")
+        self.esp32Indicator.setText("")
+        self.esp32Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.esp32Indicator.setObjectName("esp32Indicator")
+        self.gridLayout_2.addWidget(self.esp32Indicator, 0, 3, 1, 1)
+        self.mq7Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.mq7Indicator.sizePolicy().hasHeightForWidth())
+        self.mq7Indicator.setSizePolicy(sizePolicy)
+        self.mq7Indicator.setStyleSheet("")
+        self.mq7Indicator.setText("")
+        self.mq7Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.mq7Indicator.setObjectName("mq7Indicator")
+        self.gridLayout_2.addWidget(self.mq7Indicator, 2, 3, 1, 1)
+        self.gpsIndicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.gpsIndicator.sizePolicy().hasHeightForWidth())
+        self.gpsIndicator.setSizePolicy(sizePolicy)
+        self.gpsIndicator.setStyleSheet("")
+        self.gpsIndicator.setText("")
+        self.gpsIndicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.gpsIndicator.setObjectName("gpsIndicator")
+        self.gridLayout_2.addWidget(self.gpsIndicator, 1, 3, 1, 1)
+        self.dht22Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.dht22Label.setObjectName("dht22Label")
+        self.gridLayout_2.addWidget(self.dht22Label, 2, 0, 1, 1)
+        self.bmp180Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.bmp180Label.setObjectName("bmp180Label")
+        self.gridLayout_2.addWidget(self.bmp180Label, 0, 0, 1, 1)
+        self.rtcLabel = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.rtcLabel.setObjectName("rtcLabel")
+        self.gridLayout_2.addWidget(self.rtcLabel, 2, 4, 1, 1)
+        self.loRaLabel = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.loRaLabel.setObjectName("loRaLabel")
+        self.gridLayout_2.addWidget(self.loRaLabel, 3, 2, 1, 1)
+        self.mq2Indicator = StatusLED(parent=self.sensorsHealthGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.mq2Indicator.sizePolicy().hasHeightForWidth())
+        self.mq2Indicator.setSizePolicy(sizePolicy)
+        self.mq2Indicator.setStyleSheet("")
+        self.mq2Indicator.setText("")
+        self.mq2Indicator.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.mq2Indicator.setObjectName("mq2Indicator")
+        self.gridLayout_2.addWidget(self.mq2Indicator, 1, 5, 1, 1)
+        self.mq131Label = QtWidgets.QLabel(parent=self.sensorsHealthGroup)
+        self.mq131Label.setObjectName("mq131Label")
+        self.gridLayout_2.addWidget(self.mq131Label, 0, 4, 1, 1)
+        self.verticalLayout_3.addWidget(self.sensorsHealthGroup)
+        self.computerHealthGroup = QtWidgets.QGroupBox(parent=self.controlWidgetGroup)
+        self.computerHealthGroup.setMaximumSize(QtCore.QSize(16777215, 120))
+        self.computerHealthGroup.setObjectName("computerHealthGroup")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.computerHealthGroup)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setContentsMargins(8, 12, 8, 8)
+        self.horizontalLayout_2.setSpacing(20)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.cpuGaugeWidget = LinearGauge(parent=self.computerHealthGroup)
+        self.cpuGaugeWidget.setMinimumSize(QtCore.QSize(70, 70))
+        self.cpuGaugeWidget.setObjectName("cpuGaugeWidget")
+        self.horizontalLayout_2.addWidget(self.cpuGaugeWidget)
+        self.memGaugeWidget = LinearGauge(parent=self.computerHealthGroup)
+        self.memGaugeWidget.setMinimumSize(QtCore.QSize(70, 70))
+        self.memGaugeWidget.setObjectName("memGaugeWidget")
+        self.horizontalLayout_2.addWidget(self.memGaugeWidget)
+        self.horizontalLayout_3.addLayout(self.horizontalLayout_2)
+        self.verticalLayout_3.addWidget(self.computerHealthGroup)
+        self.latestReadingsGroup = QtWidgets.QGroupBox(parent=self.controlWidgetGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.latestReadingsGroup.sizePolicy().hasHeightForWidth())
+        self.latestReadingsGroup.setSizePolicy(sizePolicy)
+        self.latestReadingsGroup.setObjectName("latestReadingsGroup")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.latestReadingsGroup)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.latestReadingsTable = QtWidgets.QTableView(parent=self.latestReadingsGroup)
+        self.latestReadingsTable.setAlternatingRowColors(True)
+        self.latestReadingsTable.setSortingEnabled(True)
+        self.latestReadingsTable.setObjectName("latestReadingsTable")
+        self.verticalLayout_4.addWidget(self.latestReadingsTable)
+        self.verticalLayout_3.addWidget(self.latestReadingsGroup)
+        self.verticalLayout_3.setStretch(0, 1)
+        self.verticalLayout_3.setStretch(1, 2)
+        self.verticalLayout_3.setStretch(2, 1)
+        self.verticalLayout_3.setStretch(3, 4)
+        self.horizontalLayout_main.addWidget(self.controlWidgetGroup)
+        self.trajectoryGroup = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.trajectoryGroup.setObjectName("trajectoryGroup")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.trajectoryGroup)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.trajectoryChartsWidget = TrajectoryCharts(parent=self.trajectoryGroup)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.trajectoryChartsWidget.sizePolicy().hasHeightForWidth())
+        self.trajectoryChartsWidget.setSizePolicy(sizePolicy)
+        self.trajectoryChartsWidget.setStyleSheet("")
+        self.trajectoryChartsWidget.setObjectName("trajectoryChartsWidget")
+        self.verticalLayout_5.addWidget(self.trajectoryChartsWidget)
+        self.horizontalLayout_main.addWidget(self.trajectoryGroup)
+        self.horizontalLayout_main.setStretch(0, 1)
+        self.horizontalLayout_main.setStretch(1, 1)
+        self.horizontalLayout_main.setStretch(2, 2)
+        self.verticalLayout.addLayout(self.horizontalLayout_main)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 929, 33))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.telemetryGroup.setTitle(_translate("MainWindow", "Previous Telemetry"))
+        self.telemetryTrackGroup.setTitle(_translate("MainWindow", "Telemetry Track"))
+        self.controlWidgetGroup.setTitle(_translate("MainWindow", "Controls & Sensors"))
+        self.controlsGroup.setTitle(_translate("MainWindow", "Controls"))
+        self.startButton.setText(_translate("MainWindow", "Start Stream"))
+        self.stopButton.setText(_translate("MainWindow", "Stop Stream"))
+        self.clearButton.setText(_translate("MainWindow", "Clear Trajectory"))
+        self.cameraButton.setText(_translate("MainWindow", "Open Camera"))
+        self.sensorsHealthGroup.setTitle(_translate("MainWindow", "Sensors Health"))
+        self.mpu6050Label.setText(_translate("MainWindow", "MPU6050"))
+        self.mq131Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.mq7Label.setText(_translate("MainWindow", "MQ7"))
+        self.loRaIndicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.mpu6050Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.gpsLabel.setText(_translate("MainWindow", "GPS"))
+        self.bmp180Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.bmsLabel.setText(_translate("MainWindow", "BMS"))
+        self.max6675Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.bmsIndicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.max6675Label.setText(_translate("MainWindow", "MAX6675"))
+        self.rtcIndicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.dht22Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.mq2Label.setText(_translate("MainWindow", "MQ2"))
+        self.esp32Label.setText(_translate("MainWindow", "ESP32"))
+        self.esp32Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.mq7Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.gpsIndicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.dht22Label.setText(_translate("MainWindow", "DHT22"))
+        self.bmp180Label.setText(_translate("MainWindow", "BMP180"))
+        self.rtcLabel.setText(_translate("MainWindow", "RTC"))
+        self.loRaLabel.setText(_translate("MainWindow", "LoRa Radio"))
+        self.mq2Indicator.setProperty("status", _translate("MainWindow", "inactive"))
+        self.mq131Label.setText(_translate("MainWindow", "MQ131"))
+        self.computerHealthGroup.setTitle(_translate("MainWindow", "Computer Health"))
+        self.latestReadingsGroup.setTitle(_translate("MainWindow", "Latest Readings"))
+        self.trajectoryGroup.setTitle(_translate("MainWindow", "Trajectory (Expected vs Actual)"))
+from widgets.charts import TrajectoryCharts
+from widgets.gauge import LinearGauge
+from widgets.status_led import StatusLED
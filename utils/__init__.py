@@ -7,19 +7,19 @@ providing helper functions for UI loading, widget finding, and other
 common operations.
 
 Utility Modules:
-    ui_loader: Functions for loading Qt Designer .ui files and stylesheets
+    ui_loader: Functions for building the UI (compiled or .ui) and loading stylesheets
     widget_finder: Helper class for finding widgets in loaded UI
 
 Usage:
-    from utils import load_ui_file, load_stylesheet, WidgetFinder
+    from utils import setup_ui, load_ui_file, load_stylesheet, WidgetFinder
 
 Author: Dyumna137
 Date: 2025-11-06 23:53:59 UTC
 Version: 1.0
 """
 
-from .ui_loader import load_ui_file, load_stylesheet
+from .ui_loader import setup_ui, load_ui_file, load_stylesheet
 from .widget_finder import WidgetFinder
 
-__all__ = ['load_ui_file', 'load_stylesheet', 'WidgetFinder']
+__all__ = ['setup_ui', 'load_ui_file', 'load_stylesheet', 'WidgetFinder']
 __version__ = '1.0.0'
\ No newline at end of file
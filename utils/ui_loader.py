@@ -14,6 +14,10 @@ Key Features:
     • Verbose logging for debugging
 
 Functions:
+    setup_ui(window, ui_filename, compiled_module) -> Optional[object]
+        Build the UI from the pyuic6-compiled module when it is up to date,
+        falling back to runtime .ui loading otherwise.
+
     load_ui_file(window, ui_filename, search_paths) -> Path
         Load a Qt Designer .ui file into a QMainWindow with smart path resolution.
     
@@ -42,11 +46,86 @@ Version: 2.0
 """
 
 from __future__ import annotations
+import importlib
+import logging
+import os
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from PyQt6 import uic
 from PyQt6.QtWidgets import QMainWindow
 
+# (qss_filename, subdirectory) -> stylesheet text, for default-path loads.
+# Repeated load_stylesheet() calls in one process (a second window, main()
+# run again from a shell) skip the path probes and the file read.
+_QSS_CACHE: Dict[Tuple[str, str], str] = {}
+
+# Success messages are debug-level (silent unless the app enables debug
+# logging); problems are warnings and still reach stderr by default.
+log = logging.getLogger(__name__)
+
+
+def setup_ui(
+    window: QMainWindow,
+    ui_filename: str = "dashboard.ui",
+    compiled_module: str = "ui_dashboard",
+) -> Optional[object]:
+    """
+    Build the window's UI from precompiled Python, or load the .ui at runtime.
+    
+    `uic.loadUi()` parses the Designer XML and instantiates every widget by
+    reflection on each startup. The same form compiled with pyuic6 is plain
+    Python that constructs the widgets directly, so it is preferred when
+    available and current.
+    
+    Regenerate the compiled module after editing the .ui file:
+        pyuic6 dashboard.ui -o ui_dashboard.py
+    
+    Args:
+        window: The QMainWindow to populate
+        ui_filename: Designer file used for the runtime fallback and for the
+                    staleness check (default: "dashboard.ui")
+        compiled_module: Module name of the pyuic6 output (default: "ui_dashboard")
+    
+    Returns:
+        The generated ``Ui_MainWindow`` instance when the compiled module was
+        used (widgets are also reachable via findChild()), or None when the
+        runtime fallback loaded the .ui file.
+    
+    Fallback to load_ui_file() happens when:
+        • DASHBOARD_UI_RUNTIME=1 is set (useful while editing in Designer)
+        • The compiled module cannot be imported (tried as a top-level
+          module, then from the dashboardGUI package)
+        • The .ui file is newer than the compiled module (stale output)
+    """
+    if os.getenv("DASHBOARD_UI_RUNTIME", "").lower() not in ("1", "true", "yes"):
+        module = None
+        # Same fallback as the app's own imports: top-level module when run
+        # as a script, dashboardGUI.<module> when installed as a package
+        for name in (compiled_module, f"dashboardGUI.{compiled_module}"):
+            try:
+                module = importlib.import_module(name)
+                break
+            except ImportError:
+                continue
+
+        if module is not None:
+            ui_path = Path(module.__file__).with_name(ui_filename)
+            try:
+                stale = ui_path.stat().st_mtime > Path(module.__file__).stat().st_mtime
+            except OSError:
+                stale = False
+            if stale:
+                log.warning("%s.py is older than %s - loading .ui at runtime",
+                            compiled_module, ui_filename)
+            else:
+                ui = module.Ui_MainWindow()
+                ui.setupUi(window)
+                log.debug("Built UI from compiled module: %s", compiled_module)
+                return ui
+
+    load_ui_file(window, ui_filename)
+    return None
+
 
 def load_ui_file(
     window: QMainWindow,
@@ -155,7 +234,7 @@ def load_ui_file(
         raise FileNotFoundError(error_msg)
     
     # === STEP 4: Load the UI file ===
-    print(f"✓ Loading UI from: {ui_path.absolute()}")
+    log.debug("Loading UI from: %s", ui_path.absolute())
     
     # Convert Path to string for uic.loadUi() compatibility
     # loadUi() modifies 'window' in-place, adding all widgets as attributes
@@ -177,7 +256,7 @@ def load_stylesheet(
     searches multiple common locations for the stylesheet file and returns
     its contents as a string ready to apply with QApplication.setStyleSheet().
     
-    The function is non-fatal: if the stylesheet is not found, it prints
+    The function is non-fatal: if the stylesheet is not found, it logs
     warnings but returns None, allowing the application to continue with
     default Qt styling.
     
@@ -197,7 +276,7 @@ def load_stylesheet(
              QApplication.setStyleSheet() or QWidget.setStyleSheet().
              
         None: If the stylesheet file cannot be found or cannot be read.
-              Warnings are printed but no exception is raised.
+              Warnings are logged but no exception is raised.
     
     Example:
         Basic usage:
@@ -234,7 +313,11 @@ def load_stylesheet(
         2. Opens file with UTF-8 encoding (supports unicode)
         3. Reads entire file into memory (safe for typical 10-100KB stylesheets)
         4. Returns string ready for setStyleSheet()
-        5. Prints warnings but doesn't crash on errors
+        5. Logs warnings but doesn't crash on errors
+        
+        Successful loads from the default search paths are cached per
+        (qss_filename, subdirectory) for the rest of the process; later
+        calls return the cached text without touching the filesystem.
     
     See Also:
         load_ui_file(): For loading Qt Designer .ui files
@@ -242,7 +325,12 @@ def load_stylesheet(
         QWidget.setStyleSheet(): To apply stylesheet to specific widget
     """
     # === STEP 1: Determine search paths ===
+    cache_key = None
     if search_paths is None:
+        cache_key = (qss_filename, subdirectory)
+        cached = _QSS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
         search_paths = [
             # Path 1: Current working directory + subdirectory
             # Example: ./styles/dark.qss
@@ -266,11 +354,10 @@ def load_stylesheet(
     
     # === STEP 3: Handle file not found (non-fatal) ===
     if qss_path is None:
-        print(f"⚠️  Warning: Could not find '{qss_filename}' in '{subdirectory}/' directory")
-        print("    Dashboard will use default Qt styling.")
-        print("    Searched in:")
-        for p in search_paths:
-            print(f"    • {p.absolute()}")
+        log.warning(
+            "Could not find '%s' in '%s/' directory; using default Qt styling. "
+            "Searched in: %s",
+            qss_filename, subdirectory, ", ".join(str(p.absolute()) for p in search_paths))
         return None
     
     # === STEP 4: Load and return stylesheet content ===
@@ -279,20 +366,21 @@ def load_stylesheet(
         with open(qss_path, "r", encoding="utf-8") as f:
             content = f.read()
         
-        print(f"✓ Loaded stylesheet from: {qss_path.absolute()}")
-        print(f"  ({len(content)} bytes, {content.count(chr(10))} lines)")
+        log.debug("Loaded stylesheet from: %s (%d bytes)", qss_path.absolute(), len(content))
         
+        if cache_key is not None:
+            _QSS_CACHE[cache_key] = content
         return content
         
     except IOError as e:
         # Handle file read errors (permissions, disk errors, etc.)
-        print(f"⚠️  Error reading stylesheet from {qss_path}: {e}")
+        log.warning("Error reading stylesheet from %s: %s", qss_path, e)
         return None
         
     except UnicodeDecodeError as e:
         # Handle encoding errors (file not UTF-8)
-        print(f"⚠️  Encoding error reading stylesheet from {qss_path}: {e}")
-        print("    Hint: Ensure file is saved with UTF-8 encoding")
+        log.warning("Encoding error reading stylesheet from %s: %s "
+                    "(ensure the file is saved as UTF-8)", qss_path, e)
         return None
 
 
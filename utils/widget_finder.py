@@ -115,11 +115,14 @@ class WidgetFinder:
         • Widget object names must match Qt Designer exactly (case-sensitive)
         
     Technical Details:
-        The class uses QObject.findChild() which performs a recursive search
-        through the widget hierarchy. For large UIs with many widgets, consider:
+        On the first lookup the class walks the widget hierarchy once with
+        findChildren(QWidget) and indexes every widget by objectName. All
+        later lookups are O(1) dict hits instead of a recursive findChild()
+        walk per name. For large UIs, still consider:
         1. Finding widgets once in __init__() and storing references
         2. Using silent=True for optional widgets
         3. Checking for None before using widgets
+        4. Calling refresh() if widgets are created after the first lookup
     """
     
     def __init__(self, parent: QWidget, verbose: bool = True):
@@ -157,6 +160,29 @@ class WidgetFinder:
         self.tables: Dict[str, Optional[QTableWidget]] = {}
         self.labels: Dict[str, Optional[QLabel]] = {}
         self.custom_widgets: Dict[str, Optional[QWidget]] = {}
+
+        # objectName -> widget index, built lazily by a single tree walk
+        self._index: Optional[Dict[str, QWidget]] = None
+
+    def refresh(self) -> None:
+        """
+        Drop the objectName index so the next lookup re-walks the hierarchy.
+        
+        Only needed if widgets are added to the parent after the first
+        find_*() call (widgets created by the .ui file all exist up front).
+        """
+        self._index = None
+
+    def _build_index(self) -> Dict[str, QWidget]:
+        """Walk the widget tree once and index widgets by objectName."""
+        index: Dict[str, QWidget] = {}
+        for widget in self.parent.findChildren(QWidget):
+            name = widget.objectName()
+            # Keep the first widget for duplicate names (findChild semantics)
+            if name and name not in index:
+                index[name] = widget
+        self._index = index
+        return index
     
     def find_widget(
         self,
@@ -203,11 +229,13 @@ class WidgetFinder:
             >>> button.click()  # IDE knows this is a QPushButton
         
         Technical Details:
-            Uses QObject.findChild() which:
-            1. Searches immediate children first
-            2. Then recursively searches children's children
-            3. Returns first match by objectName
-            4. Returns None if no match found
+            Looks the name up in the objectName index (built once on first
+            use from a single findChildren() walk), then checks the class:
+            1. Index hit with matching class → returned directly (O(1))
+            2. Name indexed with another class → falls back to
+               QObject.findChild() (covers duplicate names)
+            3. Returns None if no match found (call refresh() first if the
+               widget was created after the index was built)
             
             The search is case-sensitive and matches exact objectName only.
             Widget must be a descendant (not necessarily direct child).
@@ -216,10 +244,13 @@ class WidgetFinder:
             find_buttons(): For finding multiple buttons at once
             find_custom_widgets(): For finding promoted custom widgets
         """
-        # Use Qt's findChild() to search the widget hierarchy
-        # First argument: class type to find
-        # Second argument: objectName to match
-        widget = self.parent.findChild(widget_class, object_name)
+        # O(1) lookup in the objectName index (built on first use)
+        index = self._index if self._index is not None else self._build_index()
+        widget = index.get(object_name)
+        if widget is not None and not isinstance(widget, widget_class):
+            # Name exists but with another class: let Qt's findChild()
+            # look for a same-named widget of the requested class
+            widget = self.parent.findChild(widget_class, object_name)
         
         # Print warning if widget not found (unless silent mode)
         if widget is None and self.verbose and not silent:
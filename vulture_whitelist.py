@@ -4,6 +4,7 @@
 # as unused.
 
 import dispatcher
+import esp32cam_window
 import models
 import telemetry_bridge
 import utils.widget_finder as widget_finder
@@ -16,16 +17,26 @@ from widgets.status_led import StatusLED, IndicatorsManager
 # dispatcher
 _ = getattr(dispatcher, "disconnect_all", None)
 
+# esp32cam_window (public singleton helpers kept alongside get_or_none)
+_ = getattr(esp32cam_window.ESP32CamWindow, "is_open", None)
+_ = getattr(esp32cam_window.ESP32CamWindow, "get_instance", None)
+_ = getattr(esp32cam_window.SnapshotJob, "run", None)  # called by QThreadPool
+
 # models
 _ = getattr(models, "TelemetryTableModel", None) and getattr(models.TelemetryTableModel, "headerData", None)
+_ = getattr(models.TelemetryDelegate, "initStyleOption", None)
+_ = getattr(models.TelemetryFilterProxy, "filterAcceptsRow", None)
+_ = getattr(models.QStyleOptionViewItem, "features", None)  # set by TelemetryDelegate, read by the style when painting
 
 # telemetry bridge
 _ = getattr(telemetry_bridge, "_prev_ts", None)
+_ = getattr(telemetry_bridge.TelemetryFilePlayer, "_loader", None)  # keeps the loader alive
 
 # widget_finder utilities
 _ = getattr(widget_finder, "find_tables", None)
 _ = getattr(widget_finder, "find_labels", None)
 _ = getattr(widget_finder, "summary", None)
+_ = getattr(widget_finder.WidgetFinder, "refresh", None)
 
 # widgets package helpers
 _ = getattr(widgets, "get_widget_class", None)
@@ -33,6 +44,11 @@ _ = getattr(widgets, "get_widgets_by_category", None)
 
 # widget instance methods / attributes often used by Qt or Designer
 _ = getattr(TrajectoryCharts, "setMarkerSize", None)
+_ = getattr(TrajectoryCharts, "extend", None)
+_ = getattr(TrajectoryCharts, "setUpdateInterval", None)
+_ = getattr(TrajectoryCharts, "setMaxPoints", None)
+_ = getattr(TrajectoryCharts, "setShowMarkers", None)
+_ = getattr(TrajectoryCharts, "setMarkersThreshold", None)
 _ = getattr(LinearGauge, "getValue", None)
 _ = getattr(LinearGauge, "getLabel", None)
 _ = getattr(LinearGauge, "setMaxValue", None)
@@ -148,7 +148,7 @@ Hardware Compatibility:
 Dependencies:
     Required:
         • PyQt6 >= 6.0.0
-        • Python >= 3.8
+        • Python >= 3.10
     
     Optional:
         • pyqtgraph >= 0.12.0 (for TrajectoryCharts)
@@ -271,8 +271,29 @@ Project: BalloonSat Telemetry Dashboard
 
 from .status_led import StatusLED           # Binary status indicator (LED)
 from .gauge import LinearGauge              # Horizontal percentage gauge
-from .charts import TrajectoryCharts        # Altitude trajectory plotting
-from .live_feed import LiveFeedWidget       # ESP32-CAM live video feed
+
+# Heavy widgets are imported lazily on first attribute access (PEP 562):
+# - LiveFeedWidget is only used by the ESP32-CAM window, opened on demand.
+# - TrajectoryCharts pulls in pyqtgraph + NumPy (several hundred ms on a
+#   cold start). Importing any widgets.* submodule runs this package
+#   __init__, so an eager import here made the ESP32-CAM window and the
+#   LED/gauge demos pay for pyqtgraph too. The dashboard imports
+#   widgets.charts itself before building the UI (Designer promotion).
+_LAZY_WIDGETS = {
+    'LiveFeedWidget': '.live_feed',         # ESP32-CAM live video feed
+    'TrajectoryCharts': '.charts',          # Altitude trajectory plotting
+}
+
+
+def __getattr__(name: str):
+    """Import lazily-loaded widget classes on first access."""
+    module_name = _LAZY_WIDGETS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    cls = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = cls  # cache: later lookups bypass __getattr__
+    return cls
 
 # ============================================================================
 # === PACKAGE METADATA ===
@@ -316,7 +337,7 @@ __project__ = 'BalloonSat Telemetry Dashboard'
 __qt_version__ = 'PyQt6 >= 6.0.0'
 
 # Python version requirement
-__python_version__ = 'Python >= 3.8'
+__python_version__ = 'Python >= 3.10'
 
 # ============================================================================
 # === WIDGET REGISTRY (For Dynamic Access) ===
@@ -327,16 +348,16 @@ __python_version__ = 'Python >= 3.8'
 WIDGET_REGISTRY = {
     'StatusLED': StatusLED,
     'LinearGauge': LinearGauge,
-    'TrajectoryCharts': TrajectoryCharts,
-    'LiveFeedWidget': LiveFeedWidget,
+    'TrajectoryCharts': None,  # lazy, resolved by get_widget_class()
+    'LiveFeedWidget': None,    # lazy, resolved by get_widget_class()
 }
 
 # Widget categories for organization
 WIDGET_CATEGORIES = {
     'indicators': [StatusLED],              # Visual status indicators
     'gauges': [LinearGauge],                # Measurement displays
-    'charts': [TrajectoryCharts],           # Data plotting
-    'video': [LiveFeedWidget],              # Camera feeds
+    'charts': ['TrajectoryCharts'],         # Data plotting (lazy, by name)
+    'video': ['LiveFeedWidget'],            # Camera feeds (lazy, by name)
 }
 
 # Widget base classes (for Qt Designer promotion)
@@ -373,7 +394,10 @@ def get_widget_class(name: str):
         >>> cls = get_widget_class('StatusLED')
         >>> led = cls()
     """
-    return WIDGET_REGISTRY.get(name)
+    cls = WIDGET_REGISTRY.get(name)
+    if cls is None and name in _LAZY_WIDGETS:
+        cls = WIDGET_REGISTRY[name] = __getattr__(name)
+    return cls
 
 
 def list_widgets():
@@ -428,7 +452,11 @@ def get_widgets_by_category(category: str) -> list:
         >>> indicators = get_widgets_by_category('indicators')
         >>> led = indicators[0]()  # Create StatusLED
     """
-    return WIDGET_CATEGORIES.get(category, [])
+    # Lazy widgets are listed by name; resolve them to classes here
+    return [
+        get_widget_class(w) if isinstance(w, str) else w
+        for w in WIDGET_CATEGORIES.get(category, [])
+    ]
 
 
 # ============================================================================
@@ -450,8 +478,8 @@ def get_widgets_by_category(category: str) -> list:
 # This catches import errors early during development
 assert StatusLED is not None, "StatusLED import failed"
 assert LinearGauge is not None, "LinearGauge import failed"
-assert TrajectoryCharts is not None, "TrajectoryCharts import failed"
-assert LiveFeedWidget is not None, "LiveFeedWidget import failed"
+# TrajectoryCharts and LiveFeedWidget are lazy (see _LAZY_WIDGETS) and
+# validated on first use
 
 # ============================================================================
 # === MODULE TESTING ===
@@ -502,10 +530,10 @@ if __name__ == "__main__":
         gauge = LinearGauge()
         print(f"  • LinearGauge: {gauge.__class__.__name__}")
         
-        charts = TrajectoryCharts()
+        charts = get_widget_class('TrajectoryCharts')()
         print(f"  • TrajectoryCharts: {charts.__class__.__name__}")
         
-        feed = LiveFeedWidget()
+        feed = get_widget_class('LiveFeedWidget')()
         print(f"  • LiveFeedWidget: {feed.__class__.__name__}")
         
         print("\n✓ All widgets created successfully")
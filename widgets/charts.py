@@ -24,15 +24,44 @@ License: MIT
 
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any
 from datetime import datetime, timezone
 import os
 import platform
 
+import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 import PyQt6.QtGui as QtGui
 
+# ============================================================================
+# === BUFFER DTYPES ===
+# ============================================================================
+
+# Time stays float64 (relative seconds must not lose sub-second precision
+# over long flights); altitude is float32, which still resolves ~2 mm at
+# 30 km and halves the bytes copied/scanned per refresh.
+_T_DTYPE = np.float64
+_ALT_DTYPE = np.float32
+
+# Qt platforms without a usable GL surface; OpenGL viewports fail to paint
+_NO_GL_PLATFORMS = ("offscreen", "minimal", "vnc")
+
+
+def _use_opengl() -> bool:
+    """Return True if the chart may use an OpenGL viewport.
+
+    Disabled with DASHBOARD_OPENGL=0, and on headless Qt platforms.
+    """
+    if os.getenv("DASHBOARD_OPENGL", "").lower() in ("0", "false", "no"):
+        return False
+    try:
+        platform_name = QtGui.QGuiApplication.platformName()
+    except Exception:
+        return False
+    return platform_name not in _NO_GL_PLATFORMS
+
+
 # ============================================================================
 # === CHART STYLING CONSTANTS ===
 # ============================================================================
@@ -44,6 +73,10 @@ _STYLE_ALT = {
     "width": 2,
 }
 
+# Per-point marker styling; built once instead of on every refresh()
+_SYMBOL_BRUSH = pg.mkBrush(_STYLE_ALT["color"])
+_SYMBOL_PEN = pg.mkPen("#000000", width=1)
+
 
 class TrajectoryCharts(QWidget):
     """
@@ -57,15 +90,19 @@ class TrajectoryCharts(QWidget):
         alt_plot (PlotWidget): Altitude vs time chart
         curve_alt (PlotDataItem): Altitude line
 
-        _t (List[float]): Time data buffer
-        _alt (List[float]): Altitude buffer
+        _t (np.ndarray): Time data buffer (relative seconds)
+        _alt (np.ndarray): Altitude buffer
+        _start, _end (int): Live window ``[_start:_end)`` inside the buffers
 
     Performance:
-        • Uses list buffers for O(1) append operations
-        • PyQtGraph handles rendering optimization automatically
-        • OpenGL acceleration enabled when available
-        • Downsampling for >1000 points (configurable)
-        • Reduced memory footprint: ~40 bytes/point (was ~50 bytes with lat/lon)
+        • Preallocated NumPy sliding-window buffers: O(1) amortized append,
+          contiguous slices handed to setData without copying
+        • PyQtGraph peak downsampling + clip-to-view on the curve, so
+          redraw cost follows the visible pixel width, not flight length
+        • OpenGL acceleration enabled when available (configured before
+          the PlotWidget is created so it actually takes effect)
+        • Memory footprint: 12 bytes/point (float64 time, float32 altitude)
+        • No setData while hidden; one catch-up redraw in showEvent()
 
     Example:
         >>> from types import SimpleNamespace
@@ -105,6 +142,24 @@ class TrajectoryCharts(QWidget):
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(4)
 
+        # === Detect embedded target ===
+        _embedded_env = os.getenv("DASHBOARD_EMBEDDED", "").lower()
+        _is_arm = "arm" in platform.machine().lower() or "aarch" in platform.machine().lower()
+        self._EMBEDDED = (_embedded_env in ("1", "true", "yes")) or _is_arm
+        # Dashboard light mode (DASHBOARD_LIGHT_MODE): its chart settings
+        # are chosen here, before any buffer is allocated, instead of being
+        # patched onto a constructed chart by the dashboard
+        _light = os.getenv("DASHBOARD_LIGHT_MODE", "").lower() in ("1", "true", "yes", "on")
+
+        # === Configure rendering options ===
+        # Must run before the PlotWidget is constructed: useOpenGL is read
+        # when the GraphicsView is created. On embedded targets, prefer
+        # lower-quality but faster rendering to reduce CPU/GPU load.
+        if self._EMBEDDED:
+            pg.setConfigOptions(antialias=False, useOpenGL=False)
+        else:
+            pg.setConfigOptions(antialias=True, useOpenGL=_use_opengl())
+
         # === Create altitude plot (SINGLE CHART) ===
         self.alt_plot = pg.PlotWidget(title="<b>Altitude vs Time</b>")
         
@@ -139,9 +194,17 @@ class TrajectoryCharts(QWidget):
         layout.addWidget(self.alt_plot)
 
         # === Initialize data buffers ===
-        # Using lists for O(1) append performance
-        self._t: List[float] = []
-        self._alt: List[float] = []
+        # Preallocated NumPy buffers holding a sliding window [_start:_end).
+        # Appends write in place; when the end of the buffer is reached the
+        # live window is moved back to index 0 (amortized O(1)). Allocated
+        # lazily in _reserve() once _max_points is known.
+        self._t: np.ndarray = np.empty(0, dtype=_T_DTYPE)
+        self._alt: np.ndarray = np.empty(0, dtype=_ALT_DTYPE)
+        self._start: int = 0
+        self._end: int = 0
+        # True when the buffers hold data the curve has not been given yet
+        # because the chart was hidden (see refresh()/showEvent())
+        self._stale: bool = False
 
         # Note: No lat/lon buffers needed anymore
 
@@ -150,22 +213,18 @@ class TrajectoryCharts(QWidget):
         # after collecting `_update_interval` points. Higher values
         # reduce repaint frequency and CPU usage on embedded devices.
         # Default set based on environment (desktop vs embedded/RPi).
-        _embedded_env = os.getenv("DASHBOARD_EMBEDDED", "").lower()
-        _is_arm = "arm" in platform.machine().lower() or "aarch" in platform.machine().lower()
-        self._EMBEDDED = (_embedded_env in ("1", "true", "yes")) or _is_arm
-
         # Conservative defaults for embedded targets
-        self._update_interval: int = 10 if self._EMBEDDED else 5
+        self._update_interval: int = 10 if (self._EMBEDDED or _light) else 5
         self._pending_updates: int = 0
         # Base time for converting absolute timestamps to relative seconds
         self._base_time: float | None = None
         # Maximum number of points to keep in the buffers (rolling buffer)
         # Prevents unbounded memory growth during long runs.
-        self._max_points: int = 1000 if self._EMBEDDED else 5000
+        self._max_points: int = 1000 if self._EMBEDDED else 2000 if _light else 5000
         # Marker / symbol display settings - disable on embedded by default
-        self._show_markers: bool = False if self._EMBEDDED else True
+        self._show_markers: bool = not (self._EMBEDDED or _light)
         # Marker threshold (smaller for embedded)
-        self._markers_threshold: int | None = 200 if self._EMBEDDED else 500
+        self._markers_threshold: int | None = 200 if (self._EMBEDDED or _light) else 500
         # Default marker size (smaller on embedded displays)
         self._marker_size: int = 4 if self._EMBEDDED else 6
 
@@ -173,23 +232,19 @@ class TrajectoryCharts(QWidget):
         # Altitude: single series (solid orange)
         self.curve_alt = self.alt_plot.plot(pen=pg.mkPen(**_STYLE_ALT), name="Altitude")
 
-        # Initialize curve with empty data and enable automatic downsampling
-        # `downsampleMethod='mean'` preserves shapes for dense datasets when supported.
-        # Assume a modern pyqtgraph; keep the optimized call simple.
-        self.curve_alt.setData([], [], autoDownsample=True, downsampleMethod='mean')
+        # Peak downsampling keeps min/max per pixel column (spikes survive)
+        # and clip-to-view skips points outside the visible X range, so
+        # zooming in still shows full-resolution data.
+        self.curve_alt.setDownsampling(auto=True, method='peak')
+        self.curve_alt.setClipToView(True)
+
+        # Initialize curve with empty data
+        self.curve_alt.setData([], [])
 
         # === Set axis labels ===
         self.alt_plot.setLabel("bottom", "Time", units="s")
         self.alt_plot.setLabel("left", "Altitude", units="m")
 
-        # === Configure rendering options ===
-        # On embedded targets, prefer lower-quality but faster rendering to
-        # reduce CPU/GPU load and avoid running out of memory.
-        if self._EMBEDDED:
-            pg.setConfigOptions(antialias=False, useOpenGL=False)
-        else:
-            pg.setConfigOptions(antialias=True, useOpenGL=True)
-
         # === Set background color ===
         self.alt_plot.setBackground("#ffffff")
 
@@ -221,9 +276,9 @@ class TrajectoryCharts(QWidget):
             >>> charts.appendPoint(point)
 
         Performance:
-            • O(1) append to data buffers (list.append)
-            • PyQtGraph handles rendering optimization
-            • Downsampling automatic for >1000 points
+            • O(1) amortized write into preallocated NumPy buffers
+            • Repaints batched every ``_update_interval`` points
+            • Downsampling/clipping handled by the curve at paint time
             • CPU usage: <0.3% per call (reduced from ~0.5%)
             • Faster than v2.0 (no lat/lon processing)
 
@@ -235,20 +290,96 @@ class TrajectoryCharts(QWidget):
         """
         # === Support clear flag ===
         # Allows emitters to clear chart before plotting new trajectory
-        try:
-            if getattr(p, "clear", False):
+        if self._wants_clear(p):
+            self.clear()
+
+        # --- Parse time/altitude, then convert to relative time
+        t_s, alt_val = self._parse_point(p)
+        if t_s is None:
+            return
+        if self._base_time is None:
+            self._base_time = t_s
+        if alt_val is None:
+            return
+        t = t_s - self._base_time
+
+        # === Append to data buffers ===
+        self._write(np.array((t,)), np.array((alt_val,)))
+
+        # Batch UI updates to avoid repainting on every single append
+        self._pending_updates += 1
+        if self._pending_updates >= max(1, self._update_interval):
+            self.refresh()
+
+    def appendPoints(self, points):
+        """
+        Append a batch of trajectory points with a single redraw.
+
+        Same point format and ``clear`` flag handling as appendPoint(); a
+        point with ``clear=True`` drops everything before it (including
+        earlier points of the same batch). The parsed batch is written to
+        the buffers in one vectorized step and refresh() runs once, so the
+        cost of a redraw is paid per batch rather than per point. A batch
+        that neither adds points nor clears the chart does not redraw.
+
+        Args:
+            points: Iterable of point objects/dicts
+
+        Example:
+            >>> charts.appendPoints(buffered_points)   # e.g. from a timer tick
+        """
+        ts = []
+        ys = []
+        cleared = False
+        for p in points:
+            if self._wants_clear(p):
                 self.clear()
+                ts.clear()
+                ys.clear()
+                cleared = True
+            t_s, alt_val = self._parse_point(p)
+            if t_s is None:
+                continue
+            if self._base_time is None:
+                self._base_time = t_s
+            if alt_val is None:
+                continue
+            ts.append(t_s - self._base_time)
+            ys.append(alt_val)
+
+        if ts:
+            self._write(np.asarray(ts, dtype=_T_DTYPE), np.asarray(ys, dtype=_ALT_DTYPE))
+        elif not cleared:
+            return
+        self.refresh()
+
+    @staticmethod
+    def _wants_clear(p: Any) -> bool:
+        """Return True if the point carries a truthy ``clear`` flag."""
+        try:
+            if isinstance(p, dict):
+                # getattr(dict, "clear") would be the bound dict.clear method
+                return bool(p.get("clear", False))
+            return bool(getattr(p, "clear", False))
         except Exception:
-            pass
+            return False
+
+    @staticmethod
+    def _parse_point(p: Any):
+        """
+        Extract ``(absolute_time_s, altitude)`` from a trajectory point.
 
-        # --- Normalize/parse timestamp `t` to seconds, then convert to relative time
+        Returns ``(None, None)`` if the timestamp is missing/unparseable and
+        ``(t_s, None)`` if only the altitude is unusable.
+        """
+        # --- Normalize/parse timestamp `t` to absolute seconds
         raw_t = getattr(p, "t", None)
         # also accept `ts` field for replay files
         if raw_t is None and isinstance(p, dict):
             raw_t = p.get("ts")
 
         if raw_t is None:
-            return
+            return None, None
 
         # parse ISO datetime strings (e.g. 2025-11-21T12:01:20.000Z)
         if isinstance(raw_t, str):
@@ -265,14 +396,14 @@ class TrajectoryCharts(QWidget):
                     dt = dt.replace(tzinfo=timezone.utc)
                     t_s = dt.timestamp()
                 except Exception:
-                    return
+                    return None, None
         elif hasattr(raw_t, "timestamp"):
             t_s = float(raw_t.timestamp())
         else:
             try:
                 raw = float(raw_t)
             except Exception:
-                return
+                return None, None
             if raw > 1e12:
                 t_s = raw / 1e9
             elif raw > 1e10:
@@ -280,11 +411,6 @@ class TrajectoryCharts(QWidget):
             else:
                 t_s = raw
 
-        if self._base_time is None:
-            self._base_time = t_s
-        t = t_s - self._base_time
-
-
         # --- Extract altitude value (support dicts and objects) ---
         def _get(k: str):
             if isinstance(p, dict):
@@ -304,49 +430,119 @@ class TrajectoryCharts(QWidget):
                 alt_val = tele.get("alt_gps") or tele.get("alt_bmp") or tele.get("alt")
 
         try:
-            alt_val = float(alt_val)
+            return t_s, float(alt_val)
         except Exception:
+            return t_s, None
+
+    def extend(self, ts, ys):
+        """
+        Append many points at once (vectorized).
+
+        Args:
+            ts: Sequence/array of timestamps in seconds (absolute or relative;
+                converted to relative using the same base time as appendPoint)
+            ys: Sequence/array of altitudes, same length as ``ts``
+
+        The chart is refreshed once after the whole batch is written.
+
+        Example:
+            >>> charts.extend(np.arange(100.0), np.linspace(0, 500, 100))
+        """
+        t_arr = np.asarray(ts, dtype=_T_DTYPE).ravel()
+        y_arr = np.asarray(ys, dtype=_ALT_DTYPE).ravel()
+        n = min(t_arr.size, y_arr.size)
+        if n == 0:
             return
+        if self._base_time is None:
+            self._base_time = float(t_arr[0])
+        self._write(t_arr[:n] - self._base_time, y_arr[:n])
+        self.refresh()
 
-        # === Append to data buffers ===
-        self._t.append(t)
-        self._alt.append(alt_val)
+    def _reserve(self, extra: int):
+        """
+        Make room for ``extra`` more points at ``_end``.
+
+        The buffers hold twice the rolling window so the live window only
+        has to be moved back to the start once every ``_max_points``
+        appends. With ``_max_points == 0`` (unbounded) the buffers double.
+        """
+        count = self._end - self._start
+        capacity = self._t.size
+        if self._end + extra <= capacity:
+            return
+
+        needed = count + extra
+        if self._max_points:
+            needed = max(needed, 2 * self._max_points)
+        if needed <= capacity:
+            # Enough space overall: compact the live window to index 0
+            self._t[:count] = self._t[self._start:self._end]
+            self._alt[:count] = self._alt[self._start:self._end]
+        else:
+            new_capacity = max(needed, 2 * capacity, 64)
+            t_new = np.empty(new_capacity, dtype=_T_DTYPE)
+            alt_new = np.empty(new_capacity, dtype=_ALT_DTYPE)
+            t_new[:count] = self._t[self._start:self._end]
+            alt_new[:count] = self._alt[self._start:self._end]
+            self._t, self._alt = t_new, alt_new
+        self._start, self._end = 0, count
+
+    def _write(self, t_arr: np.ndarray, y_arr: np.ndarray):
+        """Write already-relative points and enforce the rolling limit."""
+        n = t_arr.size
+        if self._max_points and n > self._max_points:
+            # Only the newest _max_points can survive the trim anyway
+            t_arr, y_arr = t_arr[-self._max_points:], y_arr[-self._max_points:]
+            n = self._max_points
+        self._reserve(n)
+        self._t[self._end:self._end + n] = t_arr
+        self._alt[self._end:self._end + n] = y_arr
+        self._end += n
 
         # Enforce rolling buffer limit to avoid unbounded growth
-        if self._max_points and len(self._t) > self._max_points:
-            # keep only the most recent `_max_points` items
-            self._t = self._t[-self._max_points :]
-            self._alt = self._alt[-self._max_points :]
+        if self._max_points and self._end - self._start > self._max_points:
+            self._start = self._end - self._max_points
 
-        # Batch UI updates to avoid repainting on every single append
-        self._pending_updates += 1
-        if self._pending_updates >= max(1, self._update_interval):
-            # Decide whether to draw per-point markers based on current settings and dataset size
-            show_symbols = self._show_markers and (
-                (self._markers_threshold is None) or (len(self._t) <= self._markers_threshold)
-            )
+    def refresh(self):
+        """
+        Push the current buffer contents to the plot.
 
-            try:
-                if show_symbols:
-                    # Filled symbol with dark edge for contrast on light backgrounds
-                    self.curve_alt.setData(
-                        self._t,
-                        self._alt,
-                        autoDownsample=True,
-                        downsampleMethod='mean',
-                        symbol='o',
-                        symbolSize=self._marker_size,
-                        symbolBrush=pg.mkBrush(_STYLE_ALT['color']),
-                        symbolPen=pg.mkPen('#000000', width=1),
-                    )
-                else:
-                    self.curve_alt.setData(
-                        self._t, self._alt, autoDownsample=True, downsampleMethod='mean'
-                    )
-            except TypeError:
-                # Older pyqtgraph may not support extra kwargs; fall back to basic call
-                self.curve_alt.setData(self._t, self._alt)
-            self._pending_updates = 0
+        Called automatically every ``_update_interval`` appends and after
+        ``extend``. Safe to call manually (e.g. after changing marker
+        settings).
+
+        While the widget is hidden (inactive tab, collapsed dock, window
+        not shown yet or minimized) appends still fill the buffers but the
+        curve is not touched; refreshIfStale() pushes everything in one
+        setData once the chart can be seen again.
+        """
+        self._pending_updates = 0
+        if not self.isVisible() or self.window().isMinimized():
+            self._stale = True
+            return
+        self._stale = False
+        count = self._end - self._start
+        t = self._t[self._start:self._end]
+        y = self._alt[self._start:self._end]
+
+        # Decide whether to draw per-point markers based on current settings and dataset size
+        show_symbols = self._show_markers and (
+            (self._markers_threshold is None) or (count <= self._markers_threshold)
+        )
+
+        if show_symbols:
+            # Filled symbol with dark edge for contrast on light backgrounds
+            self.curve_alt.setData(
+                t,
+                y,
+                symbol='o',
+                symbolSize=self._marker_size,
+                symbolBrush=_SYMBOL_BRUSH,
+                symbolPen=_SYMBOL_PEN,
+            )
+        else:
+            # The curve downsamples (peak) and clips to view on its own
+            self.curve_alt.setData(t, y, symbol=None)
 
     def clear(self):
         """
@@ -362,13 +558,14 @@ class TrajectoryCharts(QWidget):
             ...     charts.appendPoint(point)
 
         Performance:
-            • O(1) operation (list.clear() + plot clear)
+            • O(1) operation (window reset + plot clear)
             • No memory reallocation needed
             • Faster than v2.0 (only one chart to clear)
         """
         # === Clear data buffers ===
-        self._t.clear()
-        self._alt.clear()
+        # Buffers are kept allocated; only the live window is reset
+        self._start = 0
+        self._end = 0
 
         # Reset pending update counter and base time
         self._pending_updates = 0
@@ -378,6 +575,21 @@ class TrajectoryCharts(QWidget):
 
         # === Clear plot items ===
         self.curve_alt.clear()
+        self._stale = False
+
+    def refreshIfStale(self):
+        """Apply points that arrived while the chart was hidden.
+
+        Called from showEvent(); the owning window also calls it when it is
+        restored from minimized, which does not re-show child widgets.
+        """
+        if self._stale:
+            self.refresh()
+
+    def showEvent(self, event):
+        """Apply points that arrived while the chart was hidden."""
+        super().showEvent(event)
+        self.refreshIfStale()
 
     def setShowMarkers(self, enable: bool):
         """
@@ -443,7 +655,7 @@ class TrajectoryCharts(QWidget):
             >>> if charts.getDataPointCount() > 1000:
             ...     print("Warning: Large dataset may slow rendering")
         """
-        return len(self._t)
+        return self._end - self._start
 
     def setTitle(self, title: str):
         """
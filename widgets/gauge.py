@@ -14,7 +14,7 @@ Features:
     • Professional appearance matching dashboard theme
 
 Performance Optimizations:
-    • Precalculated geometry (no runtime calculations)
+    • Precalculated geometry: bar/text rects and tick lines cached per size
     • Minimal repaints (only when value changes)
     • Efficient QPainter usage with region clipping
     • Font caching for text rendering
@@ -63,7 +63,7 @@ import os
 import platform
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QLine
 
 # Embedded/Raspberry Pi detection
 _embedded_env = os.getenv("DASHBOARD_EMBEDDED", "").lower()
@@ -80,6 +80,10 @@ _COLOR_TRACK = QColor("#cccccc")        # Light gray track/border
 _COLOR_TICK = QColor("#777777")         # Medium gray ticks
 _COLOR_TEXT = QColor("#222222")         # Near-black text
 
+# Pen cache (created once, reused for all gauges and every paint)
+_PEN_TRACK = QPen(_COLOR_TRACK, 1)
+_PEN_TICK = QPen(_COLOR_TICK, 1)
+
 # Font cache (created once, reused for all gauges)
 _FONT_LABEL = QFont("Arial", 9 if not _EMBEDDED else 8)
 
@@ -138,9 +142,38 @@ class LinearGauge(QWidget):
         self._max = max_value
         self._label = label
         
+        # === Cached geometry (recomputed only on resize) ===
+        self._bar_rect = None    # QRect of the gauge bar
+        self._text_rect = None   # QRect for the label text
+        self._tick_lines = []    # QLine per 10% tick, drawn in one call
+
         # === Set minimum size ===
         # Use a slightly smaller minimum on embedded targets to save space
         self.setMinimumHeight(60 if not _EMBEDDED else 48)
+
+        # === Opaque painting ===
+        # paintEvent fills the whole rect with the widget's background
+        # color, so Qt can skip erasing/compositing the parent underneath.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+
+    def _update_geometry(self):
+        """Precompute bar, text and tick geometry for the current size."""
+        # Leave margins: 10px left/right, 10px top, 20px bottom (for ticks)
+        rect = self.rect().adjusted(10, 10, -10, -20)
+        self._bar_rect = rect
+        self._text_rect = rect.adjusted(0, -12, 0, 0)
+        bottom = rect.bottom()
+        self._tick_lines = [
+            QLine(x, bottom, x, bottom + 6)  # 6px tall tick below bar
+            for x in (rect.x() + rect.width() * pct // 100 for pct in range(0, 101, 10))
+        ]
+
+    def resizeEvent(self, event):
+        """Invalidate cached geometry; it is rebuilt on the next paint."""
+        self._bar_rect = None
+        super().resizeEvent(event)
     
     def setValue(self, value: float):
         """
@@ -159,17 +192,19 @@ class LinearGauge(QWidget):
             gauge.setValue(-10)    # Clamped to 0
         
         Performance:
-            • Only triggers repaint if value actually changes
-            • Uses float comparison with implicit epsilon
+            • Only triggers repaint if the displayed value changes
+              (label shows 0.1 resolution; sub-0.1 jitter is not repainted)
             • Clamp operation is O(1)
         """
         # === Clamp value to valid range ===
         value = max(0.0, min(self._max, value))
         
-        # === Update only if changed (dirty flag pattern) ===
+        # === Update only if the rendering would change (dirty flag) ===
         if value != self._value:
+            repaint = round(value, 1) != round(self._value, 1)
             self._value = value
-            self.update()  # Schedule repaint
+            if repaint:
+                self.update()  # Schedule repaint
     
     def getValue(self) -> float:
         """
@@ -248,19 +283,24 @@ class LinearGauge(QWidget):
             • All geometry precalculated (no repeated calculations)
             • Minimal painter state changes
             • Clipping region limits overdraw
-            • Font object cached globally
+            • Font and pen objects cached globally (no per-paint allocation)
         """
         painter = QPainter(self)
         # Disable antialiasing on embedded targets for lower CPU use
         if not _EMBEDDED:
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # === Calculate gauge bar rectangle ===
-        # Leave margins: 10px left/right, 10px top, 20px bottom (for ticks)
-        rect = self.rect().adjusted(10, 10, -10, -20)
+        # === Widget background (required by WA_OpaquePaintEvent) ===
+        # backgroundRole color follows the stylesheet (LinearGauge rule)
+        painter.fillRect(self.rect(), self.palette().color(self.backgroundRole()))
+
+        # === Gauge bar rectangle (precomputed per size) ===
+        if self._bar_rect is None:
+            self._update_geometry()
+        rect = self._bar_rect
         
         # === Draw background track ===
-        painter.setPen(QPen(_COLOR_TRACK, 1))
+        painter.setPen(_PEN_TRACK)
         painter.setBrush(_COLOR_BACKGROUND)
         painter.drawRect(rect)
         
@@ -271,11 +311,8 @@ class LinearGauge(QWidget):
             painter.drawRect(rect.x(), rect.y(), fill_width, rect.height())
         
         # === Draw tick marks every 10% ===
-        painter.setPen(QPen(_COLOR_TICK, 1))
-        for pct in range(0, 101, 10):
-            x = rect.x() + int(rect.width() * pct / 100)
-            # Draw 6px tall tick below bar
-            painter.drawLine(x, rect.bottom(), x, rect.bottom() + 6)
+        painter.setPen(_PEN_TICK)
+        painter.drawLines(self._tick_lines)  # one call for all 11 ticks
         
         # === Draw label text with value ===
         painter.setPen(_COLOR_TEXT)
@@ -285,9 +322,8 @@ class LinearGauge(QWidget):
         text = f"{self._label}: {self._value:.1f}%"
         
         # Draw text above gauge bar
-        text_rect = rect.adjusted(0, -12, 0, 0)
         painter.drawText(
-            text_rect,
+            self._text_rect,
             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
             text
         )
@@ -43,7 +43,7 @@ import os
 import platform
 from PyQt6.QtWidgets import QLabel
 from PyQt6.QtGui import QPixmap, QPainter, QColor
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QPoint, QRect, QSize
 
 # Detect embedded/Raspberry Pi mode via env var or platform
 _embedded_env = os.getenv("DASHBOARD_EMBEDDED", "").lower()
@@ -223,35 +223,32 @@ class LiveFeedWidget(QLabel):
             event: QPaintEvent (provided by Qt)
         
         Scaling Logic:
-            1. Calculate scaled size (maintain aspect ratio)
-            2. Center frame in widget
-            3. Draw scaled pixmap with smooth transformation
+            1. Fit the frame's size into the widget (keep aspect ratio)
+            2. Center that target rectangle in the widget
+            3. Draw the pixmap straight into it (smooth filtering on
+               desktop); no scaled copy of the frame is allocated
             4. Fill background with black
         """
         if self._current_frame:
             # Custom painting for scaled frame
             painter = QPainter(self)
             
-            # Scale frame to fit widget (maintain aspect ratio)
+            # Scale frame to fit widget (maintain aspect ratio). The painter
+            # scales while drawing, so a 30 FPS feed does not allocate (and
+            # free) a full-size scaled pixmap on every paint.
             # Use fast (lower-quality) scaling on embedded targets
-            transform_mode = (
-                Qt.TransformationMode.FastTransformation
-                if _EMBEDDED_MODE
-                else Qt.TransformationMode.SmoothTransformation
-            )
-
-            scaled_pixmap = self._current_frame.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                transform_mode,
+            if not _EMBEDDED_MODE:
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            size = self._current_frame.size().scaled(
+                self.size(), Qt.AspectRatioMode.KeepAspectRatio
             )
             
             # Center the scaled frame
-            x = (self.width() - scaled_pixmap.width()) // 2
-            y = (self.height() - scaled_pixmap.height()) // 2
+            x = (self.width() - size.width()) // 2
+            y = (self.height() - size.height()) // 2
             
             # Draw frame
-            painter.drawPixmap(x, y, scaled_pixmap)
+            painter.drawPixmap(QRect(QPoint(x, y), size), self._current_frame)
         else:
             # Use default QLabel painting for placeholder text
             super().paintEvent(event)
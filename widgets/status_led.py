@@ -24,6 +24,7 @@ Performance Optimizations:
     • Minimal geometry calculations (precalculated in __init__)
     • Update only when state actually changes (dirty flag pattern)
     • Fast paintEvent with early returns for identical repaints
+    • paintEvent blits a QPixmapCache sprite shared per (state, size)
 
 Usage Examples:
     Basic usage:
@@ -79,7 +80,7 @@ from __future__ import annotations
 import os
 import platform
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtGui import QPainter, QColor, QPixmap, QPixmapCache
 from PyQt6.QtCore import QSize, Qt
 
 # Embedded/Raspberry Pi detection
@@ -141,8 +142,9 @@ class StatusLED(QWidget):
         >>> print(led.text())  # "●"
     """
     
-    # Valid states (used for validation)
-    _VALID_STATES = ('on', 'off', 'fault')
+    # Valid states (used for validation). frozenset: setState() runs for
+    # every LED on every sensor flush, so membership is one hash lookup.
+    _VALID_STATES = frozenset(('on', 'off', 'fault'))
     
     def __init__(self, diameter: int = 14, parent=None):
         """
@@ -185,6 +187,10 @@ class StatusLED(QWidget):
         # If running on embedded targets, keep diameter conservative
         self._diameter = diameter if not _EMBEDDED else min(diameter, 16)
         self._text = ''  # Store text from Qt Designer (not displayed)
+        # Sprite currently shown, keyed by (state, w, h, dpr); repaints with an
+        # unchanged key blit it without touching QPixmapCache
+        self._sprite_key = None
+        self._sprite = None
         
         # === Set size constraints ===
         # Fixed size policy ensures LED doesn't resize unexpectedly
@@ -411,7 +417,7 @@ class StatusLED(QWidget):
         # === Validate state ===
         if state not in self._VALID_STATES:
             raise ValueError(
-                f"state must be one of {self._VALID_STATES}, got '{state}'"
+                f"state must be one of ('on', 'off', 'fault'), got '{state}'"
             )
         
         # === Update state only if changed (dirty flag pattern) ===
@@ -478,8 +484,13 @@ class StatusLED(QWidget):
             6. Calculate circle dimensions (widget size - 2px margin)
             7. Draw filled ellipse (circle)
             8. QPainter auto-destructs (RAII pattern)
+            Steps 1-7 run once per (state, size) in _render_sprite(); the
+            result is kept in QPixmapCache and paintEvent only blits it.
         
         Performance Optimizations:
+            • Prerendered sprite per (state, size) in QPixmapCache (one blit)
+            • Current sprite held per instance; expose/resize repaints with
+              an unchanged state skip the key format and cache lookup
             • Uses cached QColor objects (no object creation)
             • Antialiasing only for circle (not border)
             • Minimal geometry calculations
@@ -515,6 +526,28 @@ class StatusLED(QWidget):
             update(): Schedule a repaint
             setState(): Change state (triggers paintEvent)
         """
+        # === Blit the prerendered sprite for (state, size) ===
+        # All LEDs with the same state and size share one cached pixmap, so
+        # a repaint is a single drawPixmap instead of an antialiased ellipse
+        w, h = self.width(), self.height()
+        dpr = self.devicePixelRatioF()
+        sprite_key = (self._state, w, h, dpr)
+        pixmap = self._sprite
+        if sprite_key != self._sprite_key or pixmap is None:
+            key = f"statusled:{self._state}:{w}x{h}@{dpr}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None:
+                pixmap = self._render_sprite(w, h, dpr)
+                QPixmapCache.insert(key, pixmap)
+            self._sprite_key, self._sprite = sprite_key, pixmap
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+        # Painter automatically cleaned up when leaving scope (RAII pattern)
+
+    def _render_sprite(self, w: int, h: int, dpr: float = 1.0) -> QPixmap:
+        """Render the LED circle for the current state into a transparent pixmap."""
         # === Select color based on state ===
         # Uses precreated color objects for performance
         if self._state == 'on':
@@ -523,25 +556,31 @@ class StatusLED(QWidget):
             color = _COLOR_FAULT
         else:  # 'off' or any other state (defensive programming)
             color = _COLOR_OFF
-        
+
+        # Render at device resolution so the sprite stays crisp on HiDPI
+        pixmap = QPixmap(max(1, round(w * dpr)), max(1, round(h * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
         # === Setup painter ===
-        painter = QPainter(self)
+        painter = QPainter(pixmap)
+
         # Avoid antialiasing on embedded targets to reduce CPU
         if not _EMBEDDED:
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)  # Smooth circle edges
-        
+
         # === Draw filled circle ===
         painter.setBrush(color)        # Fill color
         painter.setPen(_COLOR_BORDER)  # Black border (1px)
-        
+
         # Calculate circle dimensions (leave 2px margin for border visibility)
         # min() ensures circle fits even if widget is resized asymmetrically
-        d = min(self.width(), self.height()) - 2
-        
+        d = min(w, h) - 2
+
         # Draw ellipse: x=1, y=1 (margin), width=d, height=d (circle when equal)
         painter.drawEllipse(1, 1, d, d)
-        
-        # Painter automatically cleaned up when leaving scope (RAII pattern)
+        painter.end()
+        return pixmap
 
 
 # ---------------------------------------------------------------------------
@@ -679,12 +718,18 @@ class IndicatorsManager:
 
         mapped = self.STATE_MAPPING.get(state, state)
         for w in self.indicators.values():
-            w.setProperty("status", state)
+            # StatusLED.setState() repaints only on an actual change
             if hasattr(w, "setState"):
                 try:
                     w.setState(mapped)
                 except Exception:
                     pass
+            # Re-polish (style recompute + repaint) only widgets whose
+            # status property really changes; a batch of identical states
+            # then costs nothing for the indicators already in that state.
+            if w.property("status") == state:
+                continue
+            w.setProperty("status", state)
             w.style().unpolish(w)
             w.style().polish(w)
             w.update()